@@ -10,3 +10,8 @@ CLASSES_DIR = UTILS_DIR / "Classes"
 CLASS_DIAGRAMS_DIR = UTILS_DIR / "ClassDiagrams"
 UNITTEST_DIR = PROJECT_ROOT / "UnitTest"
 UNITTEST_CLASSES_DIR = UNITTEST_DIR / "Classes"
+
+# Benchmark data
+BENCHMARKS_DIR = PROJECT_ROOT / "Benchmarks"
+MEMORY_BUDGET_FILE = BENCHMARKS_DIR / "memory_budget.json"
+IMPORT_BUDGET_FILE = BENCHMARKS_DIR / "import_budget.json"
@@ -0,0 +1,5 @@
+"""
+Equipment, circuit and study classes.
+
+Import them from the top-level package, e.g. ``from Src import Circuit``.
+"""
@@ -0,0 +1,170 @@
+from collections import deque
+
+
+class AreaPartition:
+    """
+    Partition of a Circuit's buses into areas.
+
+    The buses are split by recursive bisection of the bus-branch graph: each
+    part is ordered by breadth-first search from a pseudo-peripheral bus and
+    cut in two at the position that keeps the areas balanced. Neighbouring
+    buses therefore tend to end up in the same area, which keeps the number of
+    tie branches small.
+
+    Besides the areas themselves the partition lists the tie branches that
+    connect two areas and, per area, the boundary buses at their ends. These are
+    the interface a domain-decomposed solve couples the areas through; the
+    remaining buses of an area are interior to it.
+    """
+
+    def __init__(self, areas: list, adjacency: dict, branch_buses: dict):
+        """
+        Initialize an AreaPartition instance. Use AreaPartition.of() to partition a circuit.
+
+        Args:
+            areas: List of lists of bus names, one list per area
+            adjacency: Dictionary {bus_name: list of neighbouring bus names}
+            branch_buses: Dictionary {(collection, branch_name): (bus1_name, bus2_name)}
+        """
+        self.areas = areas
+        self.area_of = {bus: index for index, buses in enumerate(areas) for bus in buses}
+
+        self.tie_branches = []
+        boundary = [set() for _ in areas]
+        for branch, (bus1_name, bus2_name) in branch_buses.items():
+            area1 = self.area_of.get(bus1_name)
+            area2 = self.area_of.get(bus2_name)
+            if area1 != area2 and area1 is not None and area2 is not None:
+                self.tie_branches.append(branch)
+                boundary[area1].add(bus1_name)
+                boundary[area2].add(bus2_name)
+
+        # Keep the area order so the results do not depend on set ordering
+        self.boundary_buses = [[bus for bus in buses if bus in boundary[index]]
+                               for index, buses in enumerate(areas)]
+        self._adjacency = adjacency
+
+    @classmethod
+    def of(cls, circuit, num_areas: int):
+        """
+        Partition a circuit into areas of about equal size.
+
+        Args:
+            circuit: The Circuit to partition
+            num_areas: The number of areas
+
+        Returns:
+            The AreaPartition
+
+        Raises:
+            ValueError: If num_areas is less than 1 or greater than the number of buses
+        """
+        if not 1 <= num_areas <= len(circuit.buses):
+            raise ValueError(f"Number of areas must be between 1 and the number of buses "
+                             f"({len(circuit.buses)}), got {num_areas}")
+
+        adjacency = circuit.derived.get("bus_adjacency")
+        areas = _bisect(list(circuit.buses), adjacency, num_areas)
+
+        branch_buses = {}
+        for collection in ("transmission_lines", "transformers"):
+            for branch in getattr(circuit, collection).values():
+                branch_buses[(collection, branch.name)] = (branch.bus1_name, branch.bus2_name)
+        return cls(areas, adjacency, branch_buses)
+
+    def interior_buses(self, area: int):
+        """
+        Get the buses of an area that have no tie branch.
+
+        Args:
+            area: The index of the area
+
+        Returns:
+            List of bus names
+        """
+        boundary = set(self.boundary_buses[area])
+        return [bus for bus in self.areas[area] if bus not in boundary]
+
+    def neighbouring_areas(self, area: int):
+        """
+        Get the areas an area is connected to by tie branches.
+
+        Args:
+            area: The index of the area
+
+        Returns:
+            Sorted list of area indices
+        """
+        neighbours = set()
+        for bus in self.boundary_buses[area]:
+            for other in self._adjacency[bus]:
+                other_area = self.area_of.get(other)
+                if other_area is not None and other_area != area:
+                    neighbours.add(other_area)
+        return sorted(neighbours)
+
+    def __len__(self):
+        return len(self.areas)
+
+    def __repr__(self):
+        sizes = [len(buses) for buses in self.areas]
+        return f"AreaPartition(areas={len(self.areas)}, sizes={sizes}, tie_branches={len(self.tie_branches)})"
+
+
+def _bisect(buses: list, adjacency: dict, parts: int):
+    if parts == 1:
+        return [buses]
+
+    left_parts = parts // 2
+    order = _bfs_order(buses, adjacency)
+    cut = round(len(order) * left_parts / parts)
+    return _bisect(order[:cut], adjacency, left_parts) + _bisect(order[cut:], adjacency, parts - left_parts)
+
+
+def _bfs_order(buses: list, adjacency: dict):
+    # Breadth-first order of the subgraph induced by buses, one component after another
+    members = set(buses)
+    visited = set()
+    order = []
+    for start in buses:
+        if start in visited:
+            continue
+        # Two sweeps find a pseudo-peripheral bus, which gives long, narrow BFS levels
+        far = _bfs(start, adjacency, members, set())[-1]
+        order.extend(_bfs(far, adjacency, members, visited))
+    return order
+
+
+def _bfs(start: str, adjacency: dict, members: set, visited: set):
+    visited.add(start)
+    order = [start]
+    queue = deque(order)
+    while queue:
+        for neighbour in adjacency[queue.popleft()]:
+            if neighbour in members and neighbour not in visited:
+                visited.add(neighbour)
+                order.append(neighbour)
+                queue.append(neighbour)
+    return order
+
+
+if __name__ == "__main__":
+    from Src.Utils.Classes.circuit import Circuit
+
+    # Simple validation test
+    print("=== AreaPartition Class Validation ===\n")
+
+    # Two rings of four buses joined by one tie line
+    circuit1 = Circuit("Test Circuit")
+    for i in range(1, 9):
+        circuit1.add_bus(f"Bus_{i}", 230.0)
+    for i in range(1, 5):
+        circuit1.add_transmission_line(f"Line_{i}", f"Bus_{i}", f"Bus_{i % 4 + 1}", 0.01, 0.1, 0.0, 0.02)
+        circuit1.add_transmission_line(f"Line_{i + 4}", f"Bus_{i + 4}", f"Bus_{i % 4 + 5}", 0.01, 0.1, 0.0, 0.02)
+    circuit1.add_transmission_line("Tie", "Bus_3", "Bus_5", 0.01, 0.1, 0.0, 0.02)
+
+    partition = circuit1.partition(2)
+    print(partition)  # Expected output: AreaPartition(areas=2, sizes=[4, 4], tie_branches=1)
+    print(f"Areas: {partition.areas}")
+    print(f"Tie branches: {partition.tie_branches}")  # Expected output: [('transmission_lines', 'Tie')]
+    print(f"Boundary buses: {partition.boundary_buses}")
@@ -0,0 +1,231 @@
+import os
+import signal
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.circuitFile import load_circuit
+
+
+# Outcome of one case: value is the study result if ok, otherwise error describes the failure
+CaseResult = namedtuple("CaseResult", ["name", "ok", "value", "error", "seconds"])
+
+
+class BatchRunner:
+    """
+    Runs a study on many independent circuits across a pool of worker processes.
+
+    Cases are Circuit instances or paths of JSON model files (see circuitFile).
+    Circuits are sent to the workers without their journal, so a study cannot
+    undo changes made before the batch. They are sorted by size, largest first, and grouped into chunks of about
+    equal total size: large cases get a chunk of their own, while many small
+    cases share one, so that per-task overhead stays low. Chunks are handed out
+    largest first and the pool gives each idle worker the next one, which
+    balances the load.
+
+    A case whose study raises an exception (including SystemExit, e.g. from
+    sys.exit(), but not KeyboardInterrupt), or runs longer than case_timeout,
+    is reported as failed without affecting the other cases in its chunk. If a
+    chunk fails as a whole, because a worker process died or a result could
+    not be sent back, its cases are run again, each in a process of its own,
+    so only the case that caused the failure is reported as failed.
+    """
+
+    def __init__(self, study, max_workers: int = None, chunks_per_worker: int = 4, mp_context=None,
+                 case_timeout: float = None):
+        """
+        Initialize a BatchRunner instance.
+
+        Args:
+            study: Picklable callable (e.g. a module-level function) taking a
+                   Circuit and returning a compact, picklable result
+            max_workers: Number of worker processes (defaults to the CPU count)
+            chunks_per_worker: Chunks to create per worker; more chunks balance
+                               better, fewer chunks have less overhead
+            mp_context: multiprocessing context for the workers (platform default if None)
+            case_timeout: Seconds a study may run on one case before the case is
+                          failed (no limit if None). The study is interrupted by a
+                          timer signal, so this needs signal.setitimer (not on
+                          Windows) and cannot stop a study blocked in C code that
+                          never returns to Python.
+
+        Raises:
+            ValueError: If max_workers or chunks_per_worker is less than 1, case_timeout
+                        is not positive or timeouts are not supported on this platform
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 1 or chunks_per_worker < 1:
+            raise ValueError("max_workers and chunks_per_worker must be at least 1")
+        if case_timeout is not None:
+            if case_timeout <= 0:
+                raise ValueError("case_timeout must be positive")
+            if not hasattr(signal, "setitimer"):
+                raise ValueError("case_timeout needs signal.setitimer, which this platform lacks")
+
+        self.study = study
+        self.max_workers = max_workers
+        self.chunks_per_worker = chunks_per_worker
+        self.mp_context = mp_context
+        self.case_timeout = case_timeout
+
+    def run(self, cases):
+        """
+        Run the study on every case.
+
+        Args:
+            cases: Iterable of Circuit instances and/or model file paths
+
+        Returns:
+            List of CaseResult in the order of the cases
+        """
+        cases = [(index, _case_name(case), _without_history(case) if isinstance(case, Circuit) else case)
+                 for index, case in enumerate(cases)]
+        results = [None] * len(cases)
+        lost = []
+
+        with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.mp_context) as executor:
+            futures = {executor.submit(_run_chunk, self.study, chunk, self.case_timeout): chunk
+                       for chunk in self.make_chunks(cases)}
+            for future in as_completed(futures):
+                try:
+                    for index, result in future.result():
+                        results[index] = result
+                except KeyboardInterrupt:
+                    raise
+                except BaseException:
+                    # A dead worker, or a case or result that cannot be pickled
+                    lost.extend(futures[future])
+
+        if lost:
+            self._run_isolated(lost, results)
+        return results
+
+    def make_chunks(self, cases: list):
+        """
+        Group cases into chunks of about equal total size, largest cases first.
+
+        Args:
+            cases: List of (index, name, case) tuples
+
+        Returns:
+            List of chunks, each a list of (index, name, case) tuples
+        """
+        sized = sorted(((_case_size(item[2]), item) for item in cases), key=lambda pair: pair[0], reverse=True)
+        total = sum(size for size, _ in sized)
+        target = max(1, total // (self.max_workers * self.chunks_per_worker))
+
+        chunks = []
+        chunk = []
+        chunk_size = 0
+        for size, item in sized:
+            chunk.append(item)
+            chunk_size += size
+            if chunk_size >= target:
+                chunks.append(chunk)
+                chunk = []
+                chunk_size = 0
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _run_isolated(self, cases: list, results: list):
+        # One single-worker pool per case, so a crash cannot take other cases down
+        def run_one(item):
+            index, name, _ = item
+            try:
+                with ProcessPoolExecutor(max_workers=1, mp_context=self.mp_context) as executor:
+                    [(_, result)] = executor.submit(_run_chunk, self.study, [item], self.case_timeout).result()
+                results[index] = result
+            except BrokenProcessPool:
+                results[index] = CaseResult(name, False, None, "Worker process terminated", 0.0)
+            except KeyboardInterrupt:
+                raise
+            except BaseException as e:
+                results[index] = CaseResult(name, False, None, f"{type(e).__name__}: {e}", 0.0)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as threads:
+            list(threads.map(run_one, cases))
+
+
+def _case_name(case):
+    if isinstance(case, Circuit):
+        return case.name
+    return str(case)
+
+
+def _without_history(circuit):
+    # Workers never undo, and the journal can be larger than the equipment itself.
+    # The dictionaries are copied so the pool may pickle them while the caller
+    # keeps changing the circuit.
+    detached = Circuit(circuit.name)
+    with circuit.reading():
+        for collection in Circuit._COLLECTIONS:
+            setattr(detached, collection, dict(getattr(circuit, collection)))
+        detached.derived.share_from(circuit.derived)
+        detached.indexes.share_from(circuit.indexes)
+    return detached
+
+
+def _case_size(case):
+    # Number of equipment objects, or for a model file its size in bytes
+    if isinstance(case, Circuit):
+        with case.reading():
+            return sum(len(getattr(case, collection)) for collection in Circuit._COLLECTIONS)
+    return os.path.getsize(case)
+
+
+def _run_chunk(study, chunk: list, case_timeout: float = None):
+    # Runs in the main thread of a worker process, so it may use the timer signal
+    if case_timeout is not None:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+    results = []
+    for index, name, case in chunk:
+        start = time.perf_counter()
+        try:
+            if case_timeout is not None:
+                signal.setitimer(signal.ITIMER_REAL, case_timeout)
+            try:
+                circuit = case if isinstance(case, Circuit) else load_circuit(case)
+                value = study(circuit)
+            finally:
+                if case_timeout is not None:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+            results.append((index, CaseResult(name, True, value, None, time.perf_counter() - start)))
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            results.append((index, CaseResult(name, False, None, f"{type(e).__name__}: {e}",
+                                              time.perf_counter() - start)))
+    return results
+
+
+def _raise_timeout(signum, frame):
+    raise TimeoutError("Case exceeded case_timeout")
+
+
+if __name__ == "__main__":
+    def total_load_mw(circuit):
+        if any(load.mw < 0 for load in circuit.loads.values()):
+            raise ValueError(f"Circuit '{circuit.name}' has a negative load")
+        return sum(load.mw for load in circuit.loads.values())
+
+    # Simple validation test
+    print("=== BatchRunner Class Validation ===\n")
+
+    cases = []
+    for i in range(1, 7):
+        circuit = Circuit(f"Region_{i}")
+        for b in range(i * 10):
+            circuit.add_bus(f"Bus_{b}", 230.0)
+            circuit.add_load(f"Load_{b}", f"Bus_{b}", 10.0, 2.0)
+        cases.append(circuit)
+    cases[2].update("loads", "Load_0", mw=-5.0)
+
+    runner = BatchRunner(total_load_mw, max_workers=2)
+    for result in runner.run(cases):
+        print(f"{result.name}: ok={result.ok} value={result.value} error={result.error}")
+    # Expected output: Region_3 fails with "ValueError: Circuit 'Region_3' has a negative load",
+    # the others report 100.0, 200.0, ... 600.0
@@ -1,9 +1,13 @@
+import threading
+
+
 class Bus:
     """
     Represents a bus (node) in a power system network.
 
     Each bus has a unique index assigned automatically using a class-level counter.
-    A dictionary tracks all created buses by name.
+    A dictionary tracks all created buses by name. Both are updated under a lock,
+    so buses can be created from several threads.
     """
 
     # Class-level counter for unique bus indices
@@ -12,6 +16,9 @@ class Bus:
     # Dictionary to track all buses: {name: bus_index}
     _bus_registry = {}
 
+    # Guards _bus_counter and _bus_registry
+    _registry_lock = threading.Lock()
+
     def __init__(self, name: str, nominal_kv: float):
         """
         Initialize a Bus instance.
@@ -23,12 +30,18 @@ class Bus:
         self.name = name
         self.nominal_kv = nominal_kv
 
-        # Assign unique bus index and increment counter
-        self.bus_index = Bus._bus_counter
-        Bus._bus_counter += 1
+        with Bus._registry_lock:
+            # Assign unique bus index and increment counter
+            self.bus_index = Bus._bus_counter
+            Bus._bus_counter += 1
 
-        # Register this bus in the dictionary
-        Bus._bus_registry[self.name] = self.bus_index
+            # Register this bus in the dictionary
+            Bus._bus_registry[self.name] = self.bus_index
+
+    def validate(self):
+        """
+        Check the bus's model data. Any nominal voltage is valid.
+        """
 
     @classmethod
     def get_bus_index(cls, name: str):
@@ -1,8 +1,19 @@
+import copy
+import threading
+
 from Src.Utils.Classes.bus import Bus
 from Src.Utils.Classes.transformer import Transformer
 from Src.Utils.Classes.transmissionLine import TransmissionLine
 from Src.Utils.Classes.generator import Generator
 from Src.Utils.Classes.load import Load
+from Src.Utils.Classes.profiler import profiled
+from Src.Utils.Classes.cowDict import CowDict
+from Src.Utils.Classes.circuitDiff import CircuitDiff, build_element
+from Src.Utils.Classes.journal import Journal
+from Src.Utils.Classes.derivedCache import DerivedCache
+from Src.Utils.Classes.areaPartition import AreaPartition
+from Src.Utils.Classes.equipmentIndex import EquipmentIndexes
+from Src.Utils.Classes.rwLock import RWLock, read_locked, write_locked
 
 
 class Circuit:
@@ -11,8 +22,30 @@ class Circuit:
 
     The Circuit class serves as a container for all equipment objects
     (buses, transformers, transmission lines, generators, and loads).
+
+    Every mutation made through the Circuit methods is recorded in its journal,
+    which supports undo/redo and notifies subscribed observers of each change.
+    Quantities derived from the equipment are computed on demand through
+    circuit.derived and kept until an input they depend on changes, and
+    equipment can be looked up by attribute through indexes with query().
+
+    Concurrency: a Circuit may be shared between threads. Its methods that
+    change it (add_*, update, remove, edit, undo, redo and apply_patch) hold its
+    lock for writing, so writers are serialized, and its read-only queries
+    (query, diff, partition, fork, derived.get and readers such as
+    save_circuit) hold it for reading, so they run concurrently with each other
+    but never see a half-applied change. Code reading the equipment
+    dictionaries or the journal directly should do so inside
+    `with circuit.reading():`, and a sequence of changes
+    that must appear atomic, such as changing an object from edit(), inside
+    `with circuit.writing():`. To build a large model in parallel, build its
+    parts as separate circuits in separate threads, which do not block each
+    other, and merge them with apply_patch().
     """
 
+    # Names of the equipment dictionaries
+    _COLLECTIONS = ("buses", "transformers", "transmission_lines", "generators", "loads")
+
     def __init__(self, name: str):
         """
         Initialize a Circuit instance.
@@ -26,7 +59,14 @@ class Circuit:
         self.transmission_lines = {}
         self.generators = {}
         self.loads = {}
-
+        self.lock = RWLock()
+        self._fork_mutex = threading.Lock()
+        self.journal = Journal()
+        self.derived = DerivedCache(self)
+        self.indexes = EquipmentIndexes(self)
+
+    @profiled("build.add_bus")
+    @write_locked
     def add_bus(self, name: str, nominal_kv: float):
         """
         Add a bus to the circuit.
@@ -42,9 +82,13 @@ class Circuit:
             raise ValueError(f"Bus '{name}' already exists in the circuit")
 
         bus = Bus(name, nominal_kv)
-        self.buses[name] = bus
+        self._insert("buses", name, bus)
 
-    def add_transformer(self, name: str, bus1_name: str, bus2_name: str, r: float, x: float):
+    @profiled("build.add_transformer")
+    @write_locked
+    def add_transformer(self, name: str, bus1_name: str, bus2_name: str, r: float, x: float,
+                        mva_rating: float = float("inf"), tap_ratio: float = 1.0,
+                        phase_shift_deg: float = 0.0):
         """
         Add a transformer to the circuit.
 
@@ -54,18 +98,26 @@ class Circuit:
             bus2_name: Name of the second bus
             r: Resistance in per-unit or ohms
             x: Reactance in per-unit or ohms
+            mva_rating: Thermal rating in MVA, unlimited by default
+            tap_ratio: Off-nominal tap ratio in per-unit on the bus1 side
+            phase_shift_deg: Phase shift angle in degrees
 
         Raises:
-            ValueError: If a transformer with the same name already exists
+            ValueError: If a transformer with the same name already exists or the
+                        rating or tap ratio is not positive
         """
         if name in self.transformers:
             raise ValueError(f"Transformer '{name}' already exists in the circuit")
 
-        transformer = Transformer(name, bus1_name, bus2_name, r, x)
-        self.transformers[name] = transformer
+        transformer = Transformer(name, bus1_name, bus2_name, r, x, mva_rating,
+                                  tap_ratio, phase_shift_deg)
+        self._insert("transformers", name, transformer)
 
+    @profiled("build.add_transmission_line")
+    @write_locked
     def add_transmission_line(self, name: str, bus1_name: str, bus2_name: str,
-                             r: float, x: float, g: float, b: float):
+                             r: float, x: float, g: float, b: float,
+                             mva_rating: float = float("inf")):
         """
         Add a transmission line to the circuit.
 
@@ -77,17 +129,24 @@ class Circuit:
             x: Series reactance in per-unit or ohms
             g: Shunt conductance in per-unit or siemens
             b: Shunt susceptance in per-unit or siemens
+            mva_rating: Thermal rating in MVA, unlimited by default
 
         Raises:
-            ValueError: If a transmission line with the same name already exists
+            ValueError: If a transmission line with the same name already exists or
+                        the rating is not positive
         """
         if name in self.transmission_lines:
             raise ValueError(f"Transmission line '{name}' already exists in the circuit")
 
-        line = TransmissionLine(name, bus1_name, bus2_name, r, x, g, b)
-        self.transmission_lines[name] = line
+        line = TransmissionLine(name, bus1_name, bus2_name, r, x, g, b, mva_rating)
+        self._insert("transmission_lines", name, line)
 
-    def add_generator(self, name: str, bus1_name: str, voltage_setpoint: float, mw_setpoint: float):
+    @profiled("build.add_generator")
+    @write_locked
+    def add_generator(self, name: str, bus1_name: str, voltage_setpoint: float, mw_setpoint: float,
+                      mvar_min: float = float("-inf"), mvar_max: float = float("inf"),
+                      x_subtransient: float = None, mw_min: float = float("-inf"),
+                      mw_max: float = float("inf"), cost_coefficients: tuple = (0.0, 0.0, 0.0)):
         """
         Add a generator to the circuit.
 
@@ -96,16 +155,27 @@ class Circuit:
             bus1_name: Name of the bus where the generator is connected
             voltage_setpoint: Voltage magnitude setpoint in per-unit
             mw_setpoint: Active power generation setpoint in megawatts (MW)
+            mvar_min: Minimum reactive power output in megavars (MVAR), unlimited by default
+            mvar_max: Maximum reactive power output in megavars (MVAR), unlimited by default
+            x_subtransient: Subtransient source reactance in per-unit, or None
+            mw_min: Minimum active power output in megawatts (MW), unlimited by default
+            mw_max: Maximum active power output in megawatts (MW), unlimited by default
+            cost_coefficients: Cost curve coefficients (c0, c1, c2, ...) in $/h
 
         Raises:
-            ValueError: If a generator with the same name already exists
+            ValueError: If a generator with the same name already exists or the
+                        generator parameters are invalid
         """
         if name in self.generators:
             raise ValueError(f"Generator '{name}' already exists in the circuit")
 
-        generator = Generator(name, bus1_name, voltage_setpoint, mw_setpoint)
-        self.generators[name] = generator
+        generator = Generator(name, bus1_name, voltage_setpoint, mw_setpoint,
+                              mvar_min, mvar_max, x_subtransient,
+                              mw_min, mw_max, cost_coefficients)
+        self._insert("generators", name, generator)
 
+    @profiled("build.add_load")
+    @write_locked
     def add_load(self, name: str, bus1_name: str, mw: float, mvar: float):
         """
         Add a load to the circuit.
@@ -123,7 +193,318 @@ class Circuit:
             raise ValueError(f"Load '{name}' already exists in the circuit")
 
         load = Load(name, bus1_name, mw, mvar)
-        self.loads[name] = load
+        self._insert("loads", name, load)
+
+    @read_locked
+    def fork(self, name: str = None):
+        """
+        Create a copy-on-write scenario copy of the circuit.
+
+        The fork shares every equipment object with this circuit. Equipment added
+        to either circuit afterwards is only visible in that circuit, and objects
+        to be modified must be taken with edit(), which copies them on first use.
+        Both circuits' equipment dictionaries become CowDict layers over the
+        shared, now read-only, equipment.
+
+        Only the read lock is taken, so a reader, e.g. a study, can fork the
+        circuit for a what-if scenario: swapping in the layers does not change
+        what this circuit contains.
+
+        Args:
+            name: The name of the fork (defaults to this circuit's name)
+
+        Returns:
+            The new Circuit
+        """
+        child = Circuit(self.name if name is None else name)
+        # Writers are excluded by the read lock; concurrent forks by the mutex
+        with self._fork_mutex:
+            for collection in Circuit._COLLECTIONS:
+                kept, forked = CowDict.split(getattr(self, collection))
+                setattr(self, collection, kept)
+                setattr(child, collection, forked)
+        child.derived.share_from(self.derived)
+        child.indexes.share_from(self.indexes)
+        return child
+
+    @write_locked
+    def edit(self, collection: str, name: str):
+        """
+        Get an equipment object that is safe to modify in this circuit.
+
+        In a forked circuit the object is copied the first time it is edited, so
+        the change does not leak into circuits it is shared with. Changes made
+        directly on the returned object are not journaled; use update() for that.
+
+        Args:
+            collection: The equipment dictionary, e.g. "loads" or "generators"
+            name: The name of the equipment
+
+        Returns:
+            The equipment object owned by this circuit
+
+        Raises:
+            ValueError: If the collection or the equipment does not exist
+        """
+        equipment = self._lookup(collection, name)
+        obj = equipment[name]
+        if isinstance(equipment, CowDict) and not equipment.owns(name):
+            obj = copy.copy(obj)
+            equipment[name] = obj
+        return obj
+
+    @write_locked
+    def remove(self, collection: str, name: str):
+        """
+        Remove an equipment object from the circuit.
+
+        Args:
+            collection: The equipment dictionary, e.g. "loads" or "generators"
+            name: The name of the equipment
+
+        Raises:
+            ValueError: If the collection or the equipment does not exist
+        """
+        self._lookup(collection, name)
+        self._delete(collection, name)
+
+    @write_locked
+    def update(self, collection: str, name: str, /, **attributes):
+        """
+        Change attributes of an equipment object and record the change.
+
+        The changed object is checked like a new one (see the equipment classes'
+        validate()), and values are normalized the same way.
+
+        Args:
+            collection: The equipment dictionary, e.g. "loads" or "generators"
+            name: The name of the equipment
+            **attributes: The attributes to change and their new values
+
+        Raises:
+            ValueError: If the collection or the equipment does not exist, an
+                        attribute does not exist or cannot be changed, or the new
+                        values are invalid
+        """
+        obj = self._lookup(collection, name)[name]
+        after = self._validated(collection, name, attributes)
+        before = {key: getattr(obj, key) for key in attributes}
+        self._set_attributes(collection, name, before, after)
+
+    @write_locked
+    def undo(self):
+        """
+        Revert the most recent mutation (or patch) recorded in the journal.
+
+        Raises:
+            ValueError: If there is nothing to undo
+        """
+        entries = self.journal.pop_undo()
+        with self.journal.replaying():
+            for entry in reversed(entries):
+                self._replay(entry, inverse=True)
+
+    @write_locked
+    def redo(self):
+        """
+        Re-apply the most recently undone mutation (or patch).
+
+        Raises:
+            ValueError: If there is nothing to redo
+        """
+        entries = self.journal.pop_redo()
+        with self.journal.replaying():
+            for entry in entries:
+                self._replay(entry, inverse=False)
+
+    def reading(self):
+        """
+        Hold the circuit's lock for reading, e.g. `with circuit.reading():`.
+
+        Returns:
+            A context manager
+        """
+        return self.lock.read()
+
+    def writing(self):
+        """
+        Hold the circuit's lock for writing, e.g. `with circuit.writing():`.
+
+        Returns:
+            A context manager
+        """
+        return self.lock.write()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_fork_mutex"]
+        return state
+
+    def __setstate__(self, state):
+        # The journal does not pickle its observers; reconnect the derived data
+        self.__dict__.update(state)
+        self._fork_mutex = threading.Lock()
+        self.journal.subscribe(self.derived._on_change)
+        self.journal.subscribe(self.indexes._on_change)
+
+    def _lookup(self, collection: str, name: str):
+        if collection not in Circuit._COLLECTIONS:
+            raise ValueError(f"Unknown equipment collection '{collection}'")
+
+        equipment = getattr(self, collection)
+        if name not in equipment:
+            raise ValueError(f"'{name}' does not exist in {collection}")
+        return equipment
+
+    def _insert(self, collection: str, name: str, obj):
+        getattr(self, collection)[name] = obj
+        self.journal.record("add", collection, name, None, obj)
+
+    def _delete(self, collection: str, name: str):
+        equipment = getattr(self, collection)
+        obj = equipment[name]
+        del equipment[name]
+        self.journal.record("remove", collection, name, obj, None)
+
+    def _validated(self, collection: str, name: str, attributes: dict):
+        # Apply the attributes to a copy and validate it, so the object itself is
+        # untouched if they are invalid; returns the values as normalized
+        obj = getattr(self, collection)[name]
+        for key in attributes:
+            if key in ("name", "bus_index") or not hasattr(obj, key):
+                raise ValueError(f"Attribute '{key}' of '{name}' in {collection} cannot be updated")
+
+        candidate = copy.copy(obj)
+        for key, value in attributes.items():
+            setattr(candidate, key, value)
+        candidate.validate()
+        return {key: getattr(candidate, key) for key in attributes}
+
+    def _set_attributes(self, collection: str, name: str, before: dict, after: dict):
+        obj = self.edit(collection, name)
+        for key, value in after.items():
+            setattr(obj, key, value)
+        self.journal.record("update", collection, name, before, dict(after))
+
+    def _replay(self, entry, inverse: bool):
+        if entry.action == "update":
+            if inverse:
+                self._set_attributes(entry.collection, entry.name, entry.after, entry.before)
+            else:
+                self._set_attributes(entry.collection, entry.name, entry.before, entry.after)
+        elif (entry.action == "add") != inverse:
+            # A forward add or an undone remove puts the recorded object back
+            self._insert(entry.collection, entry.name, entry.after if not inverse else entry.before)
+        else:
+            self._delete(entry.collection, entry.name)
+
+    def _rollback(self, start: int):
+        # Revert the entries recorded since start and drop them from the journal
+        with self.journal.replaying():
+            for entry in reversed(self.journal.entries[start:]):
+                self._replay(entry, inverse=True)
+        self.journal.truncate(start)
+
+    def diff(self, other):
+        """
+        Compute the changes that turn this circuit into another one.
+
+        Args:
+            other: The Circuit to compare against
+
+        Returns:
+            A CircuitDiff of added, removed and changed equipment
+        """
+        # Lock both circuits in a fixed order so two opposite diffs cannot deadlock
+        first, second = sorted((self, other), key=id)
+        with first.lock.read(), second.lock.read():
+            return CircuitDiff.between(self, other)
+
+    @read_locked
+    def query(self, collection: str, attribute: str, op: str, value):
+        """
+        Find equipment by comparing an attribute with a value, using an index.
+
+        Args:
+            collection: The equipment dictionary, e.g. "buses" or "loads"
+            attribute: The attribute, or a computed key such as "x_over_r" for branches
+            op: One of "==", "!=", "<", "<=", ">", ">="
+            value: The value to compare with
+
+        Returns:
+            List of equipment names, ordered by the attribute value
+
+        Raises:
+            ValueError: If the collection, the attribute or the operator is unknown
+        """
+        return self.indexes.query(collection, attribute, op, value)
+
+    @read_locked
+    def partition(self, num_areas: int):
+        """
+        Partition the buses into areas of about equal size along the branch graph.
+
+        Args:
+            num_areas: The number of areas
+
+        Returns:
+            An AreaPartition with the areas, tie branches and boundary buses
+
+        Raises:
+            ValueError: If num_areas is less than 1 or greater than the number of buses
+        """
+        return AreaPartition.of(self, num_areas)
+
+    @write_locked
+    def apply_patch(self, diff):
+        """
+        Apply a CircuitDiff to this circuit in place.
+
+        Only the equipment named in the diff is touched. All removed and changed
+        equipment must exist and no added equipment may exist, all added
+        equipment is built and all changes are validated like update(); this is
+        done before anything is modified. If the patch still fails, the changes
+        already made are reverted. The whole patch is one undo step.
+
+        Args:
+            diff: The CircuitDiff to apply
+
+        Raises:
+            ValueError: If the diff does not fit this circuit, changes an attribute
+                        that does not exist or cannot be changed, or contains
+                        invalid equipment data
+        """
+        added = {}
+        changed = {}
+        for collection in Circuit._COLLECTIONS:
+            equipment = getattr(self, collection)
+            for name in list(diff.removed[collection]) + list(diff.changed[collection]):
+                if name not in equipment:
+                    raise ValueError(f"Cannot patch: '{name}' does not exist in {collection}")
+            for name in diff.added[collection]:
+                if name in equipment and name not in diff.removed[collection]:
+                    raise ValueError(f"Cannot patch: '{name}' already exists in {collection}")
+            added[collection] = {name: build_element(collection, record)
+                                 for name, record in diff.added[collection].items()}
+            changed[collection] = {name: self._validated(collection, name, attributes)
+                                   for name, attributes in diff.changed[collection].items()}
+
+        with self.journal.transaction():
+            start = len(self.journal)
+            try:
+                for collection in Circuit._COLLECTIONS:
+                    equipment = getattr(self, collection)
+                    for name in diff.removed[collection]:
+                        self._delete(collection, name)
+                    for name, obj in added[collection].items():
+                        self._insert(collection, name, obj)
+                    for name, attributes in changed[collection].items():
+                        obj = equipment[name]
+                        before = {key: getattr(obj, key) for key in attributes}
+                        self._set_attributes(collection, name, before, attributes)
+            except BaseException:
+                self._rollback(start)
+                raise
 
 
 if __name__ == "__main__":
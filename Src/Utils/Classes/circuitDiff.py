@@ -0,0 +1,159 @@
+from Src.Utils.Classes.bus import Bus
+from Src.Utils.Classes.transformer import Transformer
+from Src.Utils.Classes.transmissionLine import TransmissionLine
+from Src.Utils.Classes.generator import Generator
+from Src.Utils.Classes.load import Load
+
+
+# Equipment class stored in each Circuit dictionary
+EQUIPMENT_CLASSES = {
+    "buses": Bus,
+    "transformers": Transformer,
+    "transmission_lines": TransmissionLine,
+    "generators": Generator,
+    "loads": Load,
+}
+
+# Attributes assigned by the simulator rather than taken from the model data
+_DERIVED_ATTRIBUTES = {"bus_index"}
+
+
+def element_record(obj):
+    """
+    Get the model data of an equipment object.
+
+    Args:
+        obj: A Bus, Transformer, TransmissionLine, Generator or Load
+
+    Returns:
+        Dictionary {attribute: value} without simulator-assigned attributes
+    """
+    return {key: value for key, value in vars(obj).items() if key not in _DERIVED_ATTRIBUTES}
+
+
+def build_element(collection: str, record: dict):
+    """
+    Create an equipment object from its model data.
+
+    The constructor is called with the arguments it accepts, so the usual
+    validation and normalization apply, and any remaining attributes are set
+    afterwards.
+
+    Args:
+        collection: The Circuit dictionary the object belongs in, e.g. "loads"
+        record: Dictionary {attribute: value} as returned by element_record()
+
+    Returns:
+        The new equipment object
+    """
+    # inspect is slow to import and only needed when patches are applied
+    import inspect
+
+    cls = EQUIPMENT_CLASSES[collection]
+    parameters = inspect.signature(cls.__init__).parameters
+    obj = cls(**{key: value for key, value in record.items() if key in parameters})
+    for key, value in record.items():
+        if key not in parameters:
+            setattr(obj, key, value)
+    return obj
+
+
+class CircuitDiff:
+    """
+    Structured difference between two circuits.
+
+    For each equipment dictionary the diff lists the elements that were added
+    (with their full model data), removed (by name) and changed (only the
+    attributes whose values differ). It can be applied as a patch to any circuit
+    that has the same removed and changed elements, see Circuit.apply_patch().
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty CircuitDiff instance.
+        """
+        self.added = {collection: {} for collection in EQUIPMENT_CLASSES}
+        self.removed = {collection: [] for collection in EQUIPMENT_CLASSES}
+        self.changed = {collection: {} for collection in EQUIPMENT_CLASSES}
+
+    @classmethod
+    def between(cls, old, new):
+        """
+        Compute the diff that turns one circuit into another.
+
+        Elements are matched by name and matched elements are compared by their
+        model data. Objects shared by both circuits, as after Circuit.fork(), are
+        skipped without comparing.
+
+        Args:
+            old: The Circuit to diff from
+            new: The Circuit to diff to
+
+        Returns:
+            The CircuitDiff
+        """
+        diff = cls()
+        for collection in EQUIPMENT_CLASSES:
+            old_elements = getattr(old, collection)
+            new_elements = getattr(new, collection)
+
+            for name, obj in new_elements.items():
+                previous = old_elements.get(name)
+                if previous is None:
+                    diff.added[collection][name] = element_record(obj)
+                elif previous is not obj:
+                    old_record = element_record(previous)
+                    new_record = element_record(obj)
+                    if old_record != new_record:
+                        diff.changed[collection][name] = {
+                            key: value for key, value in new_record.items()
+                            if old_record.get(key) != value
+                        }
+
+            diff.removed[collection] = [name for name in old_elements if name not in new_elements]
+        return diff
+
+    def is_empty(self):
+        """
+        Returns:
+            True if the diff contains no changes
+        """
+        return len(self) == 0
+
+    def __len__(self):
+        return sum(len(self.added[c]) + len(self.removed[c]) + len(self.changed[c])
+                   for c in EQUIPMENT_CLASSES)
+
+    def __repr__(self):
+        added = sum(len(v) for v in self.added.values())
+        removed = sum(len(v) for v in self.removed.values())
+        changed = sum(len(v) for v in self.changed.values())
+        return f"CircuitDiff(added={added}, removed={removed}, changed={changed})"
+
+
+if __name__ == "__main__":
+    from Src.Utils.Classes.circuit import Circuit
+
+    # Simple validation test
+    print("=== CircuitDiff Class Validation ===\n")
+
+    base = Circuit("Base")
+    base.add_bus("Bus_1", 20.0)
+    base.add_bus("Bus_2", 230.0)
+    base.add_load("Load_1", "Bus_2", 50.0, 30.0)
+    base.add_generator("G1", "Bus_1", 1.04, 100.0)
+
+    # Upstream version: one load changed, one generator removed, one line added
+    upstream = base.fork("Upstream")
+    upstream.edit("loads", "Load_1").mw = 55.0
+    upstream.remove("generators", "G1")
+    upstream.add_transmission_line("Line_1", "Bus_1", "Bus_2", 0.02, 0.25, 0.0, 0.04)
+
+    diff = base.diff(upstream)
+    print(diff)  # Expected output: CircuitDiff(added=1, removed=1, changed=1)
+    print(f"Changed loads: {diff.changed['loads']}")  # Expected output: {'Load_1': {'mw': 55.0}}
+
+    # Apply the same change set to a local copy of the base model
+    local = base.fork("Local")
+    local.apply_patch(diff)
+    print(f"Local after patch is identical to upstream: {local.diff(upstream).is_empty()}")
@@ -0,0 +1,118 @@
+import json
+import math
+
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.circuitDiff import CircuitDiff, element_record
+
+
+# Format tag and version written to every model file
+FILE_FORMAT = "circuit"
+FILE_VERSION = 2
+
+# Versions load_circuit() reads; version 1 wrote non-finite values as bare Infinity/NaN
+_READABLE_VERSIONS = (1, FILE_VERSION)
+
+# Key of the object standing for a non-finite float, e.g. {"float": "inf"}
+_NON_FINITE_KEY = "float"
+
+
+def save_circuit(circuit, path):
+    """
+    Write a circuit's model data to a JSON model file.
+
+    The file is strict JSON: non-finite values, such as the default unlimited
+    ratings, are written as {"float": "inf"}, {"float": "-inf"} or {"float": "nan"}.
+
+    Args:
+        circuit: The Circuit to save
+        path: The file to write (overwritten if it exists)
+    """
+    with circuit.reading():
+        data = {
+            "format": FILE_FORMAT,
+            "version": FILE_VERSION,
+            "name": circuit.name,
+            "equipment": {collection: [_encode_record(element_record(obj))
+                                       for obj in getattr(circuit, collection).values()]
+                          for collection in Circuit._COLLECTIONS},
+        }
+    with open(path, "w") as f:
+        json.dump(data, f, allow_nan=False)
+
+
+def load_circuit(path):
+    """
+    Read a circuit from a JSON model file written by save_circuit().
+
+    The loaded circuit starts with an empty journal.
+
+    Args:
+        path: The file to read
+
+    Returns:
+        The Circuit
+
+    Raises:
+        ValueError: If the file is not a model file of a supported version
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("format") != FILE_FORMAT or data.get("version") not in _READABLE_VERSIONS:
+        raise ValueError(f"'{path}' is not a circuit model file of version {_READABLE_VERSIONS}")
+
+    circuit = Circuit(data["name"])
+    diff = CircuitDiff()
+    for collection, records in data["equipment"].items():
+        if collection not in Circuit._COLLECTIONS:
+            raise ValueError(f"'{path}' contains unknown equipment collection '{collection}'")
+        diff.added[collection] = {record["name"]: _decode_record(record) for record in records}
+    circuit.apply_patch(diff)
+    circuit.journal.clear()
+    return circuit
+
+
+def _encode_record(record: dict):
+    return {key: _encode_value(value) for key, value in record.items()}
+
+
+def _encode_value(value):
+    if isinstance(value, float) and not math.isfinite(value):
+        return {_NON_FINITE_KEY: str(value)}
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(item) for item in value]
+    return value
+
+
+def _decode_record(record: dict):
+    return {key: _decode_value(value) for key, value in record.items()}
+
+
+def _decode_value(value):
+    if isinstance(value, dict) and value.keys() == {_NON_FINITE_KEY}:
+        return float(value[_NON_FINITE_KEY])
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    return value
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    # Simple validation test
+    print("=== Circuit Model File Validation ===\n")
+
+    circuit1 = Circuit("Test Circuit")
+    circuit1.add_bus("Bus_1", 20.0)
+    circuit1.add_bus("Bus_2", 230.0)
+    circuit1.add_transformer("T1", "Bus_1", "Bus_2", 0.01, 0.10, tap_ratio=1.025)
+    circuit1.add_generator("G1", "Bus_1", 1.04, 100.0, cost_coefficients=(100.0, 20.0, 0.01))
+    circuit1.add_load("Load_1", "Bus_2", 50.0, 30.0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "test_circuit.json"
+        save_circuit(circuit1, path)
+        loaded = load_circuit(path)
+
+    print(f"Loaded: {loaded.name}, {len(loaded.buses)} buses")  # Expected output: Test Circuit, 2 buses
+    print(f"Identical to saved circuit: {circuit1.diff(loaded).is_empty()}")  # Expected output: True
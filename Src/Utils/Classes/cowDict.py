@@ -0,0 +1,126 @@
+from collections.abc import MutableMapping
+
+
+# Layers a CowDict may stack before split() flattens it into a new base dict
+MAX_DEPTH = 8
+
+
+class CowDict(MutableMapping):
+    """
+    Copy-on-write dictionary layered on top of a shared parent mapping.
+
+    Reads fall through to the parent unless the key was written or removed in
+    this layer. Writes and removals only touch this layer, so any number of
+    CowDicts can share one parent without copying it. The parent must not be
+    modified once it is shared; use CowDict.split() to fork an existing mapping.
+    """
+
+    __slots__ = ("_parent", "_local", "_removed", "_len", "_depth")
+
+    def __init__(self, parent=None):
+        """
+        Initialize a CowDict instance.
+
+        Args:
+            parent: The shared mapping to read through to (a dict or another CowDict)
+        """
+        self._parent = parent if parent is not None else {}
+        self._local = {}
+        self._removed = set()
+        self._len = len(self._parent)
+        self._depth = self._parent._depth + 1 if isinstance(self._parent, CowDict) else 1
+
+    @classmethod
+    def split(cls, mapping):
+        """
+        Fork a mapping into two independent copy-on-write layers.
+
+        The mapping becomes the shared parent of both layers and must not be
+        modified afterwards. A CowDict with no changes of its own is not stacked
+        again; its parent is shared directly so repeated forks stay shallow. A
+        modified CowDict already MAX_DEPTH layers deep is flattened into a new
+        dict first, so lookups never walk more than MAX_DEPTH layers.
+
+        Args:
+            mapping: The dict or CowDict to fork
+
+        Returns:
+            Tuple (layer to keep in place of mapping, layer for the fork)
+        """
+        if isinstance(mapping, CowDict) and not mapping._local and not mapping._removed:
+            return mapping, cls(mapping._parent)
+        if isinstance(mapping, CowDict) and mapping._depth >= MAX_DEPTH:
+            mapping = dict(mapping.items())
+        return cls(mapping), cls(mapping)
+
+    def owns(self, key):
+        """
+        Check whether this layer holds its own value for a key.
+
+        Args:
+            key: The key to check
+
+        Returns:
+            True if the value for key was written in this layer
+        """
+        return key in self._local
+
+    def __getitem__(self, key):
+        try:
+            return self._local[key]
+        except KeyError:
+            pass
+        if key in self._removed:
+            raise KeyError(key)
+        return self._parent[key]
+
+    def __contains__(self, key):
+        if key in self._local:
+            return True
+        return key not in self._removed and key in self._parent
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._len += 1
+        self._local[key] = value
+        self._removed.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._local.pop(key, None)
+        if key in self._parent:
+            self._removed.add(key)
+        self._len -= 1
+
+    def __iter__(self):
+        # Parent order first, then keys that only exist in this layer
+        for key in self._parent:
+            if key not in self._removed:
+                yield key
+        for key in self._local:
+            if key not in self._parent:
+                yield key
+
+    def __len__(self):
+        return self._len
+
+    def __repr__(self):
+        return f"CowDict({dict(self.items())})"
+
+
+if __name__ == "__main__":
+    # Simple validation test
+    print("=== CowDict Class Validation ===\n")
+
+    base = {"a": 1, "b": 2}
+    keep, fork = CowDict.split(base)
+
+    # Writes in one layer are invisible to the other
+    fork["b"] = 20
+    fork["c"] = 3
+    del fork["a"]
+    print(f"Kept layer: {keep}")  # Expected output: CowDict({'a': 1, 'b': 2})
+    print(f"Forked layer: {fork}")  # Expected output: CowDict({'b': 20, 'c': 3})
+    print(f"Shared base: {base}")  # Expected output: {'a': 1, 'b': 2}
+    print(f"Fork owns 'b': {fork.owns('b')}, owns 'a': {fork.owns('a')}")
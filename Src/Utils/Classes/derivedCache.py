@@ -0,0 +1,240 @@
+import cmath
+import math
+
+from Src.Utils.Classes.profiler import Profiler
+
+
+class DerivedCache:
+    """
+    Lazily computed, memoized quantities derived from a Circuit's equipment.
+
+    Each derived quantity is registered with a compute function and the inputs
+    it depends on. It is computed on first use and kept until one of those
+    inputs changes, which the cache learns from the circuit's journal. An input
+    is either a whole equipment dictionary ("loads") or one attribute of it
+    ("loads.mw"); adding or removing equipment invalidates every quantity that
+    depends on its dictionary, while an update only invalidates quantities that
+    depend on an updated attribute. So changing a load's MW keeps everything
+    that depends only on branch impedances.
+
+    Changes made directly on objects returned by Circuit.edit() are not
+    journaled; call invalidate() after making them. Cached values are shared
+    with forks of the circuit and must be treated as read-only.
+    """
+
+    def __init__(self, circuit):
+        """
+        Initialize a DerivedCache instance for a circuit with the built-in quantities.
+
+        Args:
+            circuit: The Circuit the quantities are derived from
+        """
+        self._circuit = circuit
+        self._compute = {}
+        self._values = {}
+
+        # Dictionary {collection: {attribute or None: set of quantity names}}
+        self._dependents = {}
+
+        for name, compute, depends_on in _BUILT_IN:
+            self.register(name, compute, depends_on)
+        circuit.journal.subscribe(self._on_change)
+
+    def register(self, name: str, compute, depends_on):
+        """
+        Register a derived quantity.
+
+        Args:
+            name: The name of the quantity
+            compute: Callable taking the Circuit and returning the value
+            depends_on: Iterable of inputs, each "collection" or "collection.attribute"
+
+        Raises:
+            ValueError: If a quantity with the same name is already registered
+                        or an input names an unknown collection
+        """
+        if name in self._compute:
+            raise ValueError(f"Derived quantity '{name}' is already registered")
+
+        dependencies = []
+        for dependency in depends_on:
+            collection, _, attribute = dependency.partition(".")
+            if collection not in type(self._circuit)._COLLECTIONS:
+                raise ValueError(f"Derived quantity '{name}' depends on unknown collection '{collection}'")
+            dependencies.append((collection, attribute or None))
+
+        self._compute[name] = compute
+        for collection, attribute in dependencies:
+            self._dependents.setdefault(collection, {}).setdefault(attribute, set()).add(name)
+
+    def get(self, name: str):
+        """
+        Get a derived quantity, computing it if it is not cached.
+
+        Args:
+            name: The name of the quantity
+
+        Returns:
+            The value of the quantity
+
+        Raises:
+            ValueError: If the quantity is not registered
+        """
+        if name in self._values:
+            return self._values[name]
+        if name not in self._compute:
+            raise ValueError(f"Unknown derived quantity '{name}'")
+
+        # Concurrent readers may each compute the value; the last one is kept
+        with self._circuit.reading():
+            with Profiler.phase(f"derived.{name}"):
+                value = self._compute[name](self._circuit)
+            self._values[name] = value
+        return value
+
+    def is_cached(self, name: str):
+        """
+        Args:
+            name: The name of the quantity
+
+        Returns:
+            True if the quantity is computed and still valid
+        """
+        return name in self._values
+
+    def invalidate(self, name: str = None):
+        """
+        Drop a cached quantity, or every cached quantity.
+
+        Args:
+            name: The name of the quantity, or None for all quantities
+        """
+        if name is None:
+            self._values.clear()
+        else:
+            self._values.pop(name, None)
+
+    def share_from(self, other):
+        """
+        Take over the registrations and cached values of another cache.
+
+        Used by Circuit.fork(): the fork starts with identical equipment, so the
+        parent's cached values are valid for it until either circuit changes.
+
+        Args:
+            other: The DerivedCache of the parent circuit
+        """
+        self._compute = dict(other._compute)
+        self._values = dict(other._values)
+        self._dependents = {collection: {attribute: set(names) for attribute, names in by_attribute.items()}
+                            for collection, by_attribute in other._dependents.items()}
+
+    def _on_change(self, entry):
+        if not self._values:
+            return
+        by_attribute = self._dependents.get(entry.collection)
+        if not by_attribute:
+            return
+
+        stale = set(by_attribute.get(None, ()))
+        if entry.action == "update":
+            for attribute in entry.after:
+                stale.update(by_attribute.get(attribute, ()))
+        else:
+            for names in by_attribute.values():
+                stale.update(names)
+        for name in stale:
+            self._values.pop(name, None)
+
+    def __getstate__(self):
+        # Cached values can be recomputed; do not pickle them
+        state = self.__dict__.copy()
+        state["_values"] = {}
+        return state
+
+
+def _bus_order(circuit):
+    return {name: index for index, name in enumerate(circuit.buses)}
+
+
+def _bus_adjacency(circuit):
+    # {bus name: list of buses connected to it by a line or transformer}, in insertion order
+    adjacency = {name: [] for name in circuit.buses}
+    for branches in (circuit.transmission_lines, circuit.transformers):
+        for branch in branches.values():
+            neighbours1 = adjacency.setdefault(branch.bus1_name, [])
+            neighbours2 = adjacency.setdefault(branch.bus2_name, [])
+            if branch.bus2_name not in neighbours1 and branch.bus1_name != branch.bus2_name:
+                neighbours1.append(branch.bus2_name)
+                neighbours2.append(branch.bus1_name)
+    return adjacency
+
+
+def _branch_admittances(circuit):
+    # {branch name: (bus1_name, bus2_name, series admittance, total shunt admittance, complex tap ratio)}
+    admittances = {}
+    for line in circuit.transmission_lines.values():
+        admittances[line.name] = (line.bus1_name, line.bus2_name, _series_admittance(line),
+                                  complex(line.g, line.b), 1 + 0j)
+    for transformer in circuit.transformers.values():
+        ratio = cmath.rect(transformer.tap_ratio, math.radians(transformer.phase_shift_deg))
+        admittances[transformer.name] = (transformer.bus1_name, transformer.bus2_name,
+                                         _series_admittance(transformer), 0j, ratio)
+    return admittances
+
+
+def _series_admittance(branch):
+    if branch.r == 0 and branch.x == 0:
+        raise ValueError(f"Branch '{branch.name}' has zero series impedance")
+    return 1 / complex(branch.r, branch.x)
+
+
+def _bus_injections(circuit):
+    # Scheduled net injection per bus as complex MW + jMvar (generators add MW, loads draw MW and Mvar)
+    injections = {name: 0j for name in circuit.buses}
+    for generator in circuit.generators.values():
+        injections[generator.bus1_name] = injections.get(generator.bus1_name, 0j) + generator.mw_setpoint
+    for load in circuit.loads.values():
+        injections[load.bus1_name] = injections.get(load.bus1_name, 0j) - complex(load.mw, load.mvar)
+    return injections
+
+
+# Quantities every circuit provides: (name, compute, depends_on)
+_BUILT_IN = (
+    ("bus_order", _bus_order, ("buses.name",)),
+    ("bus_adjacency", _bus_adjacency,
+     ("buses.name", "transmission_lines.bus1_name", "transmission_lines.bus2_name",
+      "transformers.bus1_name", "transformers.bus2_name")),
+    ("branch_admittances", _branch_admittances,
+     ("transmission_lines.bus1_name", "transmission_lines.bus2_name", "transmission_lines.r",
+      "transmission_lines.x", "transmission_lines.g", "transmission_lines.b",
+      "transformers.bus1_name", "transformers.bus2_name", "transformers.r", "transformers.x",
+      "transformers.tap_ratio", "transformers.phase_shift_deg")),
+    ("bus_injections", _bus_injections,
+     ("buses.name", "generators.bus1_name", "generators.mw_setpoint",
+      "loads.bus1_name", "loads.mw", "loads.mvar")),
+)
+
+
+if __name__ == "__main__":
+    from Src.Utils.Classes.circuit import Circuit
+
+    # Simple validation test
+    print("=== DerivedCache Class Validation ===\n")
+
+    circuit1 = Circuit("Test Circuit")
+    circuit1.add_bus("Bus_1", 20.0)
+    circuit1.add_bus("Bus_2", 230.0)
+    circuit1.add_transmission_line("Line_1", "Bus_1", "Bus_2", 0.02, 0.25, 0.0, 0.04)
+    circuit1.add_generator("G1", "Bus_1", 1.04, 100.0)
+    circuit1.add_load("Load_1", "Bus_2", 50.0, 30.0)
+
+    print(f"Bus order: {circuit1.derived.get('bus_order')}")  # Expected output: {'Bus_1': 0, 'Bus_2': 1}
+    print(f"Injections: {circuit1.derived.get('bus_injections')}")
+    circuit1.derived.get("branch_admittances")
+
+    # Changing a load only invalidates what depends on loads
+    circuit1.update("loads", "Load_1", mw=60.0)
+    print(f"Injections cached: {circuit1.derived.is_cached('bus_injections')}")  # Expected output: False
+    print(f"Admittances cached: {circuit1.derived.is_cached('branch_admittances')}")  # Expected output: True
+    print(f"Injections: {circuit1.derived.get('bus_injections')}")  # Expected output: Bus_2 = (-60-30j)
@@ -0,0 +1,264 @@
+import math
+from bisect import bisect_left, bisect_right, insort
+from functools import partial
+from operator import itemgetter
+
+
+# Comparison operators accepted by queries
+OPERATORS = ("==", "!=", "<", "<=", ">", ">=")
+
+_value_of_entry = itemgetter(0)
+
+
+class EquipmentIndex:
+    """
+    Sorted index of one equipment dictionary by one key.
+
+    The key is an attribute, or a value computed from several attributes such
+    as a line's X/R ratio. Entries are kept as (value, name) in a sorted list,
+    so equality and range queries take a binary search instead of a scan.
+    Equipment whose key is None or nan is not indexed and never matches.
+    """
+
+    def __init__(self, key, attributes: tuple):
+        """
+        Initialize an empty EquipmentIndex instance.
+
+        Args:
+            key: Callable taking an equipment object and returning the indexed value
+            attributes: Names of the attributes the key is computed from
+        """
+        self.key = key
+        self.attributes = attributes
+        self._entries = []
+        self._values = {}
+
+    def add(self, name: str, obj):
+        """
+        Index an equipment object.
+
+        Args:
+            name: The name of the equipment
+            obj: The equipment object
+        """
+        value = self.key(obj)
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            return
+        self._values[name] = value
+        insort(self._entries, (value, name))
+
+    def discard(self, name: str):
+        """
+        Remove an equipment object from the index if it is indexed.
+
+        Args:
+            name: The name of the equipment
+        """
+        value = self._values.pop(name, None)
+        if value is None:
+            return
+        del self._entries[bisect_left(self._entries, (value, name))]
+
+    def find(self, op: str, value):
+        """
+        Get the names of the equipment whose key compares true with a value.
+
+        Args:
+            op: One of "==", "!=", "<", "<=", ">", ">="
+            value: The value to compare with
+
+        Returns:
+            List of names, ordered by key value
+
+        Raises:
+            ValueError: If the operator is unknown
+        """
+        entries = self._entries
+        if op == "==":
+            selected = entries[bisect_left(entries, value, key=_value_of_entry):
+                               bisect_right(entries, value, key=_value_of_entry)]
+        elif op == "!=":
+            selected = (entries[:bisect_left(entries, value, key=_value_of_entry)]
+                        + entries[bisect_right(entries, value, key=_value_of_entry):])
+        elif op == "<":
+            selected = entries[:bisect_left(entries, value, key=_value_of_entry)]
+        elif op == "<=":
+            selected = entries[:bisect_right(entries, value, key=_value_of_entry)]
+        elif op == ">":
+            selected = entries[bisect_right(entries, value, key=_value_of_entry):]
+        elif op == ">=":
+            selected = entries[bisect_left(entries, value, key=_value_of_entry):]
+        else:
+            raise ValueError(f"Unknown query operator '{op}', expected one of {OPERATORS}")
+        return [name for _, name in selected]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class EquipmentIndexes:
+    """
+    The equipment indexes of a Circuit, kept up to date from its journal.
+
+    An index is built on the first query of its key, with one scan of the
+    equipment dictionary, and afterwards maintained incrementally: adding or
+    removing equipment inserts or deletes one entry, and an update re-indexes
+    the equipment only if it changed an attribute the key is computed from.
+
+    Every attribute of the equipment can be queried. Computed keys are added
+    with register(); "x_over_r" is provided for lines and transformers.
+    Changes made directly on objects returned by Circuit.edit() are not
+    journaled; call rebuild() after making them.
+    """
+
+    def __init__(self, circuit):
+        """
+        Initialize an EquipmentIndexes instance for a circuit.
+
+        Args:
+            circuit: The Circuit whose equipment is indexed
+        """
+        self._circuit = circuit
+        self._indexes = {}
+
+        # Dictionary {(collection, key name): (key function, attributes)} of computed keys
+        self._computed = {}
+        for collection in ("transmission_lines", "transformers"):
+            self.register(collection, "x_over_r", _x_over_r, ("r", "x"))
+        circuit.journal.subscribe(self._on_change)
+
+    def register(self, collection: str, key_name: str, key, attributes):
+        """
+        Add a computed key that can be queried like an attribute.
+
+        Args:
+            collection: The equipment dictionary, e.g. "transmission_lines"
+            key_name: The name used in queries
+            key: Callable taking an equipment object and returning the value
+            attributes: Names of the attributes the key is computed from
+
+        Raises:
+            ValueError: If the collection is unknown or the key name is already registered
+        """
+        self._check_collection(collection)
+        if (collection, key_name) in self._computed:
+            raise ValueError(f"Key '{key_name}' is already registered for {collection}")
+        self._computed[(collection, key_name)] = (key, tuple(attributes))
+
+    def query(self, collection: str, key_name: str, op: str, value):
+        """
+        Find equipment by comparing an attribute or computed key with a value.
+
+        Args:
+            collection: The equipment dictionary, e.g. "buses" or "loads"
+            key_name: An attribute name or a registered computed key
+            op: One of "==", "!=", "<", "<=", ">", ">="
+            value: The value to compare with
+
+        Returns:
+            List of equipment names, ordered by the key value
+
+        Raises:
+            ValueError: If the collection, the key or the operator is unknown
+        """
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown query operator '{op}', expected one of {OPERATORS}")
+        return self._index(collection, key_name).find(op, value)
+
+    def rebuild(self):
+        """
+        Drop every index; each is rebuilt by its next query.
+        """
+        self._indexes.clear()
+
+    def share_from(self, other):
+        """
+        Take over the computed keys registered on another circuit's indexes.
+
+        Used by Circuit.fork(); the indexes themselves are built again on demand.
+
+        Args:
+            other: The EquipmentIndexes of the parent circuit
+        """
+        self._computed = dict(other._computed)
+
+    def _index(self, collection: str, key_name: str):
+        index = self._indexes.get((collection, key_name))
+        if index is not None:
+            return index
+
+        self._check_collection(collection)
+        equipment = getattr(self._circuit, collection)
+        if (collection, key_name) in self._computed:
+            index = EquipmentIndex(*self._computed[(collection, key_name)])
+        else:
+            if key_name.startswith("_") or any(not hasattr(obj, key_name) for obj in equipment.values()):
+                raise ValueError(f"'{key_name}' is not an attribute of {collection}")
+            index = EquipmentIndex(partial(_attribute, key_name), (key_name,))
+            if not equipment:
+                # Nothing to check the attribute name against; do not keep an index
+                # for what may be a misspelling, check again once there is equipment
+                return index
+
+        # Concurrent readers may each build this index; only a complete one is published
+        for name, obj in equipment.items():
+            index.add(name, obj)
+        self._indexes[(collection, key_name)] = index
+        return index
+
+    def _check_collection(self, collection: str):
+        if collection not in type(self._circuit)._COLLECTIONS:
+            raise ValueError(f"Unknown equipment collection '{collection}'")
+
+    def _on_change(self, entry):
+        for (collection, _), index in self._indexes.items():
+            if collection != entry.collection:
+                continue
+            if entry.action == "add":
+                index.add(entry.name, entry.after)
+            elif entry.action == "remove":
+                index.discard(entry.name)
+            elif any(attribute in entry.after for attribute in index.attributes):
+                index.discard(entry.name)
+                index.add(entry.name, getattr(self._circuit, collection)[entry.name])
+
+    def __getstate__(self):
+        # Indexes are rebuilt on demand; do not pickle them
+        state = self.__dict__.copy()
+        state["_indexes"] = {}
+        return state
+
+
+def _attribute(name: str, obj):
+    # Missing attributes are not indexed rather than failing inside the journal observer
+    return getattr(obj, name, None)
+
+
+def _x_over_r(branch):
+    if branch.r == 0:
+        return math.inf
+    return branch.x / branch.r
+
+
+if __name__ == "__main__":
+    from Src.Utils.Classes.circuit import Circuit
+
+    # Simple validation test
+    print("=== EquipmentIndexes Class Validation ===\n")
+
+    circuit1 = Circuit("Test Circuit")
+    circuit1.add_bus("Bus_1", 20.0)
+    circuit1.add_bus("Bus_2", 230.0)
+    circuit1.add_bus("Bus_3", 230.0)
+    circuit1.add_transmission_line("Line_1", "Bus_2", "Bus_3", 0.02, 0.25, 0.0, 0.04)
+    circuit1.add_transmission_line("Line_2", "Bus_2", "Bus_3", 0.05, 0.15, 0.0, 0.02)
+    circuit1.add_load("Load_1", "Bus_2", 50.0, 30.0)
+    circuit1.add_load("Load_2", "Bus_3", 120.0, 40.0)
+
+    print(circuit1.query("buses", "nominal_kv", "==", 230.0))  # Expected output: ['Bus_2', 'Bus_3']
+    print(circuit1.query("loads", "mw", ">", 100.0))  # Expected output: ['Load_2']
+    print(circuit1.query("transmission_lines", "x_over_r", "<", 5.0))  # Expected output: ['Line_2']
+
+    # Indexes follow changes made through the circuit
+    circuit1.update("loads", "Load_1", mw=150.0)
+    print(circuit1.query("loads", "mw", ">", 100.0))  # Expected output: ['Load_2', 'Load_1']
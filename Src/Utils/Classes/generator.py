@@ -3,10 +3,19 @@ class Generator:
     Represents a generator in a power system network.
 
     A generator is connected to a single bus and controls voltage magnitude
-    while producing active power.
+    while producing active power. It can only hold the voltage setpoint while its
+    reactive power output stays within [mvar_min, mvar_max]; outside that range
+    it is fixed at the violated limit and its bus switches from PV to PQ.
+
+    For short-circuit studies the generator is modeled as a voltage source behind
+    its subtransient reactance. For dispatch studies its operating cost is a
+    polynomial in MW output, limited to [mw_min, mw_max].
     """
 
-    def __init__(self, name: str, bus1_name: str, voltage_setpoint: float, mw_setpoint: float):
+    def __init__(self, name: str, bus1_name: str, voltage_setpoint: float, mw_setpoint: float,
+                 mvar_min: float = float("-inf"), mvar_max: float = float("inf"),
+                 x_subtransient: float = None, mw_min: float = float("-inf"),
+                 mw_max: float = float("inf"), cost_coefficients: tuple = (0.0, 0.0, 0.0)):
         """
         Initialize a Generator instance.
 
@@ -15,15 +24,104 @@ class Generator:
             bus1_name: Name of the bus where the generator is connected
             voltage_setpoint: Voltage magnitude setpoint in per-unit
             mw_setpoint: Active power generation setpoint in megawatts (MW)
+            mvar_min: Minimum reactive power output in megavars (MVAR), unlimited by default
+            mvar_max: Maximum reactive power output in megavars (MVAR), unlimited by default
+            x_subtransient: Subtransient source reactance in per-unit, or None if the
+                            generator does not contribute fault current
+            mw_min: Minimum active power output in megawatts (MW), unlimited by default
+            mw_max: Maximum active power output in megawatts (MW), unlimited by default
+            cost_coefficients: Cost curve coefficients (c0, c1, c2, ...) in ascending
+                               order, so that cost = c0 + c1*MW + c2*MW^2 + ... in $/h
+
+        Raises:
+            ValueError: If a minimum limit is greater than its maximum, x_subtransient
+                        is not positive or cost_coefficients is empty
         """
         self.name = name
         self.bus1_name = bus1_name
         self.voltage_setpoint = voltage_setpoint
         self.mw_setpoint = mw_setpoint
+        self.mvar_min = mvar_min
+        self.mvar_max = mvar_max
+        self.x_subtransient = x_subtransient
+        self.mw_min = mw_min
+        self.mw_max = mw_max
+        self.cost_coefficients = cost_coefficients
+
+        self.validate()
+
+    def validate(self):
+        """
+        Check the generator's model data and store cost_coefficients as a tuple.
+
+        Called by the constructor and by Circuit.update(), so changed attributes
+        obey the same rules as a new generator.
+
+        Raises:
+            ValueError: If a minimum limit is greater than its maximum, x_subtransient
+                        is not positive or cost_coefficients is empty
+        """
+        if self.mvar_min > self.mvar_max:
+            raise ValueError(f"Generator '{self.name}' has mvar_min {self.mvar_min} "
+                             f"greater than mvar_max {self.mvar_max}")
+        if self.x_subtransient is not None and self.x_subtransient <= 0:
+            raise ValueError(f"Generator '{self.name}' must have a positive x_subtransient")
+        if self.mw_min > self.mw_max:
+            raise ValueError(f"Generator '{self.name}' has mw_min {self.mw_min} greater than mw_max {self.mw_max}")
+        self.cost_coefficients = tuple(self.cost_coefficients)
+        if len(self.cost_coefficients) == 0:
+            raise ValueError(f"Generator '{self.name}' must have at least one cost coefficient")
+
+    def enforce_mvar_limits(self, mvar: float):
+        """
+        Apply the reactive power limits to a reactive power output.
+
+        Args:
+            mvar: Reactive power output in megavars (MVAR), e.g. from a PV bus solution
+
+        Returns:
+            Tuple (limited output in MVAR, True if a limit was hit and the bus must be treated as PQ)
+        """
+        if mvar > self.mvar_max:
+            return self.mvar_max, True
+        if mvar < self.mvar_min:
+            return self.mvar_min, True
+        return mvar, False
+
+    def cost(self, mw: float):
+        """
+        Evaluate the cost curve.
+
+        Args:
+            mw: Active power output in megawatts (MW)
+
+        Returns:
+            Operating cost in $/h
+        """
+        total = 0.0
+        for coefficient in reversed(self.cost_coefficients):
+            total = total * mw + coefficient
+        return total
+
+    def marginal_cost(self, mw: float):
+        """
+        Evaluate the derivative of the cost curve.
+
+        Args:
+            mw: Active power output in megawatts (MW)
+
+        Returns:
+            Incremental cost in $/MWh
+        """
+        total = 0.0
+        for power in range(len(self.cost_coefficients) - 1, 0, -1):
+            total = total * mw + power * self.cost_coefficients[power]
+        return total
 
     def __repr__(self):
         return (f"Generator(name='{self.name}', bus='{self.bus1_name}', "
-                f"v_setpoint={self.voltage_setpoint}, mw={self.mw_setpoint})")
+                f"v_setpoint={self.voltage_setpoint}, mw={self.mw_setpoint}, "
+                f"mvar_min={self.mvar_min}, mvar_max={self.mvar_max})")
 
 
 if __name__ == "__main__":
@@ -56,3 +154,24 @@ if __name__ == "__main__":
     print(f"G2: {gen2.voltage_setpoint} p.u.")
     print(f"Total generation: {gen1.mw_setpoint + gen2.mw_setpoint + gen3.mw_setpoint} MW")
 
+    # Test reactive power limits
+    print("\n--- Reactive Power Limits ---")
+    gen4 = Generator("G4", "Bus 9", 1.03, 120.0, mvar_min=-40.0, mvar_max=60.0)
+    print(repr(gen4))
+    print(f"Q = 30 MVAR -> {gen4.enforce_mvar_limits(30.0)}")  # Expected output: (30.0, False)
+    print(f"Q = 75 MVAR -> {gen4.enforce_mvar_limits(75.0)}")  # Expected output: (60.0, True)
+    print(f"Q = -50 MVAR -> {gen4.enforce_mvar_limits(-50.0)}")  # Expected output: (-40.0, True)
+
+    # Test fault source reactance
+    print("\n--- Subtransient Reactance ---")
+    gen5 = Generator("G5", "Bus 10", 1.02, 300.0, x_subtransient=0.12)
+    print(f"G5 x'' = {gen5.x_subtransient} p.u.")
+    print(f"G1 x'' = {gen1.x_subtransient} (no fault contribution)")
+
+    # Test cost curve
+    print("\n--- Cost Curve ---")
+    gen6 = Generator("G6", "Bus 11", 1.01, 200.0, mw_min=50.0, mw_max=400.0,
+                     cost_coefficients=(100.0, 20.0, 0.01))
+    print(f"G6 cost at 200 MW: {gen6.cost(200.0)} $/h")  # Expected output: 4500.0
+    print(f"G6 marginal cost at 200 MW: {gen6.marginal_cost(200.0)} $/MWh")  # Expected output: 24.0
+
@@ -0,0 +1,124 @@
+import json
+import subprocess
+import sys
+
+from Paths.paths import IMPORT_BUDGET_FILE, PROJECT_ROOT
+
+
+# Run in a fresh interpreter: time "import Src", then the first use of Src.Circuit
+_TIMING_CODE = ("import time; t = time.perf_counter(); import Src; a = time.perf_counter(); "
+                "Src.Circuit; b = time.perf_counter(); print((a - t) * 1e3, (b - t) * 1e3)")
+
+
+class ImportBenchmark:
+    """
+    Cold-import time benchmark of the Src package.
+
+    Each run starts a new interpreter in the project root and measures how long
+    `import Src` takes, and how long it takes until Src.Circuit is usable. The
+    best of several runs is compared against a stored budget.
+
+    The budget is a JSON file with the allowed milliseconds for both imports and
+    the tolerance by which a measurement may exceed them. Wall times depend on
+    the machine, so the budget should be measured again with save_budget() on
+    the machine that runs the benchmark.
+    """
+
+    # Measured imports, in the order the timing code prints them
+    IMPORTS = ("Src", "Circuit")
+
+    def __init__(self, budget_path=IMPORT_BUDGET_FILE):
+        """
+        Initialize an ImportBenchmark instance.
+
+        Args:
+            budget_path: The JSON budget file used by check() and written by save_budget()
+        """
+        self.budget_path = budget_path
+
+    def run(self, runs: int = 5):
+        """
+        Measure cold imports in fresh interpreters.
+
+        Args:
+            runs: The number of interpreters to start; the fastest time of each import is kept
+
+        Returns:
+            Dictionary {import: milliseconds} for "Src" and "Circuit"
+
+        Raises:
+            ValueError: If runs is less than 1
+        """
+        if runs < 1:
+            raise ValueError(f"Benchmark needs at least one run, got {runs}")
+
+        times = []
+        for _ in range(runs):
+            completed = subprocess.run([sys.executable, "-c", _TIMING_CODE], cwd=PROJECT_ROOT,
+                                       capture_output=True, text=True, check=True)
+            times.append([float(value) for value in completed.stdout.split()])
+        return {name: min(run[i] for run in times) for i, name in enumerate(ImportBenchmark.IMPORTS)}
+
+    def load_budget(self):
+        """
+        Read the stored budget.
+
+        Returns:
+            Dictionary with "tolerance" and "import_ms" {import: milliseconds}
+        """
+        with open(self.budget_path) as f:
+            return json.load(f)
+
+    def check(self, result: dict, budget: dict = None):
+        """
+        Compare a measurement against the budget.
+
+        Args:
+            result: A measurement returned by run()
+            budget: The budget to compare against (read from the budget file by default)
+
+        Returns:
+            List of messages, one per import over budget; empty if within budget
+        """
+        if budget is None:
+            budget = self.load_budget()
+        factor = 1.0 + budget["tolerance"]
+
+        violations = []
+        for name, allowed in budget["import_ms"].items():
+            measured = result[name]
+            if measured > allowed * factor:
+                violations.append(f"import {name} takes {measured:.1f} ms, "
+                                  f"budget {allowed:.1f} ms (+{budget['tolerance']:.0%})")
+        return violations
+
+    def save_budget(self, result: dict, tolerance: float = 0.5):
+        """
+        Store a measurement as the new budget, after an intended change in import time.
+
+        Args:
+            result: A measurement returned by run()
+            tolerance: Fraction by which later measurements may exceed the budget
+        """
+        budget = {
+            "tolerance": tolerance,
+            "import_ms": {name: round(result[name], 1) for name in ImportBenchmark.IMPORTS},
+        }
+        self.budget_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.budget_path, "w") as f:
+            json.dump(budget, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    # Import-time benchmark: python -m Src.Utils.Classes.importBenchmark [runs]
+    print("=== ImportBenchmark Validation ===\n")
+
+    benchmark = ImportBenchmark()
+    result = benchmark.run(int(sys.argv[1]) if len(sys.argv) > 1 else 15)
+    for name, milliseconds in result.items():
+        print(f"import {name}: {milliseconds:.1f} ms")
+
+    violations = benchmark.check(result)
+    print("\n" + ("\n".join(violations) if violations else "All imports within budget"))
+    sys.exit(1 if violations else 0)
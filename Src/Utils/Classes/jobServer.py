@@ -0,0 +1,251 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class JobServer:
+    """
+    Local asyncio service that answers solve requests against resident circuits.
+
+    Circuits are loaded once and kept in memory by name. Requests submitted for
+    the same circuit while a batch is being collected are coalesced and handed to
+    the solve function together, which runs in a thread pool so the event loop
+    never blocks on numerical work.
+
+    The solve function is called as solve_batch(circuit, requests) and must return
+    one result per request, in order. It runs with the circuit's read lock held,
+    so the resident circuit can be updated between solves but not during one.
+
+    Only thread pools are supported: the solves share the resident circuits in
+    this process. A process pool would copy each circuit, with its journal, to
+    a worker for every batch; use BatchRunner to spread independent studies
+    over processes.
+    """
+
+    def __init__(self, solve_batch, executor=None, max_batch_size: int = 32,
+                 batch_window: float = 0.005):
+        """
+        Initialize a JobServer instance.
+
+        Args:
+            solve_batch: Callable solving a list of requests against one circuit
+            executor: ThreadPoolExecutor for the solves. One is created (and shut
+                      down by stop()) if not given.
+            max_batch_size: Maximum number of requests handed to one solve_batch call
+            batch_window: Seconds to wait for more requests before dispatching a batch
+
+        Raises:
+            ValueError: If max_batch_size is less than 1 or executor is not a ThreadPoolExecutor
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+            raise ValueError(f"JobServer needs a ThreadPoolExecutor, got {type(executor).__name__}")
+
+        self.solve_batch = solve_batch
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.circuits = {}
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._pending = {}
+        self._dispatchers = {}
+        self._running = False
+        self._start_time = None
+
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._batches = 0
+        self._queue_latency_total = 0.0
+        self._queue_latency_max = 0.0
+
+    def load_circuit(self, circuit):
+        """
+        Keep a circuit resident so requests can be submitted against it.
+
+        Args:
+            circuit: The Circuit to load, stored under circuit.name
+
+        Raises:
+            ValueError: If a circuit with the same name is already loaded
+        """
+        if circuit.name in self.circuits:
+            raise ValueError(f"Circuit '{circuit.name}' is already loaded")
+
+        self.circuits[circuit.name] = circuit
+
+    def unload_circuit(self, name: str):
+        """
+        Remove a resident circuit.
+
+        Args:
+            name: The name of the circuit
+
+        Raises:
+            ValueError: If the circuit is not loaded or still has queued requests
+        """
+        if name not in self.circuits:
+            raise ValueError(f"Circuit '{name}' is not loaded")
+        if self._pending.get(name):
+            raise ValueError(f"Circuit '{name}' still has queued requests")
+
+        del self.circuits[name]
+
+    async def start(self):
+        """
+        Start accepting requests.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor()
+        self._running = True
+        self._start_time = time.perf_counter()
+
+    async def stop(self):
+        """
+        Stop accepting requests and wait for queued requests to finish.
+        """
+        self._running = False
+        if self._dispatchers:
+            await asyncio.gather(*self._dispatchers.values(), return_exceptions=True)
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def submit(self, circuit_name: str, request):
+        """
+        Queue a request against a resident circuit and wait for its result.
+
+        Args:
+            circuit_name: The name of a loaded circuit
+            request: The request passed to the solve function
+
+        Returns:
+            The result produced by the solve function for this request
+
+        Raises:
+            RuntimeError: If the server is not running
+            ValueError: If the circuit is not loaded
+        """
+        if not self._running:
+            raise RuntimeError("JobServer is not running")
+        if circuit_name not in self.circuits:
+            raise ValueError(f"Circuit '{circuit_name}' is not loaded")
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(circuit_name, []).append((request, future, time.perf_counter()))
+        self._submitted += 1
+
+        if circuit_name not in self._dispatchers:
+            self._dispatchers[circuit_name] = asyncio.create_task(self._dispatch(circuit_name))
+
+        return await future
+
+    async def _dispatch(self, circuit_name: str):
+        """
+        Drain the queue of one circuit in batches until it is empty.
+
+        Args:
+            circuit_name: The name of the circuit
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._pending[circuit_name]
+        try:
+            while queue:
+                if len(queue) < self.max_batch_size and self.batch_window > 0:
+                    await asyncio.sleep(self.batch_window)
+
+                batch = queue[:self.max_batch_size]
+                del queue[:self.max_batch_size]
+
+                started = time.perf_counter()
+                for _, _, queued_at in batch:
+                    latency = started - queued_at
+                    self._queue_latency_total += latency
+                    if latency > self._queue_latency_max:
+                        self._queue_latency_max = latency
+                self._batches += 1
+
+                requests = [request for request, _, _ in batch]
+                try:
+                    results = await loop.run_in_executor(
+                        self._executor, _solve_locked, self.solve_batch, self.circuits[circuit_name], requests)
+                    if len(results) != len(requests):
+                        raise ValueError(f"solve_batch returned {len(results)} results "
+                                         f"for {len(requests)} requests")
+                except Exception as e:
+                    self._failed += len(batch)
+                    for _, future, _ in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                self._completed += len(batch)
+                for (_, future, _), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            del self._dispatchers[circuit_name]
+            if not queue:
+                del self._pending[circuit_name]
+
+    def get_metrics(self):
+        """
+        Get throughput and queue-latency metrics.
+
+        Returns:
+            Dictionary of counters, throughput in requests per second, mean batch
+            size and queue latency (submit to dispatch) in seconds
+        """
+        elapsed = time.perf_counter() - self._start_time if self._start_time is not None else 0.0
+        dispatched = self._completed + self._failed
+        return {
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "queued": sum(len(queue) for queue in self._pending.values()),
+            "batches": self._batches,
+            "mean_batch_size": dispatched / self._batches if self._batches else 0.0,
+            "throughput_per_s": self._completed / elapsed if elapsed > 0 else 0.0,
+            "mean_queue_latency_s": self._queue_latency_total / dispatched if dispatched else 0.0,
+            "max_queue_latency_s": self._queue_latency_max,
+        }
+
+
+def _solve_locked(solve_batch, circuit, requests):
+    # Runs in a pool thread; changes to the circuit wait until the batch is solved
+    with circuit.reading():
+        return solve_batch(circuit, requests)
+
+
+if __name__ == "__main__":
+    from Src.Utils.Classes.circuit import Circuit
+
+    # Simple validation test
+    print("=== JobServer Class Validation ===\n")
+
+    def total_load(circuit, requests):
+        # Stand-in solve: scale the total circuit load by each request's factor
+        base = sum(load.mw for load in circuit.loads.values())
+        return [base * factor for factor in requests]
+
+    async def main():
+        circuit1 = Circuit("Test Circuit")
+        circuit1.add_load("Load_1", "Bus_2", 50.0, 30.0)
+        circuit1.add_load("Load_2", "Bus_3", 25.0, 10.0)
+
+        async with JobServer(total_load) as server:
+            server.load_circuit(circuit1)
+            results = await asyncio.gather(*(server.submit("Test Circuit", f) for f in (0.5, 1.0, 1.5)))
+            print(f"Results: {results}")  # Expected output: [37.5, 75.0, 112.5]
+            print(f"Metrics: {server.get_metrics()}")
+
+    asyncio.run(main())
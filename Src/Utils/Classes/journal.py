@@ -0,0 +1,244 @@
+from collections import namedtuple
+from contextlib import contextmanager
+
+
+# One recorded mutation of a Circuit:
+#   action "add":    before is None, after is the added object
+#   action "remove": before is the removed object, after is None
+#   action "update": before and after are {attribute: value} of the changed attributes
+JournalEntry = namedtuple("JournalEntry", ["action", "collection", "name", "before", "after"])
+
+
+class Journal:
+    """
+    Append-only record of the mutations made to a Circuit.
+
+    Every mutation is appended as a JournalEntry and passed to the subscribed
+    observers, so derived data can be updated from the deltas instead of being
+    rebuilt. Undo and redo do not rewrite history: they apply the inverse (or
+    the original) entries again, which are appended like any other mutation.
+
+    Mutations made inside a transaction() are undone and redone together.
+    """
+
+    ACTIONS = ("add", "remove", "update")
+
+    def __init__(self):
+        """
+        Initialize an empty Journal instance.
+        """
+        self.entries = []
+        self._observers = []
+
+        # Undo steps as (start, stop, grouped) ranges into entries: a grouped
+        # range is one step, otherwise each of its entries is a step of its own
+        self._undo = []
+        # Undone steps as (start, stop) ranges into entries
+        self._redo = []
+        # Entries from _run_start on are single-entry undo steps not yet in _undo
+        self._run_start = 0
+        self._transaction_depth = 0
+        self._transaction_start = 0
+        self._replaying = False
+
+    def record(self, action: str, collection: str, name: str, before, after):
+        """
+        Append a mutation and notify the observers.
+
+        Args:
+            action: "add", "remove" or "update"
+            collection: The equipment dictionary that was mutated
+            name: The name of the equipment
+            before: The state before the mutation (see JournalEntry)
+            after: The state after the mutation (see JournalEntry)
+
+        Returns:
+            The new JournalEntry
+
+        Raises:
+            ValueError: If the action is unknown
+        """
+        if action not in Journal.ACTIONS:
+            raise ValueError(f"Unknown journal action '{action}'")
+
+        entry = JournalEntry(action, collection, name, before, after)
+        self.entries.append(entry)
+        # The entry joins the open run of undo steps; only a redo stack to drop costs anything
+        if self._redo and not self._replaying and self._transaction_depth == 0:
+            self._redo.clear()
+        for observer in self._observers:
+            observer(entry)
+        return entry
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group the mutations made inside the block into one undo step.
+        """
+        if self._transaction_depth == 0:
+            self._close_run()
+            self._transaction_start = len(self.entries)
+        self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                if len(self.entries) > self._transaction_start:
+                    self._undo.append((self._transaction_start, len(self.entries), True))
+                    self._redo.clear()
+                self._run_start = len(self.entries)
+
+    @contextmanager
+    def replaying(self):
+        """
+        Record the mutations made inside the block without making them undoable.
+
+        Used by Circuit.undo() and Circuit.redo() while they re-apply entries.
+        """
+        self._close_run()
+        self._replaying = True
+        try:
+            yield self
+        finally:
+            self._replaying = False
+            self._run_start = len(self.entries)
+
+    def can_undo(self):
+        """
+        Returns:
+            True if there is a mutation to undo
+        """
+        return bool(self._undo) or self._open_run() > 0
+
+    def can_redo(self):
+        """
+        Returns:
+            True if there is an undone mutation to redo
+        """
+        return bool(self._redo)
+
+    def pop_undo(self):
+        """
+        Take the most recent undoable group and make it redoable.
+
+        Returns:
+            The entries of the group, in the order they were recorded
+
+        Raises:
+            ValueError: If there is nothing to undo
+        """
+        self._close_run()
+        if not self._undo:
+            raise ValueError("Nothing to undo")
+        start, stop, grouped = self._undo.pop()
+        if not grouped:
+            # Take the last entry of the run and leave the rest undoable
+            if stop - start > 1:
+                self._undo.append((start, stop - 1, False))
+            start = stop - 1
+        self._redo.append((start, stop))
+        return self.entries[start:stop]
+
+    def pop_redo(self):
+        """
+        Take the most recently undone group and make it undoable again.
+
+        Returns:
+            The entries of the group, in the order they were recorded
+
+        Raises:
+            ValueError: If there is nothing to redo
+        """
+        if not self._redo:
+            raise ValueError("Nothing to redo")
+        start, stop = self._redo.pop()
+        self._undo.append((start, stop, True))
+        return self.entries[start:stop]
+
+    def subscribe(self, observer):
+        """
+        Register a callable that receives every new JournalEntry.
+
+        Args:
+            observer: Callable taking one JournalEntry
+        """
+        self._observers.append(observer)
+
+    def unsubscribe(self, observer):
+        """
+        Stop notifying an observer.
+
+        Args:
+            observer: A previously subscribed callable
+
+        Raises:
+            ValueError: If the observer is not subscribed
+        """
+        self._observers.remove(observer)
+
+    def clear(self):
+        """
+        Drop the recorded history, e.g. after loading a model. Observers are kept.
+        """
+        self.entries = []
+        self._undo.clear()
+        self._redo.clear()
+        self._run_start = 0
+
+    def truncate(self, length: int):
+        """
+        Drop the entries after the first length ones, e.g. a failed change that was reverted.
+
+        Must only be called inside a transaction() that was opened with at most
+        length entries, so no undo group refers to the dropped entries.
+
+        Args:
+            length: The number of entries to keep
+        """
+        del self.entries[length:]
+
+    def _open_run(self):
+        # Number of entries recorded as single undo steps since the last _close_run()
+        if self._replaying or self._transaction_depth:
+            return 0
+        return len(self.entries) - self._run_start
+
+    def _close_run(self):
+        # Move the open run of single-entry undo steps onto the undo stack
+        if self._open_run() > 0:
+            self._undo.append((self._run_start, len(self.entries), False))
+        self._run_start = len(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __getstate__(self):
+        # Observers are usually bound to objects in this process; do not pickle them
+        state = self.__dict__.copy()
+        state["_observers"] = []
+        return state
+
+
+if __name__ == "__main__":
+    from Src.Utils.Classes.circuit import Circuit
+
+    # Simple validation test
+    print("=== Journal Class Validation ===\n")
+
+    circuit1 = Circuit("Test Circuit")
+    circuit1.journal.subscribe(lambda entry: print(f"  observed: {entry.action} {entry.collection} '{entry.name}'"))
+
+    circuit1.add_bus("Bus_1", 20.0)
+    circuit1.add_load("Load_1", "Bus_1", 50.0, 30.0)
+    circuit1.update("loads", "Load_1", mw=60.0)
+    print(f"Load_1 MW: {circuit1.loads['Load_1'].mw}")  # Expected output: 60.0
+
+    print("\n--- Undo ---")
+    circuit1.undo()
+    print(f"Load_1 MW: {circuit1.loads['Load_1'].mw}")  # Expected output: 50.0
+
+    print("\n--- Redo ---")
+    circuit1.redo()
+    print(f"Load_1 MW: {circuit1.loads['Load_1'].mw}")  # Expected output: 60.0
+    print(f"\nJournal entries: {len(circuit1.journal)}")  # Expected output: 5
@@ -21,6 +21,11 @@ class Load:
         self.mw = mw
         self.mvar = mvar
 
+    def validate(self):
+        """
+        Check the load's model data. Any MW and MVAR values are valid.
+        """
+
     def __repr__(self):
         return (f"Load(name='{self.name}', bus='{self.bus1_name}', "
                 f"mw={self.mw}, mvar={self.mvar})")
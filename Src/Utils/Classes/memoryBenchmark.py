@@ -0,0 +1,290 @@
+import gc
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from Paths.paths import MEMORY_BUDGET_FILE
+from Src.Utils.Classes.circuit import Circuit
+
+
+# Equipment per bus in the benchmark circuits, roughly that of a transmission model
+ELEMENTS_PER_BUS = {
+    "buses": 1.0,
+    "transmission_lines": 1.5,
+    "transformers": 0.1,
+    "generators": 0.2,
+    "loads": 0.6,
+}
+
+# Fewest elements of a type for its bytes per element to be checked. Memory is
+# taken from the OS in arenas, so smaller counts give too noisy a per-element figure.
+MIN_CHECKED_ELEMENTS = 50000
+
+
+class MemoryBenchmark:
+    """
+    Memory benchmark of circuits built through the public Circuit API.
+
+    Each run builds a circuit with a given number of buses and proportional
+    equipment (see ELEMENTS_PER_BUS) in a fresh worker process, so earlier runs
+    do not affect the measurement. It reports the steady-state resident memory
+    (RSS) added per element of each type, and the steady-state and peak RSS per
+    bus of the whole build, and compares them against a stored budget.
+
+    The budget is a JSON file with the allowed bytes per element type, the
+    allowed steady-state and peak bytes per bus and the tolerance by which a
+    measurement may exceed them. Memory is read from /proc, so runs are only
+    supported on Linux.
+    """
+
+    def __init__(self, budget_path=MEMORY_BUDGET_FILE):
+        """
+        Initialize a MemoryBenchmark instance.
+
+        Args:
+            budget_path: The JSON budget file used by check() and written by save_budget()
+        """
+        self.budget_path = budget_path
+
+    @staticmethod
+    def is_supported():
+        """
+        Returns:
+            True if RSS can be measured on this platform
+        """
+        return os.path.exists("/proc/self/statm")
+
+    def run(self, num_buses: int):
+        """
+        Build and measure one benchmark circuit in a fresh process.
+
+        Args:
+            num_buses: The number of buses
+
+        Returns:
+            Dictionary with "num_buses", "elements" {collection: count},
+            "bytes_per_element" {collection: bytes}, "steady_rss_bytes",
+            "peak_rss_bytes", "steady_bytes_per_bus" and "peak_bytes_per_bus"
+
+        Raises:
+            ValueError: If num_buses is less than 10
+            RuntimeError: If RSS cannot be measured on this platform
+        """
+        if num_buses < 10:
+            raise ValueError(f"Benchmark needs at least 10 buses, got {num_buses}")
+        if not MemoryBenchmark.is_supported():
+            raise RuntimeError("Memory benchmark needs /proc/self/statm (Linux)")
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            return executor.submit(_measure, num_buses).result()
+
+    def load_budget(self):
+        """
+        Read the stored budget.
+
+        Returns:
+            Dictionary with "tolerance", "bytes_per_element", "steady_bytes_per_bus"
+            and "peak_bytes_per_bus"
+        """
+        with open(self.budget_path) as f:
+            return json.load(f)
+
+    def check(self, result: dict, budget: dict = None):
+        """
+        Compare a measurement against the budget.
+
+        Element types with fewer than MIN_CHECKED_ELEMENTS elements are only
+        covered by the per-bus totals.
+
+        Args:
+            result: A measurement returned by run()
+            budget: The budget to compare against (read from the budget file by default)
+
+        Returns:
+            List of messages, one per value over budget; empty if within budget
+        """
+        if budget is None:
+            budget = self.load_budget()
+        factor = 1.0 + budget["tolerance"]
+
+        violations = []
+        for collection, allowed in budget["bytes_per_element"].items():
+            if result["elements"][collection] < MIN_CHECKED_ELEMENTS:
+                continue
+            measured = result["bytes_per_element"][collection]
+            if measured > allowed * factor:
+                violations.append(f"{result['num_buses']} buses: {collection} use {measured:.0f} bytes "
+                                  f"per element, budget {allowed:.0f} (+{budget['tolerance']:.0%})")
+        for key in ("steady_bytes_per_bus", "peak_bytes_per_bus"):
+            measured = result[key]
+            allowed = budget[key]
+            if measured > allowed * factor:
+                violations.append(f"{result['num_buses']} buses: {key} is {measured:.0f}, "
+                                  f"budget {allowed:.0f} (+{budget['tolerance']:.0%})")
+        return violations
+
+    def save_budget(self, result: dict, tolerance: float = 0.25):
+        """
+        Store a measurement as the new budget, after an intended change in memory use.
+
+        Args:
+            result: A measurement returned by run()
+            tolerance: Fraction by which later measurements may exceed the budget
+        """
+        budget = {
+            "tolerance": tolerance,
+            "bytes_per_element": {c: round(v) for c, v in result["bytes_per_element"].items()},
+            "steady_bytes_per_bus": round(result["steady_bytes_per_bus"]),
+            "peak_bytes_per_bus": round(result["peak_bytes_per_bus"]),
+        }
+        self.budget_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.budget_path, "w") as f:
+            json.dump(budget, f, indent=2)
+            f.write("\n")
+
+    @staticmethod
+    def report(results: list):
+        """
+        Format measurements as a text table.
+
+        Args:
+            results: Measurements returned by run()
+
+        Returns:
+            The table as a string with one row per measurement
+        """
+        header = (f"{'buses':>10} " + " ".join(f"{c:>18}" for c in ELEMENTS_PER_BUS)
+                  + f" {'steady_mb':>10} {'peak_mb':>10}")
+        rows = [header, "-" * len(header)]
+        for result in results:
+            rows.append(f"{result['num_buses']:>10} "
+                        + " ".join(f"{result['bytes_per_element'][c]:>16.0f} B" for c in ELEMENTS_PER_BUS)
+                        + f" {result['steady_rss_bytes'] / 2 ** 20:>10.1f}"
+                        f" {result['peak_rss_bytes'] / 2 ** 20:>10.1f}")
+        return "\n".join(rows)
+
+
+def element_counts(num_buses: int):
+    """
+    Get the number of elements of each type in a benchmark circuit.
+
+    Args:
+        num_buses: The number of buses
+
+    Returns:
+        Dictionary {collection: count}
+    """
+    return {collection: max(1, int(num_buses * ratio)) for collection, ratio in ELEMENTS_PER_BUS.items()}
+
+
+def build_circuit(num_buses: int, measure=None):
+    """
+    Build a benchmark circuit through the public Circuit API.
+
+    Lines form a ring through all buses plus links to the bus after next;
+    transformers, generators and loads are spread evenly over the buses.
+
+    Args:
+        num_buses: The number of buses
+        measure: Optional callable called with (collection, count) after each
+                 element type has been added
+
+    Returns:
+        The Circuit
+    """
+    counts = element_counts(num_buses)
+    circuit = Circuit(f"Benchmark {num_buses}")
+
+    for i in range(counts["buses"]):
+        circuit.add_bus(f"Bus{i}", 230.0)
+    _notify(measure, "buses", counts)
+
+    for k in range(counts["transmission_lines"]):
+        a = k % num_buses
+        circuit.add_transmission_line(f"Line{k}", f"Bus{a}", f"Bus{(a + 1 + k // num_buses) % num_buses}",
+                                      0.01, 0.1, 0.0, 0.02, mva_rating=300.0)
+    _notify(measure, "transmission_lines", counts)
+
+    step = num_buses // counts["transformers"]
+    for k in range(counts["transformers"]):
+        a = k * step
+        circuit.add_transformer(f"T{k}", f"Bus{a}", f"Bus{(a + 1) % num_buses}", 0.0, 0.08,
+                                mva_rating=500.0, tap_ratio=1.0)
+    _notify(measure, "transformers", counts)
+
+    step = num_buses // counts["generators"]
+    for k in range(counts["generators"]):
+        circuit.add_generator(f"G{k}", f"Bus{k * step}", 1.02, 100.0, mvar_min=-50.0, mvar_max=80.0)
+    _notify(measure, "generators", counts)
+
+    for k in range(counts["loads"]):
+        circuit.add_load(f"Load{k}", f"Bus{k * num_buses // counts['loads']}", 40.0, 15.0)
+    _notify(measure, "loads", counts)
+    return circuit
+
+
+def _notify(measure, collection: str, counts: dict):
+    if measure is not None:
+        measure(collection, counts[collection])
+
+
+def _current_rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _peak_rss():
+    # VmHWM belongs to the address space, so unlike ru_maxrss it does not carry
+    # over the peak of the parent process that spawned the worker
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    raise RuntimeError("VmHWM is missing from /proc/self/status")
+
+
+def _measure(num_buses: int):
+    # Runs in a fresh worker process
+    gc.collect()
+    baseline = _current_rss()
+    bytes_per_element = {}
+    previous = [baseline]
+
+    def measure(collection, count):
+        gc.collect()
+        rss = _current_rss()
+        bytes_per_element[collection] = (rss - previous[0]) / count
+        previous[0] = rss
+
+    circuit = build_circuit(num_buses, measure)
+    gc.collect()
+    steady = _current_rss() - baseline
+    peak = max(_peak_rss() - baseline, steady)
+    result = {
+        "num_buses": num_buses,
+        "elements": element_counts(num_buses),
+        "bytes_per_element": bytes_per_element,
+        "steady_rss_bytes": steady,
+        "peak_rss_bytes": peak,
+        "steady_bytes_per_bus": steady / num_buses,
+        "peak_bytes_per_bus": peak / num_buses,
+    }
+    del circuit
+    return result
+
+
+if __name__ == "__main__":
+    # Memory benchmark: python -m Src.Utils.Classes.memoryBenchmark [num_buses ...]
+    # The default sizes take a few minutes and about 2 GB of memory at 10^6 buses
+    print("=== MemoryBenchmark Validation ===\n")
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** 4, 10 ** 5, 10 ** 6]
+    benchmark = MemoryBenchmark()
+    results = [benchmark.run(size) for size in sizes]
+    print(MemoryBenchmark.report(results))
+
+    violations = [message for result in results for message in benchmark.check(result)]
+    print("\n" + ("\n".join(violations) if violations else "All sizes within budget"))
+    sys.exit(1 if violations else 0)
@@ -0,0 +1,199 @@
+import cmath
+import csv
+import math
+from array import array
+from pathlib import Path
+
+from Src.Utils.Classes.profiler import profiled
+
+
+class PowerFlowResults:
+    """
+    Columnar results of a power-flow solution.
+
+    Holds bus voltages and the P/Q flows and losses at both ends of every
+    transmission line and transformer. Each table is stored as a dictionary of
+    columns, with one row per element in the circuit's insertion order, so a
+    whole column can be exported or summed without touching the others. Branch
+    flows for a table are computed in a single pass over its branches.
+
+    Branch parameters are taken to be in per-unit on the system base s_base_mva.
+    Lines use the pi model with half of the shunt admittance at each end, and
+    transformers have their complex tap ratio on the bus1 side. The admittances
+    are the circuit's derived "branch_admittances", so they are computed once
+    and shared with other studies of the unchanged circuit.
+    """
+
+    # Names of the result tables
+    TABLES = ("buses", "transmission_lines", "transformers")
+
+    # Columns of the branch tables
+    BRANCH_COLUMNS = ("name", "bus1_name", "bus2_name", "p1_mw", "q1_mvar", "p2_mw", "q2_mvar",
+                      "p_loss_mw", "q_loss_mvar", "loading_pct")
+
+    def __init__(self, circuit, voltages: dict, s_base_mva: float = 100.0):
+        """
+        Initialize a PowerFlowResults instance.
+
+        Args:
+            circuit: The solved Circuit
+            voltages: Dictionary {bus_name: (magnitude in per-unit, angle in degrees)}
+                      covering every bus a branch connects to
+            s_base_mva: System base power in MVA
+
+        Raises:
+            ValueError: If a branch connects to a bus without a voltage or has zero impedance
+        """
+        self.circuit_name = circuit.name
+        self.s_base_mva = s_base_mva
+        self.buses = self._bus_table(voltages)
+        phasors = {name: cmath.rect(vm, math.radians(va)) for name, (vm, va) in voltages.items()}
+        with circuit.reading():
+            admittances = circuit.derived.get("branch_admittances")
+            self.transmission_lines = self._line_table(circuit.transmission_lines.values(), admittances, phasors)
+            self.transformers = self._transformer_table(circuit.transformers.values(), admittances, phasors)
+
+        self._rows = {table: {name: row for row, name in enumerate(getattr(self, table)["name"])}
+                      for table in PowerFlowResults.TABLES}
+
+    @staticmethod
+    def _bus_table(voltages: dict):
+        return {
+            "name": list(voltages),
+            "vm_pu": array("d", (vm for vm, _ in voltages.values())),
+            "va_deg": array("d", (va for _, va in voltages.values())),
+        }
+
+    @staticmethod
+    def _bus_voltages(branch, phasors: dict):
+        try:
+            return phasors[branch.bus1_name], phasors[branch.bus2_name]
+        except KeyError as e:
+            raise ValueError(f"Branch '{branch.name}' connects to bus {e} without a voltage") from None
+
+    @profiled("results.transmission_lines")
+    def _line_table(self, lines, admittances: dict, phasors: dict):
+        rows = []
+        for line in lines:
+            v1, v2 = self._bus_voltages(line, phasors)
+            _, _, y, y_shunt, _ = admittances[line.name]
+            y_half_shunt = y_shunt / 2
+            s1 = v1 * ((v1 - v2) * y + v1 * y_half_shunt).conjugate()
+            s2 = v2 * ((v2 - v1) * y + v2 * y_half_shunt).conjugate()
+            rows.append((line, s1, s2))
+        return self._branch_table(rows)
+
+    @profiled("results.transformers")
+    def _transformer_table(self, transformers, admittances: dict, phasors: dict):
+        rows = []
+        for transformer in transformers:
+            v1, v2 = self._bus_voltages(transformer, phasors)
+            _, _, y, _, ratio = admittances[transformer.name]
+            i1 = y / transformer.tap_ratio ** 2 * v1 - y / ratio.conjugate() * v2
+            i2 = -y / ratio * v1 + y * v2
+            rows.append((transformer, v1 * i1.conjugate(), v2 * i2.conjugate()))
+        return self._branch_table(rows)
+
+    def _branch_table(self, rows):
+        base = self.s_base_mva
+        table = {column: array("d") for column in PowerFlowResults.BRANCH_COLUMNS}
+        table["name"] = [branch.name for branch, _, _ in rows]
+        table["bus1_name"] = [branch.bus1_name for branch, _, _ in rows]
+        table["bus2_name"] = [branch.bus2_name for branch, _, _ in rows]
+        for branch, s1, s2 in rows:
+            loss = s1 + s2
+            table["p1_mw"].append(s1.real * base)
+            table["q1_mvar"].append(s1.imag * base)
+            table["p2_mw"].append(s2.real * base)
+            table["q2_mvar"].append(s2.imag * base)
+            table["p_loss_mw"].append(loss.real * base)
+            table["q_loss_mvar"].append(loss.imag * base)
+            table["loading_pct"].append(100 * max(abs(s1), abs(s2)) * base / branch.mva_rating)
+        return table
+
+    def get(self, table: str, name: str):
+        """
+        Get one row of a result table.
+
+        Args:
+            table: One of "buses", "transmission_lines" or "transformers"
+            name: The name of the element
+
+        Returns:
+            Dictionary {column: value} for the element
+
+        Raises:
+            ValueError: If the table or the element does not exist
+        """
+        if table not in PowerFlowResults.TABLES:
+            raise ValueError(f"Unknown result table '{table}'")
+        row = self._rows[table].get(name)
+        if row is None:
+            raise ValueError(f"'{name}' does not exist in {table} results")
+
+        return {column: values[row] for column, values in getattr(self, table).items()}
+
+    def to_columns(self, table: str):
+        """
+        Get a result table as plain lists.
+
+        Args:
+            table: One of "buses", "transmission_lines" or "transformers"
+
+        Returns:
+            Dictionary {column: list of values}
+
+        Raises:
+            ValueError: If the table does not exist
+        """
+        if table not in PowerFlowResults.TABLES:
+            raise ValueError(f"Unknown result table '{table}'")
+        return {column: list(values) for column, values in getattr(self, table).items()}
+
+    def to_csv(self, directory):
+        """
+        Write every result table to "<table>.csv" in a directory.
+
+        Args:
+            directory: The directory to write to (created if missing)
+
+        Returns:
+            List of the written file paths
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for table in PowerFlowResults.TABLES:
+            columns = getattr(self, table)
+            path = directory / f"{table}.csv"
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(zip(*columns.values()))
+            paths.append(path)
+        return paths
+
+
+if __name__ == "__main__":
+    from Src.Utils.Classes.circuit import Circuit
+
+    # Simple validation test
+    print("=== PowerFlowResults Class Validation ===\n")
+
+    circuit1 = Circuit("Test Circuit")
+    circuit1.add_bus("Bus_1", 20.0)
+    circuit1.add_bus("Bus_2", 230.0)
+    circuit1.add_bus("Bus_3", 230.0)
+    circuit1.add_transformer("T1", "Bus_1", "Bus_2", 0.0, 0.10, mva_rating=200.0)
+    circuit1.add_transmission_line("Line_1", "Bus_2", "Bus_3", 0.02, 0.25, 0.0, 0.04, mva_rating=150.0)
+
+    # Voltages from a (hypothetical) solved case
+    results = PowerFlowResults(circuit1, {
+        "Bus_1": (1.04, 0.0),
+        "Bus_2": (1.02, -3.0),
+        "Bus_3": (0.99, -6.5),
+    })
+
+    print(f"Bus voltages: {results.to_columns('buses')}")
+    print(f"Line_1: {results.get('transmission_lines', 'Line_1')}")
+    print(f"T1: {results.get('transformers', 'T1')}")  # Expected output: p_loss_mw = 0.0 (lossless)
@@ -0,0 +1,245 @@
+import threading
+import time
+from contextlib import nullcontext
+from functools import wraps
+
+
+class Profiler:
+    """
+    Opt-in instrumentation for the simulator's hot paths.
+
+    Code that wants to be measured wraps its work in a named phase, either with
+    the Profiler.phase() context manager or the @profiled decorator. While the
+    profiler is disabled (the default) both fall straight through to the wrapped
+    code, so the instrumentation can stay in place in production runs.
+
+    Phases are named "<group>.<step>", for example "build.add_bus".
+    """
+
+    # Class-level switches shared by every instrumented call site
+    _enabled = False
+    _track_memory = False
+    _started_tracemalloc = False
+
+    # Dictionary of collected statistics: {phase: [calls, total_s, max_s, alloc_bytes]}
+    _stats = {}
+
+    # Guards _stats, so phases can be recorded from several threads
+    _stats_lock = threading.Lock()
+
+    # Reused for every phase while disabled so no object is created per call
+    _null_phase = nullcontext()
+
+    @classmethod
+    def enable(cls, track_memory: bool = False):
+        """
+        Start recording phase statistics.
+
+        Args:
+            track_memory: Also record memory allocated in each phase using tracemalloc.
+                          This is considerably slower than timing alone.
+        """
+        cls._enabled = True
+        cls._track_memory = track_memory
+        if track_memory and not _tracemalloc().is_tracing():
+            _tracemalloc().start()
+            cls._started_tracemalloc = True
+
+    @classmethod
+    def disable(cls):
+        """
+        Stop recording phase statistics. Collected statistics are kept.
+        """
+        cls._enabled = False
+        if cls._started_tracemalloc:
+            _tracemalloc().stop()
+            cls._started_tracemalloc = False
+        cls._track_memory = False
+
+    @classmethod
+    def is_enabled(cls):
+        """
+        Returns:
+            True if the profiler is currently recording
+        """
+        return cls._enabled
+
+    @classmethod
+    def reset(cls):
+        """
+        Discard all collected statistics.
+        """
+        with cls._stats_lock:
+            cls._stats.clear()
+
+    @classmethod
+    def phase(cls, name: str):
+        """
+        Get a context manager that measures the enclosed block as one call of a phase.
+
+        Args:
+            name: The name of the phase
+
+        Returns:
+            A context manager
+        """
+        if not cls._enabled:
+            return cls._null_phase
+        return _PhaseTimer(name)
+
+    @classmethod
+    def record(cls, name: str, seconds: float, allocated_bytes: int = 0):
+        """
+        Add one call of a phase to the statistics.
+
+        Args:
+            name: The name of the phase
+            seconds: Wall time spent in the call
+            allocated_bytes: Net memory allocated during the call
+        """
+        with cls._stats_lock:
+            entry = cls._stats.get(name)
+            if entry is None:
+                cls._stats[name] = [1, seconds, seconds, allocated_bytes]
+                return
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+            entry[3] += allocated_bytes
+
+    @classmethod
+    def get_stats(cls):
+        """
+        Get the collected statistics.
+
+        Returns:
+            Dictionary {phase: {"calls", "total_s", "mean_s", "max_s", "allocated_bytes"}}
+        """
+        with cls._stats_lock:
+            collected = [(name, list(entry)) for name, entry in cls._stats.items()]
+        stats = {}
+        for name, (calls, total, maximum, allocated) in collected:
+            stats[name] = {
+                "calls": calls,
+                "total_s": total,
+                "mean_s": total / calls,
+                "max_s": maximum,
+                "allocated_bytes": allocated,
+            }
+        return stats
+
+    @classmethod
+    def to_json(cls, indent: int = 2):
+        """
+        Export the collected statistics as a JSON string.
+
+        Args:
+            indent: Indentation passed to json.dumps
+
+        Returns:
+            The statistics as JSON
+        """
+        import json
+
+        return json.dumps(cls.get_stats(), indent=indent, sort_keys=True)
+
+    @classmethod
+    def to_table(cls):
+        """
+        Export the collected statistics as a flat text table, slowest phase first.
+
+        Returns:
+            The statistics as a string with one row per phase
+        """
+        header = f"{'phase':<32} {'calls':>10} {'total_ms':>12} {'mean_ms':>12} {'max_ms':>12} {'alloc_kb':>12}"
+        rows = [header, "-" * len(header)]
+        stats = sorted(cls.get_stats().items(), key=lambda item: item[1]["total_s"], reverse=True)
+        for name, s in stats:
+            rows.append(f"{name:<32} {s['calls']:>10} {s['total_s'] * 1e3:>12.3f} "
+                        f"{s['mean_s'] * 1e3:>12.3f} {s['max_s'] * 1e3:>12.3f} "
+                        f"{s['allocated_bytes'] / 1024:>12.1f}")
+        return "\n".join(rows)
+
+
+class _PhaseTimer:
+    """
+    Context manager that times one call of a phase while the profiler is enabled.
+    """
+
+    __slots__ = ("name", "start", "start_bytes")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = 0.0
+        self.start_bytes = 0
+
+    def __enter__(self):
+        if Profiler._track_memory:
+            self.start_bytes = _tracemalloc().get_traced_memory()[0]
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        allocated = 0
+        if Profiler._track_memory:
+            allocated = _tracemalloc().get_traced_memory()[0] - self.start_bytes
+        Profiler.record(self.name, elapsed, allocated)
+        return False
+
+
+def _tracemalloc():
+    # Imported on first use only: tracemalloc and its imports are a large share
+    # of the import time of every module that is instrumented
+    import tracemalloc
+
+    return tracemalloc
+
+
+def profiled(name: str):
+    """
+    Decorator that measures every call of a function as one call of a phase.
+
+    Args:
+        name: The name of the phase
+
+    Returns:
+        The decorator
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not Profiler._enabled:
+                return func(*args, **kwargs)
+            with _PhaseTimer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+if __name__ == "__main__":
+    # Simple validation test
+    print("=== Profiler Class Validation ===\n")
+
+    @profiled("demo.work")
+    def work(n):
+        return [i * i for i in range(n)]
+
+    # Calls are not recorded while disabled
+    work(1000)
+    print(f"Stats while disabled: {Profiler.get_stats()}")
+
+    # Record a few calls with memory tracking
+    Profiler.enable(track_memory=True)
+    for _ in range(5):
+        work(10000)
+    with Profiler.phase("demo.block"):
+        sum(range(100000))
+    Profiler.disable()
+
+    print("\n--- Flat Table ---")
+    print(Profiler.to_table())
+
+    print("\n--- JSON ---")
+    print(Profiler.to_json())
@@ -0,0 +1,297 @@
+import csv
+import json
+import queue
+import struct
+import sys
+import threading
+from array import array
+from pathlib import Path
+
+
+# Array typecodes of the supported column kinds; "str" columns are kept as lists
+_TYPECODES = {"float": "d", "int": "q"}
+
+# Leading bytes of the binary columnar format
+_MAGIC = b"PFCOL1\n"
+
+
+class ResultSink:
+    """
+    Streams study results to disk in chunks as they are produced.
+
+    Rows are buffered in memory until a chunk of chunk_rows is full, then handed
+    to a background thread that appends it to the file. At most
+    max_pending_chunks chunks wait for the writer at a time, which bounds memory
+    use; a producer only blocks on disk I/O when that queue is full.
+
+    Two formats are supported: "csv", and "columnar", a compact binary format
+    storing each chunk column by column that is read back with read_columnar().
+    """
+
+    FORMATS = ("csv", "columnar")
+
+    def __init__(self, path, columns: dict, file_format: str = "csv",
+                 chunk_rows: int = 10000, max_pending_chunks: int = 4):
+        """
+        Initialize a ResultSink instance and start its writer thread.
+
+        Args:
+            path: The file to write (overwritten if it exists)
+            columns: Dictionary {column name: kind} with kind "float", "int" or "str"
+            file_format: "csv" or "columnar"
+            chunk_rows: Number of rows per chunk handed to the writer
+            max_pending_chunks: Maximum number of chunks waiting to be written
+
+        Raises:
+            ValueError: If the format, a column kind or a size is invalid
+        """
+        if file_format not in ResultSink.FORMATS:
+            raise ValueError(f"Unknown file format '{file_format}'")
+        for name, kind in columns.items():
+            if kind != "str" and kind not in _TYPECODES:
+                raise ValueError(f"Column '{name}' has unknown kind '{kind}'")
+        if chunk_rows < 1 or max_pending_chunks < 1:
+            raise ValueError("chunk_rows and max_pending_chunks must be at least 1")
+
+        self.path = Path(path)
+        self.columns = dict(columns)
+        self.file_format = file_format
+        self.chunk_rows = chunk_rows
+        self.rows_written = 0
+
+        self._buffer = self._empty_chunk()
+        self._buffered = 0
+        self._queue = queue.Queue(maxsize=max_pending_chunks)
+        self._error = None
+        self._closed = False
+
+        self._file = open(self.path, "w", newline="") if file_format == "csv" else open(self.path, "wb")
+        self._write_header()
+        self._thread = threading.Thread(target=self._run, name=f"ResultSink-{self.path.name}", daemon=True)
+        self._thread.start()
+
+    def _empty_chunk(self):
+        return {name: [] if kind == "str" else array(_TYPECODES[kind])
+                for name, kind in self.columns.items()}
+
+    def write_row(self, row: dict):
+        """
+        Append one row.
+
+        Args:
+            row: Dictionary {column name: value} with a value for every column
+        """
+        self.write_columns({name: (value,) for name, value in row.items()})
+
+    def write_columns(self, columns: dict):
+        """
+        Append many rows given column by column.
+
+        All values are converted to their column's kind before any is buffered,
+        so a rejected call appends nothing.
+
+        Args:
+            columns: Dictionary {column name: sequence of values}, all of equal length
+
+        Raises:
+            ValueError: If the columns do not match the sink's columns or differ in length
+            TypeError: If a value does not fit its column's kind
+            RuntimeError: If the sink is closed
+        """
+        self._check_open()
+        if columns.keys() != self.columns.keys():
+            raise ValueError(f"Expected columns {list(self.columns)}, got {list(columns)}")
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same number of values")
+
+        count = lengths.pop() if lengths else 0
+        converted = {name: _convert(name, self.columns[name], values) for name, values in columns.items()}
+        start = 0
+        while start < count:
+            take = min(count - start, self.chunk_rows - self._buffered)
+            for name, values in converted.items():
+                self._buffer[name].extend(values[start:start + take])
+            self._buffered += take
+            start += take
+            if self._buffered == self.chunk_rows:
+                self._hand_off()
+
+    def flush(self):
+        """
+        Hand buffered rows to the writer and wait until everything queued is on disk.
+        """
+        self._check_open()
+        self._hand_off()
+        self._queue.join()
+        self._raise_writer_error()
+
+    def close(self):
+        """
+        Write all remaining rows, stop the writer thread and close the file.
+
+        Raises:
+            Exception: Any error raised by the writer thread
+        """
+        if self._closed:
+            return
+        try:
+            self._hand_off()
+        finally:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+            self._file.close()
+        self._raise_writer_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _check_open(self):
+        if self._closed:
+            raise RuntimeError(f"ResultSink for '{self.path}' is closed")
+        self._raise_writer_error()
+
+    def _raise_writer_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _hand_off(self):
+        if self._buffered == 0:
+            return
+        chunk, rows = self._buffer, self._buffered
+        self._buffer = self._empty_chunk()
+        self._buffered = 0
+        self._queue.put((chunk, rows))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                if self._error is None:
+                    chunk, rows = item
+                    self._write_chunk(chunk, rows)
+                    self.rows_written += rows
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _write_header(self):
+        if self.file_format == "csv":
+            csv.writer(self._file).writerow(self.columns)
+            return
+        header = json.dumps({"columns": list(self.columns.items())}).encode("utf-8")
+        self._file.write(_MAGIC + struct.pack("<I", len(header)) + header)
+
+    def _write_chunk(self, chunk: dict, rows: int):
+        if self.file_format == "csv":
+            csv.writer(self._file).writerows(zip(*chunk.values()))
+            return
+
+        parts = [struct.pack("<Q", rows)]
+        for name, values in chunk.items():
+            if self.columns[name] == "str":
+                encoded = [value.encode("utf-8") for value in values]
+                lengths = array("I", (len(value) for value in encoded))
+                parts.append(_little_endian(lengths).tobytes())
+                parts.append(b"".join(encoded))
+            else:
+                parts.append(_little_endian(values).tobytes())
+        self._file.write(b"".join(parts))
+
+
+def _convert(name: str, kind: str, values):
+    # A typed copy of a column's values, so a bad value is found before buffering
+    if kind == "str":
+        values = list(values)
+        if not all(isinstance(value, str) for value in values):
+            raise TypeError(f"Column '{name}' only accepts str values")
+        return values
+    try:
+        return array(_TYPECODES[kind], values)
+    except TypeError as e:
+        raise TypeError(f"Column '{name}' only accepts {kind} values: {e}") from e
+
+
+def _little_endian(values: array):
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def read_columnar(path):
+    """
+    Read a file written by a ResultSink in the "columnar" format.
+
+    Args:
+        path: The file to read
+
+    Returns:
+        Dictionary {column name: list of values}
+
+    Raises:
+        ValueError: If the file is not in the columnar format
+    """
+    with open(path, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"'{path}' is not a columnar result file")
+        (header_length,) = struct.unpack("<I", f.read(4))
+        columns = json.loads(f.read(header_length))["columns"]
+        data = {name: [] for name, _ in columns}
+
+        while True:
+            count_bytes = f.read(8)
+            if not count_bytes:
+                break
+            (rows,) = struct.unpack("<Q", count_bytes)
+            for name, kind in columns:
+                if kind == "str":
+                    lengths = _read_array(f, "I", rows)
+                    blob = f.read(sum(lengths))
+                    offset = 0
+                    for length in lengths:
+                        data[name].append(blob[offset:offset + length].decode("utf-8"))
+                        offset += length
+                else:
+                    data[name].extend(_read_array(f, _TYPECODES[kind], rows))
+    return data
+
+
+def _read_array(f, typecode: str, count: int):
+    values = array(typecode)
+    values.frombytes(f.read(values.itemsize * count))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    # Simple validation test
+    print("=== ResultSink Class Validation ===\n")
+
+    columns = {"step": "int", "bus": "str", "vm_pu": "float"}
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "voltages.col"
+
+        # Stream a 24-step time series of three bus voltages in chunks of 10 rows
+        with ResultSink(path, columns, file_format="columnar", chunk_rows=10) as sink:
+            for step in range(24):
+                sink.write_columns({
+                    "step": [step] * 3,
+                    "bus": ["Bus_1", "Bus_2", "Bus_3"],
+                    "vm_pu": [1.04, 1.02 - step * 0.001, 0.99 - step * 0.002],
+                })
+        print(f"Rows written: {sink.rows_written}")  # Expected output: 72
+
+        data = read_columnar(path)
+        print(f"Rows read back: {len(data['step'])}")  # Expected output: 72
+        print(f"Last row: {data['step'][-1]}, {data['bus'][-1]}, {data['vm_pu'][-1]:.3f}")
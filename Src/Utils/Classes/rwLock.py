@@ -0,0 +1,225 @@
+import threading
+from functools import wraps
+
+
+class RWLock:
+    """
+    Readers-writer lock: many concurrent readers or one writer.
+
+    Writers are preferred: once a writer waits, new readers wait until it is
+    done, so a steady stream of readers cannot starve an updater. Both sides
+    are reentrant within a thread, and the thread holding the write lock may
+    also read. Upgrading a read lock to a write lock is not possible, because
+    two threads doing so would wait for each other forever.
+
+    A pickled or copied RWLock is a new, unlocked lock.
+    """
+
+    def __init__(self):
+        """
+        Initialize an unlocked RWLock instance.
+        """
+        # The state is guarded by _mutex; _condition shares it for waiting
+        self._mutex = threading.Lock()
+        self._condition = threading.Condition(self._mutex)
+        self._readers = 0
+        self._waiting_readers = 0
+        self._waiting_writers = 0
+        self._writer = None
+        self._write_depth = 0
+
+        # Dictionary {thread id: read depth} of the threads holding read locks
+        self._read_depths = {}
+
+        # Stateless, so one instance of each serves every `with` block
+        self._read_context = _Held(self.acquire_read, self.release_read)
+        self._write_context = _Held(self.acquire_write, self.release_write)
+
+    def read(self):
+        """
+        Get a context manager that holds the lock for reading in the enclosed block.
+
+        Returns:
+            The context manager
+        """
+        return self._read_context
+
+    def write(self):
+        """
+        Get a context manager that holds the lock for writing in the enclosed block.
+
+        Returns:
+            The context manager
+        """
+        return self._write_context
+
+    def acquire_read(self):
+        """
+        Acquire the lock for reading, waiting for writers if needed.
+        """
+        me = threading.get_ident()
+        with self._mutex:
+            depth = self._read_depths.get(me, 0)
+            if depth == 0 and self._writer != me:
+                self._waiting_readers += 1
+                try:
+                    while self._writer is not None or self._waiting_writers:
+                        self._condition.wait()
+                finally:
+                    self._waiting_readers -= 1
+            self._read_depths[me] = depth + 1
+            self._readers += 1
+
+    def release_read(self):
+        """
+        Release the lock held for reading by this thread.
+        """
+        me = threading.get_ident()
+        with self._mutex:
+            depth = self._read_depths[me] - 1
+            if depth:
+                self._read_depths[me] = depth
+            else:
+                del self._read_depths[me]
+            self._readers -= 1
+            if self._readers == 0 and self._waiting_writers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        """
+        Acquire the lock for writing, waiting for readers and other writers if needed.
+
+        Raises:
+            RuntimeError: If the thread holds the lock for reading only
+        """
+        me = threading.get_ident()
+        # Only this thread can set _writer to its own id or clear it, so a
+        # nested acquire needs no mutex
+        if self._writer == me:
+            self._write_depth += 1
+            return
+        with self._mutex:
+            if me in self._read_depths:
+                raise RuntimeError("Cannot acquire a write lock while holding a read lock")
+
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self):
+        """
+        Release the lock held for writing by this thread.
+        """
+        if self._write_depth > 1:
+            self._write_depth -= 1
+            return
+        with self._mutex:
+            self._write_depth = 0
+            self._writer = None
+            if self._waiting_readers or self._waiting_writers:
+                self._condition.notify_all()
+
+    def __reduce__(self):
+        return RWLock, ()
+
+    def __copy__(self):
+        return RWLock()
+
+    def __deepcopy__(self, memo):
+        return RWLock()
+
+
+class _Held:
+    """
+    Context manager calling an acquire and a release function.
+    """
+
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire, release):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self):
+        self._acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._release()
+        return False
+
+
+def read_locked(method):
+    """
+    Decorator that runs a method while holding its instance's lock for reading.
+
+    Args:
+        method: A method of a class with an RWLock in its lock attribute
+
+    Returns:
+        The wrapped method
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.lock.acquire_read()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.lock.release_read()
+    return wrapper
+
+
+def write_locked(method):
+    """
+    Decorator that runs a method while holding its instance's lock for writing.
+
+    Args:
+        method: A method of a class with an RWLock in its lock attribute
+
+    Returns:
+        The wrapped method
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.lock.acquire_write()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.lock.release_write()
+    return wrapper
+
+
+if __name__ == "__main__":
+    import time
+
+    # Simple validation test
+    print("=== RWLock Class Validation ===\n")
+
+    lock = RWLock()
+    events = []
+
+    def reader(name):
+        with lock.read():
+            events.append(f"{name} reading")
+            time.sleep(0.05)
+            events.append(f"{name} done")
+
+    def writer():
+        with lock.write():
+            events.append("writer writing")
+
+    threads = [threading.Thread(target=reader, args=(f"reader{i}",)) for i in range(2)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join()
+
+    # Expected output: both readers read at the same time, the writer runs after both are done
+    print("\n".join(events))
@@ -0,0 +1,229 @@
+import math
+
+
+class StreamingStats:
+    """
+    Summary statistics of a stream of values, kept in constant memory.
+
+    Used to collect results of Monte Carlo and other sampled studies without
+    storing every sample. Mean and variance use Welford's algorithm, quantiles
+    are estimated with the P-square algorithm (Jain and Chlamtac, 1985), and
+    exceedance probabilities are counted for thresholds fixed up front.
+    """
+
+    def __init__(self, quantiles: tuple = (0.05, 0.5, 0.95), thresholds: tuple = ()):
+        """
+        Initialize a StreamingStats instance.
+
+        Args:
+            quantiles: Probabilities (between 0 and 1) of the quantiles to estimate
+            thresholds: Values whose exceedance probability P(x > threshold) is counted
+
+        Raises:
+            ValueError: If a quantile probability is not strictly between 0 and 1
+        """
+        for p in quantiles:
+            if not 0.0 < p < 1.0:
+                raise ValueError(f"Quantile probability {p} must be between 0 and 1")
+
+        self.count = 0
+        self.mean = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._m2 = 0.0
+        self._quantiles = {p: _P2Quantile(p) for p in quantiles}
+        self._exceedances = {threshold: 0 for threshold in thresholds}
+
+    def add(self, value: float):
+        """
+        Add one value to the statistics.
+
+        Args:
+            value: The sampled value
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        for estimator in self._quantiles.values():
+            estimator.add(value)
+        for threshold in self._exceedances:
+            if value > threshold:
+                self._exceedances[threshold] += 1
+
+    def add_many(self, values):
+        """
+        Add every value of an iterable to the statistics.
+
+        Args:
+            values: Iterable of sampled values
+        """
+        for value in values:
+            self.add(value)
+
+    @property
+    def variance(self):
+        """
+        Returns:
+            The sample variance, or nan with fewer than two values
+        """
+        if self.count < 2:
+            return math.nan
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self):
+        """
+        Returns:
+            The sample standard deviation, or nan with fewer than two values
+        """
+        return math.sqrt(self.variance)
+
+    def quantile(self, p: float):
+        """
+        Get the estimate of a quantile.
+
+        Args:
+            p: The probability of a quantile given at construction
+
+        Returns:
+            The estimated quantile, or nan if no values were added
+
+        Raises:
+            ValueError: If the quantile was not requested at construction
+        """
+        if p not in self._quantiles:
+            raise ValueError(f"Quantile {p} is not tracked")
+        return self._quantiles[p].value()
+
+    def exceedance_probability(self, threshold: float):
+        """
+        Get the fraction of values greater than a threshold.
+
+        Args:
+            threshold: A threshold given at construction
+
+        Returns:
+            The exceedance probability, or nan if no values were added
+
+        Raises:
+            ValueError: If the threshold was not requested at construction
+        """
+        if threshold not in self._exceedances:
+            raise ValueError(f"Threshold {threshold} is not tracked")
+        if self.count == 0:
+            return math.nan
+        return self._exceedances[threshold] / self.count
+
+    def summary(self):
+        """
+        Get all statistics as a dictionary.
+
+        Returns:
+            Dictionary with count, mean, std, min, max, quantiles {p: value}
+            and exceedance probabilities {threshold: probability}
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean if self.count else math.nan,
+            "std": self.std,
+            "min": self.min if self.count else math.nan,
+            "max": self.max if self.count else math.nan,
+            "quantiles": {p: self.quantile(p) for p in self._quantiles},
+            "exceedance": {t: self.exceedance_probability(t) for t in self._exceedances},
+        }
+
+
+class _P2Quantile:
+    """
+    P-square estimator of a single quantile using five markers.
+    """
+
+    __slots__ = ("p", "heights", "positions", "desired", "increments")
+
+    def __init__(self, p: float):
+        self.p = p
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1.0, 1.0 + 2.0 * p, 1.0 + 4.0 * p, 3.0 + 2.0 * p, 5.0]
+        self.increments = [0.0, p / 2.0, p, (1.0 + p) / 2.0, 1.0]
+
+    def add(self, x: float):
+        h = self.heights
+        if len(h) < 5:
+            h.append(x)
+            if len(h) == 5:
+                h.sort()
+            return
+
+        n = self.positions
+        if x < h[0]:
+            h[0] = x
+            k = 0
+        elif x >= h[4]:
+            h[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= h[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # Move the three middle markers towards their desired positions
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not h[i - 1] < candidate < h[i + 1]:
+                    candidate = h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+                h[i] = candidate
+                n[i] += step
+
+    def _parabolic(self, i: int, step: int):
+        h = self.heights
+        n = self.positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1]))
+
+    def value(self):
+        h = self.heights
+        if not h:
+            return math.nan
+        if len(h) < 5:
+            # Too few values for the markers; interpolate the sorted values directly
+            ordered = sorted(h)
+            rank = self.p * (len(ordered) - 1)
+            low = int(rank)
+            high = min(low + 1, len(ordered) - 1)
+            return ordered[low] + (rank - low) * (ordered[high] - ordered[low])
+        return h[2]
+
+
+if __name__ == "__main__":
+    import random
+
+    # Simple validation test
+    print("=== StreamingStats Class Validation ===\n")
+
+    # Stream samples of a normally distributed load, e.g. Load.mw ~ N(50, 5)
+    rng = random.Random(0)
+    stats = StreamingStats(quantiles=(0.05, 0.5, 0.95), thresholds=(60.0,))
+    for _ in range(100000):
+        stats.add(rng.gauss(50.0, 5.0))
+
+    print(f"Count: {stats.count}")
+    print(f"Mean: {stats.mean:.3f}")  # Expected output: about 50.0
+    print(f"Std: {stats.std:.3f}")  # Expected output: about 5.0
+    print(f"5% / 50% / 95% quantiles: {stats.quantile(0.05):.3f} / "
+          f"{stats.quantile(0.5):.3f} / {stats.quantile(0.95):.3f}")  # Expected output: about 41.8 / 50.0 / 58.2
+    print(f"P(mw > 60): {stats.exceedance_probability(60.0):.4f}")  # Expected output: about 0.0228
@@ -5,9 +5,17 @@ class Transformer:
     Represents a transformer in a power system network.
 
     A transformer connects two buses and has series impedance (r + jx).
+    Its thermal rating limits the apparent power flowing through it.
+
+    The ideal transformer on the bus1 side has a complex ratio
+    tap_ratio * exp(j * phase_shift_deg). A load tap changer (LTC) can be enabled
+    to move tap_ratio in discrete steps so that a regulated bus voltage stays
+    within voltage_target +/- voltage_deadband.
     """
 
-    def __init__(self, name: str, bus1_name: str, bus2_name: str, r: float, x: float):
+    def __init__(self, name: str, bus1_name: str, bus2_name: str, r: float, x: float,
+                 mva_rating: float = float("inf"), tap_ratio: float = 1.0,
+                 phase_shift_deg: float = 0.0):
         """
         Initialize a Transformer instance.
 
@@ -17,15 +25,128 @@ class Transformer:
             bus2_name: Name of the second bus (typically low voltage side)
             r: Resistance in per-unit or ohms
             x: Reactance in per-unit or ohms
+            mva_rating: Thermal rating in MVA, unlimited by default
+            tap_ratio: Off-nominal tap ratio in per-unit on the bus1 side
+            phase_shift_deg: Phase shift angle in degrees, bus1 side leading bus2 side
+
+        Raises:
+            ValueError: If mva_rating or tap_ratio is not positive
         """
         self.name = name
         self.bus1_name = bus1_name
         self.bus2_name = bus2_name
         self.r = r
         self.x = x
+        self.mva_rating = mva_rating
+        self.tap_ratio = tap_ratio
+        self.phase_shift_deg = phase_shift_deg
+
+        # Load tap changer settings, inactive until enable_tap_control() is called
+        self.regulated_bus_name = None
+        self.voltage_target = 1.0
+        self.voltage_deadband = 0.0
+        self.tap_min = tap_ratio
+        self.tap_max = tap_ratio
+        self.tap_step = 0.0
+
+        self.validate()
+
+    def validate(self):
+        """
+        Check the transformer's model data.
+
+        Called by the constructor and by Circuit.update(), so changed attributes
+        obey the same rules as a new transformer.
+
+        Raises:
+            ValueError: If mva_rating or tap_ratio is not positive, or tap control
+                        is enabled with invalid settings
+        """
+        if self.mva_rating <= 0:
+            raise ValueError(f"Transformer '{self.name}' must have a positive mva_rating")
+        if self.tap_ratio <= 0:
+            raise ValueError(f"Transformer '{self.name}' must have a positive tap_ratio")
+        if self.regulated_bus_name is not None:
+            self._check_tap_control(self.voltage_deadband, self.tap_min, self.tap_max, self.tap_step)
+
+    def enable_tap_control(self, regulated_bus_name: str, voltage_target: float,
+                           voltage_deadband: float = 0.01, tap_min: float = 0.9,
+                           tap_max: float = 1.1, tap_step: float = 0.00625):
+        """
+        Turn on automatic tap control for voltage regulation.
+
+        Args:
+            regulated_bus_name: Name of the bus whose voltage is regulated
+            voltage_target: Target voltage magnitude in per-unit
+            voltage_deadband: Allowed deviation from the target in per-unit
+            tap_min: Lowest tap ratio in per-unit
+            tap_max: Highest tap ratio in per-unit
+            tap_step: Tap ratio change of one tap position in per-unit
+
+        Raises:
+            ValueError: If the tap range or step is invalid or the deadband is negative
+        """
+        self._check_tap_control(voltage_deadband, tap_min, tap_max, tap_step)
+
+        self.regulated_bus_name = regulated_bus_name
+        self.voltage_target = voltage_target
+        self.voltage_deadband = voltage_deadband
+        self.tap_min = tap_min
+        self.tap_max = tap_max
+        self.tap_step = tap_step
+
+    def _check_tap_control(self, voltage_deadband: float, tap_min: float, tap_max: float, tap_step: float):
+        if not 0 < tap_min <= tap_max:
+            raise ValueError(f"Transformer '{self.name}' has an invalid tap range [{tap_min}, {tap_max}]")
+        if tap_step <= 0:
+            raise ValueError(f"Transformer '{self.name}' must have a positive tap_step")
+        if voltage_deadband < 0:
+            raise ValueError(f"Transformer '{self.name}' must have a non-negative voltage_deadband")
+
+    def disable_tap_control(self):
+        """
+        Turn off automatic tap control, keeping the present tap ratio fixed.
+        """
+        self.regulated_bus_name = None
+
+    def propose_tap(self, voltage: float, dv_dtap: float):
+        """
+        Compute the tap ratio that brings the regulated voltage back into its deadband.
+
+        The update uses the sensitivity of the regulated voltage to the tap ratio
+        at the present operating point, so a power-flow solver can apply it inside
+        its iteration loop instead of re-solving after every tap step. The result
+        is rounded to a whole tap position and limited to [tap_min, tap_max].
+
+        Args:
+            voltage: Present voltage magnitude at the regulated bus in per-unit
+            dv_dtap: Sensitivity of the regulated voltage to the tap ratio
+
+        Returns:
+            The proposed tap ratio (the present one if control is off or the
+            voltage is within the deadband)
+
+        Raises:
+            ValueError: If the sensitivity is zero
+        """
+        if self.regulated_bus_name is None:
+            return self.tap_ratio
+
+        error = self.voltage_target - voltage
+        if abs(error) <= self.voltage_deadband:
+            return self.tap_ratio
+        if dv_dtap == 0:
+            raise ValueError(f"Transformer '{self.name}' has zero voltage-to-tap sensitivity")
+
+        tap = self.tap_ratio + error / dv_dtap
+        positions = round((tap - self.tap_min) / self.tap_step)
+        tap = self.tap_min + positions * self.tap_step
+        return min(max(tap, self.tap_min), self.tap_max)
 
     def __repr__(self):
-        return f"Transformer(name='{self.name}', bus1='{self.bus1_name}', bus2='{self.bus2_name}', r={self.r}, x={self.x})"
+        return (f"Transformer(name='{self.name}', bus1='{self.bus1_name}', bus2='{self.bus2_name}', "
+                f"r={self.r}, x={self.x}, mva_rating={self.mva_rating}, "
+                f"tap={self.tap_ratio}, shift={self.phase_shift_deg})")
 
 
 if __name__ == "__main__":
@@ -51,4 +172,13 @@ if __name__ == "__main__":
     t3 = Transformer("T3", "Bus 3", "Bus 4", 0.015, 0.12)
 
     print(repr(t2))
-    print(repr(t3))
\ No newline at end of file
+    print(repr(t3))
+
+    # Test tap changer control
+    print("\n--- Tap Changer Control ---")
+    t4 = Transformer("T4", "Bus 4", "Bus 5", 0.005, 0.08, tap_ratio=1.0, phase_shift_deg=-30.0)
+    t4.enable_tap_control("Bus 5", voltage_target=1.0, voltage_deadband=0.005)
+    print(repr(t4))
+    # Regulated voltage 0.97 p.u. with dV/dtap = -1.0 (lower tap raises the LV side)
+    print(f"Proposed tap at 0.97 p.u.: {t4.propose_tap(0.97, -1.0):.5f}")  # Expected output: 0.96875
+    print(f"Proposed tap at 0.998 p.u.: {t4.propose_tap(0.998, -1.0):.5f}")  # Expected output: 1.00000
\ No newline at end of file
@@ -3,11 +3,12 @@ class TransmissionLine:
     Represents a transmission line in a power system network.
 
     A transmission line connects two buses and has series impedance (r + jx)
-    and shunt admittance (g + jb).
+    and shunt admittance (g + jb). Its thermal rating limits the apparent power
+    flowing through it.
     """
 
     def __init__(self, name: str, bus1_name: str, bus2_name: str,
-                 r: float, x: float, g: float, b: float):
+                 r: float, x: float, g: float, b: float, mva_rating: float = float("inf")):
         """
         Initialize a TransmissionLine instance.
 
@@ -19,6 +20,10 @@ class TransmissionLine:
             x: Series reactance in per-unit or ohms
             g: Shunt conductance in per-unit or siemens
             b: Shunt susceptance in per-unit or siemens
+            mva_rating: Thermal rating in MVA, unlimited by default
+
+        Raises:
+            ValueError: If mva_rating is not positive
         """
         self.name = name
         self.bus1_name = bus1_name
@@ -27,10 +32,27 @@ class TransmissionLine:
         self.x = x
         self.g = g
         self.b = b
+        self.mva_rating = mva_rating
+
+        self.validate()
+
+    def validate(self):
+        """
+        Check the transmission line's model data.
+
+        Called by the constructor and by Circuit.update(), so changed attributes
+        obey the same rules as a new line.
+
+        Raises:
+            ValueError: If mva_rating is not positive
+        """
+        if self.mva_rating <= 0:
+            raise ValueError(f"Transmission line '{self.name}' must have a positive mva_rating")
 
     def __repr__(self):
         return (f"TransmissionLine(name='{self.name}', bus1='{self.bus1_name}', "
-                f"bus2='{self.bus2_name}', r={self.r}, x={self.x}, g={self.g}, b={self.b})")
+                f"bus2='{self.bus2_name}', r={self.r}, x={self.x}, g={self.g}, b={self.b}, "
+                f"mva_rating={self.mva_rating})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,3 @@
+"""
+Utilities of the power system simulator.
+"""
@@ -0,0 +1,51 @@
+"""
+Power system simulator.
+
+The public classes are available at the top level, e.g. ``from Src import Circuit``.
+They are imported on first access (PEP 562), so ``import Src`` itself is cheap
+and a process only pays for the modules it uses.
+"""
+
+import importlib
+
+# Public name -> module that defines it
+_EXPORTS = {
+    "Bus": "Src.Utils.Classes.bus",
+    "Transformer": "Src.Utils.Classes.transformer",
+    "TransmissionLine": "Src.Utils.Classes.transmissionLine",
+    "Generator": "Src.Utils.Classes.generator",
+    "Load": "Src.Utils.Classes.load",
+    "Circuit": "Src.Utils.Classes.circuit",
+    "CircuitDiff": "Src.Utils.Classes.circuitDiff",
+    "save_circuit": "Src.Utils.Classes.circuitFile",
+    "load_circuit": "Src.Utils.Classes.circuitFile",
+    "Journal": "Src.Utils.Classes.journal",
+    "DerivedCache": "Src.Utils.Classes.derivedCache",
+    "AreaPartition": "Src.Utils.Classes.areaPartition",
+    "EquipmentIndexes": "Src.Utils.Classes.equipmentIndex",
+    "CowDict": "Src.Utils.Classes.cowDict",
+    "PowerFlowResults": "Src.Utils.Classes.powerFlowResults",
+    "ResultSink": "Src.Utils.Classes.resultSink",
+    "read_columnar": "Src.Utils.Classes.resultSink",
+    "StreamingStats": "Src.Utils.Classes.streamingStats",
+    "JobServer": "Src.Utils.Classes.jobServer",
+    "BatchRunner": "Src.Utils.Classes.batchRunner",
+    "Profiler": "Src.Utils.Classes.profiler",
+    "profiled": "Src.Utils.Classes.profiler",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'Src' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module), name)
+    # Cache it so later lookups do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
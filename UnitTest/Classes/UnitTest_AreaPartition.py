@@ -0,0 +1,121 @@
+import unittest
+import sys
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.areaPartition import AreaPartition
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.bus import Bus
+
+
+class TestAreaPartition(unittest.TestCase):
+    """Unit tests for the AreaPartition class."""
+
+    def setUp(self):
+        """Reset the Bus registry before each test."""
+        Bus._bus_counter = 0
+        Bus._bus_registry.clear()
+
+    def _build_two_rings(self):
+        """Build two rings of four buses joined by one tie line and one tie transformer."""
+        circuit = Circuit("Two Rings")
+        for i in range(1, 9):
+            circuit.add_bus(f"Bus{i}", 230.0)
+        for i in range(1, 5):
+            circuit.add_transmission_line(f"LineA{i}", f"Bus{i}", f"Bus{i % 4 + 1}", 0.01, 0.1, 0.0, 0.02)
+            circuit.add_transmission_line(f"LineB{i}", f"Bus{i + 4}", f"Bus{i % 4 + 5}", 0.01, 0.1, 0.0, 0.02)
+        circuit.add_transmission_line("Tie", "Bus3", "Bus5", 0.01, 0.1, 0.0, 0.02)
+        circuit.add_transformer("TieT", "Bus4", "Bus6", 0.0, 0.1)
+        return circuit
+
+    def _build_chain(self, length: int):
+        """Build a chain of buses connected by lines."""
+        circuit = Circuit("Chain")
+        for i in range(length):
+            circuit.add_bus(f"Bus{i}", 230.0)
+        for i in range(length - 1):
+            circuit.add_transmission_line(f"Line{i}", f"Bus{i}", f"Bus{i + 1}", 0.01, 0.1, 0.0, 0.0)
+        return circuit
+
+    def test_two_rings(self):
+        """Test that two weakly connected rings are split along their ties."""
+        partition = self._build_two_rings().partition(2)
+
+        self.assertEqual(len(partition), 2)
+        self.assertEqual({frozenset(area) for area in partition.areas},
+                         {frozenset(["Bus1", "Bus2", "Bus3", "Bus4"]), frozenset(["Bus5", "Bus6", "Bus7", "Bus8"])})
+        self.assertEqual(sorted(partition.tie_branches),
+                         [("transformers", "TieT"), ("transmission_lines", "Tie")])
+
+    def test_boundary_and_interior_buses(self):
+        """Test that boundary buses are the tie branch ends and the rest are interior."""
+        partition = self._build_two_rings().partition(2)
+        area = partition.area_of["Bus1"]
+
+        self.assertEqual(sorted(partition.boundary_buses[area]), ["Bus3", "Bus4"])
+        self.assertEqual(sorted(partition.interior_buses(area)), ["Bus1", "Bus2"])
+        self.assertEqual(partition.neighbouring_areas(area), [1 - area])
+
+    def test_every_bus_in_one_area(self):
+        """Test that every bus is assigned to exactly one area."""
+        circuit = self._build_chain(23)
+        partition = circuit.partition(4)
+
+        buses = [bus for area in partition.areas for bus in area]
+        self.assertEqual(sorted(buses), sorted(circuit.buses))
+        self.assertEqual(len(partition.area_of), 23)
+
+    def test_balanced_contiguous_chain(self):
+        """Test that a chain is cut into balanced pieces with one tie between neighbours."""
+        partition = self._build_chain(20).partition(4)
+
+        self.assertEqual([len(area) for area in partition.areas], [5, 5, 5, 5])
+        self.assertEqual(len(partition.tie_branches), 3)
+
+    def test_disconnected_components(self):
+        """Test that isolated buses and islands are partitioned without ties."""
+        circuit = self._build_chain(4)
+        circuit.add_bus("Island", 115.0)
+
+        partition = circuit.partition(2)
+
+        self.assertEqual(sum(len(area) for area in partition.areas), 5)
+        self.assertLessEqual(len(partition.tie_branches), 1)
+
+    def test_single_area(self):
+        """Test that one area contains every bus and has no boundary."""
+        partition = AreaPartition.of(self._build_two_rings(), 1)
+
+        self.assertEqual(len(partition.areas[0]), 8)
+        self.assertEqual(partition.tie_branches, [])
+        self.assertEqual(partition.boundary_buses, [[]])
+
+    def test_invalid_number_of_areas(self):
+        """Test that zero areas or more areas than buses raise ValueError."""
+        circuit = self._build_chain(3)
+
+        with self.assertRaises(ValueError):
+            circuit.partition(0)
+        with self.assertRaises(ValueError):
+            circuit.partition(4)
+
+    def test_partition_follows_topology_changes(self):
+        """Test that a partition after a topology change uses the new branches."""
+        circuit = self._build_two_rings()
+        circuit.partition(2)
+
+        circuit.remove("transformers", "TieT")
+        partition = circuit.partition(2)
+
+        self.assertEqual(partition.tie_branches, [("transmission_lines", "Tie")])
+
+
+if __name__ == '__main__':
+    unittest.main()
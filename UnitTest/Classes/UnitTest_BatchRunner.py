@@ -0,0 +1,200 @@
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.batchRunner import BatchRunner
+from Src.Utils.Classes.circuitFile import save_circuit
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.bus import Bus
+
+
+def total_load_mw(circuit):
+    """Study used by the tests: total load, failing on negative loads."""
+    if any(load.mw < 0 for load in circuit.loads.values()):
+        raise ValueError("negative load")
+    return sum(load.mw for load in circuit.loads.values())
+
+
+def crash_on_name(circuit):
+    """Study used by the tests: kills the worker process for the circuit named 'Crash'."""
+    if circuit.name == "Crash":
+        os._exit(1)
+    return len(circuit.buses)
+
+
+def exit_on_name(circuit):
+    """Study used by the tests: calls sys.exit(3) for the circuit named 'Exit'."""
+    if circuit.name == "Exit":
+        sys.exit(3)
+    return len(circuit.buses)
+
+
+def lock_on_name(circuit):
+    """Study used by the tests: returns an unpicklable result for the circuit named 'Lock'."""
+    if circuit.name == "Lock":
+        return threading.Lock()
+    return len(circuit.buses)
+
+
+def hang_on_name(circuit):
+    """Study used by the tests: never finishes for the circuit named 'Hang'."""
+    while circuit.name == "Hang":
+        time.sleep(0.01)
+    return len(circuit.buses)
+
+
+def journal_length(circuit):
+    """Study used by the tests: the number of journal entries the worker sees."""
+    return len(circuit.journal)
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Unit tests for the BatchRunner class."""
+
+    def setUp(self):
+        """Reset the Bus registry before each test."""
+        Bus._bus_counter = 0
+        Bus._bus_registry.clear()
+
+    def _build_case(self, name: str, num_buses: int):
+        """Build a circuit with one 10 MW load per bus."""
+        circuit = Circuit(name)
+        for i in range(num_buses):
+            circuit.add_bus(f"Bus{i}", 230.0)
+            circuit.add_load(f"Load{i}", f"Bus{i}", 10.0, 2.0)
+        return circuit
+
+    def test_results_in_case_order(self):
+        """Test that results are returned in the order of the cases."""
+        cases = [self._build_case(f"Case{i}", i) for i in range(1, 9)]
+
+        results = BatchRunner(total_load_mw, max_workers=2).run(cases)
+
+        self.assertEqual([result.name for result in results], [f"Case{i}" for i in range(1, 9)])
+        self.assertEqual([result.value for result in results], [10.0 * i for i in range(1, 9)])
+        self.assertTrue(all(result.ok and result.error is None for result in results))
+
+    def test_study_exception_isolated(self):
+        """Test that a case whose study raises is reported without failing the others."""
+        cases = [self._build_case(f"Case{i}", 3) for i in range(4)]
+        cases[1].update("loads", "Load0", mw=-1.0)
+
+        results = BatchRunner(total_load_mw, max_workers=1, chunks_per_worker=1).run(cases)
+
+        self.assertEqual([result.ok for result in results], [True, False, True, True])
+        self.assertEqual(results[1].error, "ValueError: negative load")
+        self.assertIsNone(results[1].value)
+
+    def test_worker_crash_isolated(self):
+        """Test that a case killing its worker process only fails that case."""
+        cases = [self._build_case("Crash" if i == 2 else f"Case{i}", 2) for i in range(5)]
+
+        results = BatchRunner(crash_on_name, max_workers=2, chunks_per_worker=1).run(cases)
+
+        self.assertEqual([result.ok for result in results], [True, True, False, True, True])
+        self.assertEqual(results[2].error, "Worker process terminated")
+        self.assertEqual(results[0].value, 2)
+
+    def test_system_exit_isolated(self):
+        """Test that a study calling sys.exit() only fails its own case."""
+        cases = [self._build_case("Exit" if i == 1 else f"Case{i}", 2) for i in range(3)]
+
+        results = BatchRunner(exit_on_name, max_workers=1, chunks_per_worker=1).run(cases)
+
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertEqual(results[1].error, "SystemExit: 3")
+        self.assertEqual(results[2].value, 2)
+
+    def test_unpicklable_result_isolated(self):
+        """Test that a case whose result cannot be pickled only fails that case."""
+        cases = [self._build_case("Lock" if i == 1 else f"Case{i}", 2) for i in range(4)]
+
+        results = BatchRunner(lock_on_name, max_workers=2, chunks_per_worker=1).run(cases)
+
+        self.assertEqual([result.ok for result in results], [True, False, True, True])
+        self.assertIn("pickle", results[1].error)
+        self.assertEqual(results[3].value, 2)
+
+    def test_case_timeout(self):
+        """Test that a case running longer than case_timeout fails without hanging the batch."""
+        cases = [self._build_case("Hang" if i == 1 else f"Case{i}", 2) for i in range(3)]
+
+        results = BatchRunner(hang_on_name, max_workers=1, case_timeout=0.2).run(cases)
+
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertTrue(results[1].error.startswith("TimeoutError"))
+        self.assertEqual(results[2].value, 2)
+
+    def test_model_file_cases(self):
+        """Test that model files and circuits can be mixed in one batch."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "regional.json"
+            save_circuit(self._build_case("Regional", 4), path)
+
+            results = BatchRunner(total_load_mw, max_workers=2).run([path, self._build_case("Local", 2)])
+
+        self.assertEqual(results[0].name, str(path))
+        self.assertEqual([result.value for result in results], [40.0, 20.0])
+
+    def test_forked_circuit_case(self):
+        """Test that forked (copy-on-write) circuits can be sent to the workers."""
+        base = self._build_case("Base", 3)
+        scenario = base.fork("Scenario")
+        scenario.update("loads", "Load0", mw=50.0)
+
+        results = BatchRunner(total_load_mw, max_workers=1).run([base, scenario])
+
+        self.assertEqual([result.value for result in results], [30.0, 70.0])
+
+    def test_cases_sent_without_history(self):
+        """Test that circuits reach the workers without their journal but with all equipment."""
+        case = self._build_case("Case", 5)
+        case.update("loads", "Load0", mw=20.0)
+
+        results = BatchRunner(journal_length, max_workers=1).run([case])
+        totals = BatchRunner(total_load_mw, max_workers=1).run([case])
+
+        self.assertEqual(results[0].value, 0)
+        self.assertEqual(totals[0].value, 60.0)
+        self.assertEqual(len(case.journal), 11)
+
+    def test_make_chunks(self):
+        """Test that large cases get their own chunk and small cases are grouped."""
+        runner = BatchRunner(total_load_mw, max_workers=2, chunks_per_worker=1)
+        sizes = [1, 50, 2, 1, 3]
+        cases = [(i, f"Case{i}", self._build_case(f"Case{i}", size)) for i, size in enumerate(sizes)]
+
+        chunks = runner.make_chunks(cases)
+
+        self.assertEqual([item[0] for item in chunks[0]], [1])
+        self.assertEqual(sorted(item[0] for chunk in chunks for item in chunk), [0, 1, 2, 3, 4])
+        self.assertEqual(len(chunks), 2)
+
+    def test_empty_batch(self):
+        """Test that an empty batch returns no results."""
+        self.assertEqual(BatchRunner(total_load_mw, max_workers=1).run([]), [])
+
+    def test_invalid_parameters(self):
+        """Test that invalid worker or chunk counts or timeouts raise ValueError."""
+        with self.assertRaises(ValueError):
+            BatchRunner(total_load_mw, max_workers=0)
+        with self.assertRaises(ValueError):
+            BatchRunner(total_load_mw, chunks_per_worker=0)
+        with self.assertRaises(ValueError):
+            BatchRunner(total_load_mw, case_timeout=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import sys
+import threading
 
 # Add project root to path for imports using centralized paths
 from pathlib import Path
@@ -112,5 +113,21 @@ class TestBus(unittest.TestCase):
         self.assertEqual(indices, [0, 1, 2, 3, 4])
 
 
+    def test_bus_index_unique_across_threads(self):
+        """Test that buses created concurrently from several threads get unique indices."""
+        def create(thread_id):
+            for i in range(200):
+                Bus(f"T{thread_id} Bus {i}", 20.0)
+
+        threads = [threading.Thread(target=create, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(Bus._bus_counter, 800)
+        self.assertEqual(sorted(Bus._bus_registry.values()), list(range(800)))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import unittest
 import sys
+import threading
 
 # Add project root to path for imports using centralized paths
 from pathlib import Path
@@ -91,6 +92,14 @@ class TestCircuit(unittest.TestCase):
         self.assertEqual(circuit.transformers["T1"].r, 0.01)
         self.assertEqual(circuit.transformers["T1"].x, 0.05)
 
+    def test_add_transformer_with_tap_and_shift(self):
+        """Test adding an off-nominal, phase-shifting transformer."""
+        circuit = Circuit("Test Circuit")
+        circuit.add_transformer("T1", "Bus1", "Bus2", 0.01, 0.05, tap_ratio=0.975, phase_shift_deg=5.0)
+
+        self.assertEqual(circuit.transformers["T1"].tap_ratio, 0.975)
+        self.assertEqual(circuit.transformers["T1"].phase_shift_deg, 5.0)
+
     def test_add_duplicate_transformer(self):
         """Test that adding a duplicate transformer raises ValueError."""
         circuit = Circuit("Test Circuit")
@@ -140,6 +149,39 @@ class TestCircuit(unittest.TestCase):
         self.assertEqual(circuit.generators["Gen1"].voltage_setpoint, 1.05)
         self.assertEqual(circuit.generators["Gen1"].mw_setpoint, 100.0)
 
+    def test_add_generator_with_mvar_limits(self):
+        """Test adding a generator with reactive power limits."""
+        circuit = Circuit("Test Circuit")
+        circuit.add_generator("Gen1", "Bus1", 1.05, 100.0, mvar_min=-30.0, mvar_max=80.0)
+
+        self.assertEqual(circuit.generators["Gen1"].mvar_min, -30.0)
+        self.assertEqual(circuit.generators["Gen1"].mvar_max, 80.0)
+
+    def test_add_generator_with_subtransient_reactance(self):
+        """Test adding a generator with a fault source reactance."""
+        circuit = Circuit("Test Circuit")
+        circuit.add_generator("Gen1", "Bus1", 1.05, 100.0, x_subtransient=0.2)
+
+        self.assertEqual(circuit.generators["Gen1"].x_subtransient, 0.2)
+
+    def test_add_generator_with_cost_curve(self):
+        """Test adding a generator with MW limits and a cost curve."""
+        circuit = Circuit("Test Circuit")
+        circuit.add_generator("Gen1", "Bus1", 1.05, 100.0, mw_min=10.0, mw_max=250.0,
+                              cost_coefficients=(0.0, 25.0))
+
+        self.assertEqual(circuit.generators["Gen1"].mw_max, 250.0)
+        self.assertEqual(circuit.generators["Gen1"].cost(100.0), 2500.0)
+
+    def test_add_branches_with_mva_rating(self):
+        """Test adding a transformer and a transmission line with thermal ratings."""
+        circuit = Circuit("Test Circuit")
+        circuit.add_transformer("T1", "Bus1", "Bus2", 0.01, 0.05, mva_rating=100.0)
+        circuit.add_transmission_line("Line1", "Bus1", "Bus2", 0.02, 0.06, 0.0, 0.04, mva_rating=250.0)
+
+        self.assertEqual(circuit.transformers["T1"].mva_rating, 100.0)
+        self.assertEqual(circuit.transmission_lines["Line1"].mva_rating, 250.0)
+
     def test_add_duplicate_generator(self):
         """Test that adding a duplicate generator raises ValueError."""
         circuit = Circuit("Test Circuit")
@@ -258,6 +300,309 @@ class TestCircuit(unittest.TestCase):
         self.assertEqual(len(circuit.transformers), 3)
         self.assertEqual(len(circuit.generators), 4)
 
+    def _build_base_circuit(self):
+        """Build a small circuit used by the fork tests."""
+        circuit = Circuit("Base")
+        circuit.add_bus("Bus1", 230.0)
+        circuit.add_bus("Bus2", 230.0)
+        circuit.add_transmission_line("Line1", "Bus1", "Bus2", 0.02, 0.06, 0.0, 0.04)
+        circuit.add_generator("Gen1", "Bus1", 1.05, 100.0)
+        circuit.add_load("Load1", "Bus2", 50.0, 25.0)
+        return circuit
+
+    def test_fork_shares_equipment(self):
+        """Test that a fork sees the parent's equipment without copying it."""
+        base = self._build_base_circuit()
+        scenario = base.fork("Scenario")
+
+        self.assertEqual(scenario.name, "Scenario")
+        self.assertEqual(list(scenario.buses), ["Bus1", "Bus2"])
+        self.assertIs(scenario.loads["Load1"], base.loads["Load1"])
+
+    def test_fork_default_name(self):
+        """Test that a fork keeps the parent's name by default."""
+        base = self._build_base_circuit()
+
+        self.assertEqual(base.fork().name, "Base")
+
+    def test_fork_edit_copies_on_write(self):
+        """Test that editing equipment in a fork does not change the parent."""
+        base = self._build_base_circuit()
+        scenario = base.fork()
+
+        load = scenario.edit("loads", "Load1")
+        load.mw = 80.0
+
+        self.assertEqual(scenario.loads["Load1"].mw, 80.0)
+        self.assertEqual(base.loads["Load1"].mw, 50.0)
+        self.assertIs(scenario.edit("loads", "Load1"), load)
+
+    def test_parent_edit_after_fork(self):
+        """Test that editing the parent after forking does not change the fork."""
+        base = self._build_base_circuit()
+        scenario = base.fork()
+
+        base.edit("generators", "Gen1").mw_setpoint = 150.0
+
+        self.assertEqual(base.generators["Gen1"].mw_setpoint, 150.0)
+        self.assertEqual(scenario.generators["Gen1"].mw_setpoint, 100.0)
+
+    def test_edit_unforked_circuit(self):
+        """Test that edit returns the stored object itself in an unforked circuit."""
+        circuit = self._build_base_circuit()
+
+        self.assertIs(circuit.edit("buses", "Bus1"), circuit.buses["Bus1"])
+
+    def test_fork_add_equipment(self):
+        """Test that equipment added to a fork is not visible in the parent."""
+        base = self._build_base_circuit()
+        scenario = base.fork()
+
+        scenario.add_load("Load2", "Bus1", 10.0, 5.0)
+
+        self.assertIn("Load2", scenario.loads)
+        self.assertNotIn("Load2", base.loads)
+        with self.assertRaises(ValueError):
+            scenario.add_load("Load1", "Bus1", 10.0, 5.0)
+
+    def test_fork_of_fork(self):
+        """Test that forking a modified fork keeps its modifications."""
+        base = self._build_base_circuit()
+        scenario = base.fork()
+        scenario.edit("loads", "Load1").mw = 80.0
+
+        variant = scenario.fork()
+        variant.edit("loads", "Load1").mw = 90.0
+
+        self.assertEqual(base.loads["Load1"].mw, 50.0)
+        self.assertEqual(scenario.loads["Load1"].mw, 80.0)
+        self.assertEqual(variant.loads["Load1"].mw, 90.0)
+
+    def test_many_forks_share_one_base(self):
+        """Test that repeated forks of an unmodified circuit all read the same base dictionary."""
+        base = self._build_base_circuit()
+        forks = [base.fork() for _ in range(1000)]
+
+        shared = forks[0].loads._parent
+        self.assertTrue(all(f.loads._parent is shared for f in forks))
+
+    def test_remove(self):
+        """Test removing equipment from the circuit."""
+        circuit = self._build_base_circuit()
+        circuit.remove("loads", "Load1")
+
+        self.assertNotIn("Load1", circuit.loads)
+        self.assertEqual(len(circuit.loads), 0)
+
+    def test_remove_from_fork(self):
+        """Test that removing equipment from a fork leaves the parent unchanged."""
+        base = self._build_base_circuit()
+        scenario = base.fork()
+        scenario.remove("transmission_lines", "Line1")
+
+        self.assertNotIn("Line1", scenario.transmission_lines)
+        self.assertIn("Line1", base.transmission_lines)
+
+    def test_remove_invalid(self):
+        """Test that removing an unknown collection or element raises ValueError."""
+        circuit = self._build_base_circuit()
+
+        with self.assertRaises(ValueError):
+            circuit.remove("switches", "S1")
+        with self.assertRaises(ValueError):
+            circuit.remove("loads", "Missing")
+
+    def test_edit_invalid(self):
+        """Test that editing an unknown collection or element raises ValueError."""
+        circuit = self._build_base_circuit()
+
+        with self.assertRaises(ValueError):
+            circuit.edit("switches", "S1")
+        with self.assertRaises(ValueError) as context:
+            circuit.edit("loads", "Missing")
+        self.assertIn("Missing", str(context.exception))
+
+    def test_update(self):
+        """Test that update changes the equipment attributes."""
+        circuit = self._build_base_circuit()
+
+        circuit.update("loads", "Load1", mw=60.0, mvar=20.0)
+
+        self.assertEqual(circuit.loads["Load1"].mw, 60.0)
+        self.assertEqual(circuit.loads["Load1"].mvar, 20.0)
+
+    def test_update_fork_copies_on_write(self):
+        """Test that updating a forked circuit does not change its parent."""
+        base = self._build_base_circuit()
+        scenario = base.fork()
+
+        scenario.update("generators", "Gen1", mw_setpoint=120.0)
+
+        self.assertEqual(scenario.generators["Gen1"].mw_setpoint, 120.0)
+        self.assertEqual(base.generators["Gen1"].mw_setpoint, 100.0)
+
+    def test_update_validated(self):
+        """Test that updates are checked like the constructor and leave the element unchanged if invalid."""
+        circuit = self._build_base_circuit()
+        circuit.add_transformer("T1", "Bus1", "Bus2", 0.01, 0.05)
+        journal_length = len(circuit.journal)
+
+        with self.assertRaises(ValueError):
+            circuit.update("generators", "Gen1", mw_min=1000.0, mw_max=1.0)
+        with self.assertRaises(ValueError):
+            circuit.update("transmission_lines", "Line1", mva_rating=-5.0)
+        with self.assertRaises(ValueError):
+            circuit.update("transformers", "T1", tap_ratio=0.0)
+
+        self.assertEqual(circuit.generators["Gen1"].mw_max, float("inf"))
+        self.assertEqual(circuit.transmission_lines["Line1"].mva_rating, float("inf"))
+        self.assertEqual(circuit.transformers["T1"].tap_ratio, 1.0)
+        self.assertEqual(len(circuit.journal), journal_length)
+
+    def test_update_normalized(self):
+        """Test that updated values are normalized like constructor arguments."""
+        circuit = self._build_base_circuit()
+
+        circuit.update("generators", "Gen1", cost_coefficients=[1.0, 2.0])
+
+        self.assertEqual(circuit.generators["Gen1"].cost_coefficients, (1.0, 2.0))
+        self.assertEqual(circuit.journal.entries[-1].after, {"cost_coefficients": (1.0, 2.0)})
+
+    def test_many_update_fork_cycles(self):
+        """Test that thousands of update-then-fork cycles keep every circuit readable."""
+        base = self._build_base_circuit()
+        base.add_load("Load2", "Bus1", 10.0, 5.0)
+        for i in range(1500):
+            base.update("loads", "Load1", mw=float(i))
+            scenario = base.fork()
+
+        self.assertEqual(base.loads["Load1"].mw, 1499.0)
+        self.assertEqual(scenario.loads["Load1"].mw, 1499.0)
+        self.assertEqual(scenario.loads["Load2"].mw, 10.0)
+        self.assertEqual(base.loads["Load2"].mw, 10.0)
+
+        for i in range(1500):
+            scenario.update("loads", "Load1", mw=float(i))
+            scenario = scenario.fork()
+        self.assertEqual(scenario.loads["Load2"].mw, 10.0)
+        self.assertEqual(base.loads["Load1"].mw, 1499.0)
+
+    def test_update_invalid(self):
+        """Test that updating an unknown element or attribute raises ValueError."""
+        circuit = self._build_base_circuit()
+
+        with self.assertRaises(ValueError):
+            circuit.update("loads", "Missing", mw=1.0)
+        with self.assertRaises(ValueError):
+            circuit.update("loads", "Load1", rating=1.0)
+        with self.assertRaises(ValueError):
+            circuit.update("loads", "Load1", name="Load2")
+        self.assertEqual(circuit.loads["Load1"].name, "Load1")
+
+    def test_concurrent_adds(self):
+        """Test that equipment added to one circuit from several threads is all recorded."""
+        circuit = Circuit("Test Circuit")
+
+        def build(thread_id):
+            for i in range(100):
+                circuit.add_bus(f"T{thread_id}Bus{i}", 230.0)
+                circuit.add_load(f"T{thread_id}Load{i}", f"T{thread_id}Bus{i}", 1.0, 0.5)
+
+        threads = [threading.Thread(target=build, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(circuit.buses), 400)
+        self.assertEqual(len(circuit.loads), 400)
+        self.assertEqual(len(circuit.journal), 800)
+        self.assertEqual(sorted(bus.bus_index for bus in circuit.buses.values()), list(range(400)))
+
+    def test_query_during_updates(self):
+        """Test that queries running alongside a writer only see whole patches."""
+        circuit = self._build_base_circuit()
+        for i in range(50):
+            circuit.add_load(f"Extra{i}", "Bus2", 1.0, 0.0)
+        other = circuit.fork()
+        for i in range(50):
+            other.update("loads", f"Extra{i}", mw=2.0)
+        patch = circuit.diff(other)
+        inverse = other.diff(circuit)
+        counts = []
+
+        def writer():
+            for _ in range(20):
+                circuit.apply_patch(patch)
+                circuit.apply_patch(inverse)
+
+        def reader():
+            for _ in range(50):
+                counts.append(len(circuit.query("loads", "mw", "==", 2.0)))
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(set(counts) <= {0, 50})
+
+    def test_writing_block(self):
+        """Test that writing() makes a sequence of changes atomic for readers."""
+        circuit = self._build_base_circuit()
+        seen = []
+
+        def reader():
+            with circuit.reading():
+                seen.append(circuit.loads["Load1"].mw)
+
+        with circuit.writing():
+            circuit.update("loads", "Load1", mw=1.0)
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(0.1)
+            circuit.update("loads", "Load1", mw=2.0)
+        thread.join()
+
+        self.assertEqual(seen, [2.0])
+
+    def test_fork_while_reading(self):
+        """Test that a circuit can be forked while its read lock is held."""
+        circuit = self._build_base_circuit()
+
+        with circuit.reading():
+            scenario = circuit.fork("Scenario")
+            scenario.update("loads", "Load1", mw=80.0)
+
+        self.assertEqual(scenario.loads["Load1"].mw, 80.0)
+        self.assertEqual(circuit.loads["Load1"].mw, 50.0)
+
+    def test_concurrent_forks(self):
+        """Test that forks taken from several threads during updates each see a whole circuit."""
+        circuit = self._build_base_circuit()
+        for i in range(20):
+            circuit.add_load(f"Extra{i}", "Bus2", 1.0, 0.0)
+        forks = []
+
+        def writer():
+            for i in range(200):
+                circuit.update("loads", f"Extra{i % 20}", mw=float(i))
+
+        def forker():
+            for _ in range(50):
+                forks.append(circuit.fork())
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=forker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(forks), 150)
+        self.assertTrue(all(len(fork.loads) == 21 for fork in forks))
+        self.assertEqual(circuit.loads["Extra19"].mw, 199.0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,245 @@
+import unittest
+import sys
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.circuitDiff import CircuitDiff, element_record, build_element
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.bus import Bus
+
+
+class TestCircuitDiff(unittest.TestCase):
+    """Unit tests for the CircuitDiff class."""
+
+    def setUp(self):
+        """Reset the Bus registry and build a base circuit before each test."""
+        Bus._bus_counter = 0
+        Bus._bus_registry.clear()
+        self.base = Circuit("Base")
+        self.base.add_bus("Bus1", 230.0)
+        self.base.add_bus("Bus2", 230.0)
+        self.base.add_transformer("T1", "Bus1", "Bus2", 0.01, 0.05)
+        self.base.add_transmission_line("Line1", "Bus1", "Bus2", 0.02, 0.06, 0.0, 0.04)
+        self.base.add_generator("Gen1", "Bus1", 1.05, 100.0)
+        self.base.add_load("Load1", "Bus2", 50.0, 25.0)
+
+    def _rebuild_base(self, name: str):
+        """Build an independent circuit with the same model data as the base circuit."""
+        circuit = Circuit(name)
+        circuit.add_bus("Bus1", 230.0)
+        circuit.add_bus("Bus2", 230.0)
+        circuit.add_transformer("T1", "Bus1", "Bus2", 0.01, 0.05)
+        circuit.add_transmission_line("Line1", "Bus1", "Bus2", 0.02, 0.06, 0.0, 0.04)
+        circuit.add_generator("Gen1", "Bus1", 1.05, 100.0)
+        circuit.add_load("Load1", "Bus2", 50.0, 25.0)
+        return circuit
+
+    def test_identical_circuits(self):
+        """Test that independently built identical circuits have an empty diff."""
+        other = self._rebuild_base("Other")
+
+        diff = CircuitDiff.between(self.base, other)
+        self.assertTrue(diff.is_empty())
+        self.assertEqual(len(diff), 0)
+
+    def test_bus_index_ignored(self):
+        """Test that buses differing only in their assigned index are not changed."""
+        other = self._rebuild_base("Other")
+
+        self.assertNotEqual(self.base.buses["Bus1"].bus_index, other.buses["Bus1"].bus_index)
+        self.assertEqual(self.base.diff(other).changed["buses"], {})
+
+    def test_added_removed_changed(self):
+        """Test that added, removed and changed equipment are reported per collection."""
+        other = self._rebuild_base("Other")
+        other.loads["Load1"].mw = 60.0
+        other.transformers["T1"].tap_ratio = 1.025
+        other.remove("generators", "Gen1")
+        other.add_load("Load2", "Bus1", 10.0, 5.0)
+
+        diff = self.base.diff(other)
+
+        self.assertEqual(diff.changed["loads"], {"Load1": {"mw": 60.0}})
+        self.assertEqual(diff.changed["transformers"], {"T1": {"tap_ratio": 1.025}})
+        self.assertEqual(diff.removed["generators"], ["Gen1"])
+        self.assertEqual(diff.added["loads"]["Load2"]["mw"], 10.0)
+        self.assertEqual(len(diff), 4)
+        self.assertIn("added=1", repr(diff))
+
+    def test_apply_patch(self):
+        """Test that applying a diff to a copy of the old circuit reproduces the new one."""
+        upstream = self._rebuild_base("Upstream")
+        upstream.loads["Load1"].mvar = 30.0
+        upstream.remove("transmission_lines", "Line1")
+        upstream.add_transmission_line("Line2", "Bus1", "Bus2", 0.03, 0.08, 0.0, 0.05)
+        upstream.add_bus("Bus3", 115.0)
+
+        local = self._rebuild_base("Local")
+        local.apply_patch(self.base.diff(upstream))
+
+        self.assertTrue(local.diff(upstream).is_empty())
+        self.assertEqual(local.loads["Load1"].mvar, 30.0)
+        self.assertNotIn("Line1", local.transmission_lines)
+        self.assertEqual(local.buses["Bus3"].bus_index, Bus.get_bus_index("Bus3"))
+
+    def test_apply_patch_only_touches_named_elements(self):
+        """Test that a patch leaves unrelated equipment objects in place."""
+        local = self._rebuild_base("Local")
+        unrelated = local.generators["Gen1"]
+        upstream = self._rebuild_base("Upstream")
+        upstream.loads["Load1"].mw = 70.0
+
+        local.apply_patch(self.base.diff(upstream))
+
+        self.assertIs(local.generators["Gen1"], unrelated)
+        self.assertEqual(local.loads["Load1"].mw, 70.0)
+
+    def test_apply_patch_to_fork(self):
+        """Test that patching a fork copies changed equipment instead of editing the parent."""
+        upstream = self.base.fork("Upstream")
+        upstream.edit("loads", "Load1").mw = 70.0
+        diff = self.base.diff(upstream)
+
+        scenario = self.base.fork("Scenario")
+        scenario.apply_patch(diff)
+
+        self.assertEqual(scenario.loads["Load1"].mw, 70.0)
+        self.assertEqual(self.base.loads["Load1"].mw, 50.0)
+
+    def test_apply_patch_conflicts(self):
+        """Test that a patch that does not fit raises ValueError before changing anything."""
+        upstream = self._rebuild_base("Upstream")
+        upstream.remove("loads", "Load1")
+        upstream.add_generator("Gen2", "Bus2", 1.0, 50.0)
+        diff = self.base.diff(upstream)
+
+        target = self._rebuild_base("Target")
+        target.remove("loads", "Load1")
+        with self.assertRaises(ValueError):
+            target.apply_patch(diff)
+        self.assertNotIn("Gen2", target.generators)
+
+        target = self._rebuild_base("Target")
+        target.add_generator("Gen2", "Bus1", 1.0, 10.0)
+        with self.assertRaises(ValueError):
+            target.apply_patch(diff)
+        self.assertIn("Load1", target.loads)
+
+    def test_apply_patch_invalid_element(self):
+        """Test that a patch adding invalid equipment raises before changing anything."""
+        upstream = self.base.fork("Upstream")
+        upstream.remove("loads", "Load1")
+        diff = self.base.diff(upstream)
+        diff.added["transmission_lines"]["Line2"] = dict(
+            element_record(self.base.transmission_lines["Line1"]), name="Line2", mva_rating=-5.0)
+        journal_length = len(self.base.journal)
+
+        with self.assertRaises(ValueError):
+            self.base.apply_patch(diff)
+
+        self.assertIn("Load1", self.base.loads)
+        self.assertNotIn("Line2", self.base.transmission_lines)
+        self.assertEqual(len(self.base.journal), journal_length)
+
+    def test_apply_patch_invalid_change(self):
+        """Test that a patch with an invalid attribute change raises before changing anything."""
+        diff = CircuitDiff()
+        diff.removed["loads"] = ["Load1"]
+        diff.changed["generators"]["Gen1"] = {"mw_min": 10.0, "mw_max": 5.0}
+
+        with self.assertRaises(ValueError):
+            self.base.apply_patch(diff)
+
+        self.assertIn("Load1", self.base.loads)
+        self.assertEqual(self.base.generators["Gen1"].mw_max, float("inf"))
+
+    def test_apply_patch_unknown_attribute(self):
+        """Test that a patch changing a missing or fixed attribute raises before changing anything."""
+        for attributes in ({"mw": 60.0, "colour": "red"}, {"bus_index": 5}, {"name": "Load9"}):
+            diff = CircuitDiff()
+            diff.removed["generators"] = ["Gen1"]
+            diff.changed["loads"]["Load1"] = attributes
+            journal_length = len(self.base.journal)
+
+            with self.assertRaises(ValueError):
+                self.base.apply_patch(diff)
+
+            self.assertIn("Gen1", self.base.generators)
+            self.assertEqual(self.base.loads["Load1"].mw, 50.0)
+            self.assertFalse(hasattr(self.base.loads["Load1"], "colour"))
+            self.assertEqual(len(self.base.journal), journal_length)
+
+    def test_apply_patch_failure_rolled_back(self):
+        """Test that a patch failing partway is reverted and leaves no undo step."""
+        diff = CircuitDiff()
+        diff.removed["generators"] = ["Gen1"]
+        diff.changed["loads"]["Load1"] = {"mw": 60.0}
+        diff.changed["generators"]["Gen1"] = {"mw_setpoint": 90.0}
+        self.base.update("loads", "Load1", mw=55.0)
+        journal_length = len(self.base.journal)
+
+        with self.assertRaises(Exception):
+            self.base.apply_patch(diff)
+
+        self.assertEqual(self.base.generators["Gen1"].mw_setpoint, 100.0)
+        self.assertEqual(self.base.loads["Load1"].mw, 55.0)
+        self.assertEqual(len(self.base.journal), journal_length)
+        self.assertEqual(self.base.query("loads", "mw", "==", 55.0), ["Load1"])
+        self.base.undo()
+        self.assertEqual(self.base.loads["Load1"].mw, 50.0)
+
+    def test_changes_with_equal_hashes(self):
+        """Test that changes between values with equal hashes, e.g. -1 and -2, are reported."""
+        self.assertEqual(hash(-1), hash(-2))
+        self.base.update("loads", "Load1", mw=-1.0)
+        other = self.base.fork("Other")
+        other.update("loads", "Load1", mw=-2.0)
+
+        self.assertEqual(self.base.diff(other).changed["loads"], {"Load1": {"mw": -2.0}})
+
+    def test_unhashable_values(self):
+        """Test that attributes holding unhashable values, such as lists, can be diffed."""
+        other = self.base.fork("Other")
+        other.edit("generators", "Gen1").cost_coefficients = [1.0, 2.0, 3.0]
+
+        diff = self.base.diff(other)
+
+        self.assertEqual(diff.changed["generators"], {"Gen1": {"cost_coefficients": [1.0, 2.0, 3.0]}})
+
+    def test_large_model_small_change_set(self):
+        """Test diffing and patching a large model with a small change set."""
+        base = Circuit("Large")
+        for i in range(20000):
+            base.add_load(f"Load{i}", f"Bus{i % 100}", 10.0, 5.0)
+        upstream = base.fork("Upstream")
+        for i in range(0, 20000, 100):
+            upstream.edit("loads", f"Load{i}").mw = 12.0
+
+        diff = base.diff(upstream)
+        local = base.fork("Local")
+        local.apply_patch(diff)
+
+        self.assertEqual(len(diff), 200)
+        self.assertEqual(local.loads["Load100"].mw, 12.0)
+        self.assertEqual(base.loads["Load100"].mw, 10.0)
+
+    def test_element_record_round_trip(self):
+        """Test that build_element recreates an object from its record, including non-constructor attributes."""
+        transformer = self.base.transformers["T1"]
+        transformer.enable_tap_control("Bus2", 1.0)
+
+        rebuilt = build_element("transformers", element_record(transformer))
+
+        self.assertEqual(element_record(rebuilt), element_record(transformer))
+        self.assertEqual(rebuilt.regulated_bus_name, "Bus2")
+
+
+if __name__ == '__main__':
+    unittest.main()
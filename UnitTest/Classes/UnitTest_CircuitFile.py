@@ -0,0 +1,140 @@
+import unittest
+import json
+import math
+import sys
+import tempfile
+import threading
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.circuitFile import save_circuit, load_circuit
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.bus import Bus
+
+
+class TestCircuitFile(unittest.TestCase):
+    """Unit tests for saving and loading circuit model files."""
+
+    def setUp(self):
+        """Reset the Bus registry and create a temporary directory before each test."""
+        Bus._bus_counter = 0
+        Bus._bus_registry.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "circuit.json"
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def _build_circuit(self):
+        """Build a circuit using every equipment type and optional parameter."""
+        circuit = Circuit("Test Circuit")
+        circuit.add_bus("Bus1", 20.0)
+        circuit.add_bus("Bus2", 230.0)
+        circuit.add_transformer("T1", "Bus1", "Bus2", 0.01, 0.1, mva_rating=200.0, tap_ratio=1.025)
+        circuit.transformers["T1"].enable_tap_control("Bus2", 1.0)
+        circuit.add_transmission_line("Line1", "Bus1", "Bus2", 0.02, 0.25, 0.0, 0.04)
+        circuit.add_generator("Gen1", "Bus1", 1.04, 100.0, mvar_min=-50.0,
+                              cost_coefficients=(100.0, 20.0, 0.01))
+        circuit.add_load("Load1", "Bus2", 50.0, 30.0)
+        return circuit
+
+    def test_round_trip(self):
+        """Test that a saved and loaded circuit has the same model data."""
+        circuit = self._build_circuit()
+
+        save_circuit(circuit, self.path)
+        loaded = load_circuit(self.path)
+
+        self.assertEqual(loaded.name, "Test Circuit")
+        self.assertTrue(circuit.diff(loaded).is_empty())
+        self.assertEqual(list(loaded.buses), ["Bus1", "Bus2"])
+
+    def test_types_preserved(self):
+        """Test that tuples and infinite ratings survive the JSON file."""
+        save_circuit(self._build_circuit(), self.path)
+        loaded = load_circuit(self.path)
+
+        self.assertEqual(loaded.generators["Gen1"].cost_coefficients, (100.0, 20.0, 0.01))
+        self.assertTrue(math.isinf(loaded.transmission_lines["Line1"].mva_rating))
+        self.assertEqual(loaded.transformers["T1"].regulated_bus_name, "Bus2")
+
+    def test_strict_json(self):
+        """Test that the file is strict JSON, with non-finite values written as tagged objects."""
+        save_circuit(self._build_circuit(), self.path)
+
+        def reject(constant):
+            raise AssertionError(f"non-standard JSON constant {constant}")
+
+        with open(self.path) as f:
+            data = json.load(f, parse_constant=reject)
+        [line] = data["equipment"]["transmission_lines"]
+        self.assertEqual(line["mva_rating"], {"float": "inf"})
+        self.assertEqual(data["equipment"]["generators"][0]["mw_min"], {"float": "-inf"})
+
+    def test_version_1_file(self):
+        """Test that a version 1 file, with bare Infinity values, still loads."""
+        record = {"name": "Line1", "bus1_name": "Bus1", "bus2_name": "Bus2", "r": 0.02, "x": 0.25,
+                  "g": 0.0, "b": 0.04, "mva_rating": float("inf")}
+        with open(self.path, "w") as f:
+            json.dump({"format": "circuit", "version": 1, "name": "Old",
+                       "equipment": {"buses": [{"name": "Bus1", "nominal_kv": 230.0},
+                                               {"name": "Bus2", "nominal_kv": 230.0}],
+                                     "transmission_lines": [record]}}, f)
+
+        loaded = load_circuit(self.path)
+
+        self.assertTrue(math.isinf(loaded.transmission_lines["Line1"].mva_rating))
+
+    def test_save_during_concurrent_adds(self):
+        """Test that saving a circuit while another thread adds buses writes a consistent snapshot."""
+        circuit = self._build_circuit()
+        done = threading.Event()
+
+        def add_buses():
+            for i in range(20000):
+                if done.is_set():
+                    return
+                circuit.add_bus(f"Extra{i}", 230.0)
+
+        thread = threading.Thread(target=add_buses)
+        thread.start()
+        try:
+            for _ in range(5):
+                save_circuit(circuit, self.path)
+        finally:
+            done.set()
+            thread.join()
+
+        self.assertGreaterEqual(len(load_circuit(self.path).buses), 2)
+
+    def test_loaded_journal_empty(self):
+        """Test that a loaded circuit starts with an empty journal."""
+        save_circuit(self._build_circuit(), self.path)
+        loaded = load_circuit(self.path)
+
+        self.assertEqual(len(loaded.journal), 0)
+        self.assertFalse(loaded.journal.can_undo())
+
+    def test_invalid_file(self):
+        """Test that a file of another format or an unknown collection raises ValueError."""
+        with open(self.path, "w") as f:
+            json.dump({"format": "other"}, f)
+        with self.assertRaises(ValueError):
+            load_circuit(self.path)
+
+        with open(self.path, "w") as f:
+            json.dump({"format": "circuit", "version": 1, "name": "X", "equipment": {"switches": []}}, f)
+        with self.assertRaises(ValueError):
+            load_circuit(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
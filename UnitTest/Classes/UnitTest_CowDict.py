@@ -0,0 +1,116 @@
+import unittest
+import sys
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.cowDict import CowDict, MAX_DEPTH
+
+
+class TestCowDict(unittest.TestCase):
+    """Unit tests for the CowDict class."""
+
+    def setUp(self):
+        """Create a shared base mapping and two layers over it."""
+        self.base = {"a": 1, "b": 2}
+        self.keep, self.fork = CowDict.split(self.base)
+
+    def test_reads_fall_through(self):
+        """Test that unmodified keys are read from the parent."""
+        self.assertEqual(self.fork["a"], 1)
+        self.assertIn("b", self.fork)
+        self.assertEqual(len(self.fork), 2)
+        self.assertEqual(list(self.fork), ["a", "b"])
+
+    def test_write_isolated_from_parent_and_sibling(self):
+        """Test that writes only affect the layer they are made in."""
+        self.fork["a"] = 10
+        self.fork["c"] = 3
+
+        self.assertEqual(self.fork["a"], 10)
+        self.assertEqual(self.keep["a"], 1)
+        self.assertNotIn("c", self.keep)
+        self.assertEqual(self.base, {"a": 1, "b": 2})
+        self.assertEqual(len(self.fork), 3)
+
+    def test_delete_hides_parent_key(self):
+        """Test that deleting a parent key hides it in this layer only."""
+        del self.fork["a"]
+
+        self.assertNotIn("a", self.fork)
+        self.assertIn("a", self.keep)
+        self.assertEqual(len(self.fork), 1)
+        with self.assertRaises(KeyError):
+            self.fork["a"]
+
+    def test_delete_missing_key(self):
+        """Test that deleting a missing key raises KeyError."""
+        with self.assertRaises(KeyError):
+            del self.fork["missing"]
+
+    def test_readd_after_delete(self):
+        """Test that a deleted key can be written again."""
+        del self.fork["a"]
+        self.fork["a"] = 5
+
+        self.assertEqual(self.fork["a"], 5)
+        self.assertEqual(len(self.fork), 2)
+        self.assertEqual(list(self.fork), ["a", "b"])
+
+    def test_iteration_order(self):
+        """Test that parent keys come first in order, followed by new keys."""
+        self.fork["c"] = 3
+        self.fork["a"] = 10
+
+        self.assertEqual(list(self.fork.items()), [("a", 10), ("b", 2), ("c", 3)])
+
+    def test_owns(self):
+        """Test that owns reports only keys written in this layer."""
+        self.fork["b"] = 20
+
+        self.assertTrue(self.fork.owns("b"))
+        self.assertFalse(self.fork.owns("a"))
+
+    def test_split_unmodified_layer_stays_shallow(self):
+        """Test that splitting an unmodified layer shares its parent instead of stacking."""
+        kept, forked = CowDict.split(self.keep)
+
+        self.assertIs(kept, self.keep)
+        self.assertIs(forked._parent, self.base)
+
+    def test_split_modified_layer_stacks(self):
+        """Test that splitting a modified layer keeps its changes visible in both layers."""
+        self.keep["c"] = 3
+        kept, forked = CowDict.split(self.keep)
+
+        self.assertEqual(forked["c"], 3)
+        self.assertEqual(kept["c"], 3)
+        forked["c"] = 30
+        self.assertEqual(kept["c"], 3)
+
+    def test_split_depth_bounded(self):
+        """Test that repeatedly modifying and splitting a layer never stacks more than MAX_DEPTH layers."""
+        layer = self.keep
+        for i in range(2000):
+            layer[f"k{i}"] = i
+            layer, forked = CowDict.split(layer)
+            self.assertLessEqual(forked._depth, MAX_DEPTH)
+
+        self.assertEqual(layer["a"], 1)
+        self.assertEqual(forked["k1999"], 1999)
+        self.assertEqual(len(forked), 2002)
+        self.assertEqual(list(layer)[:3], ["a", "b", "k0"])
+
+    def test_equality_with_dict(self):
+        """Test that a CowDict compares equal to a dict with the same items."""
+        self.assertEqual(self.fork, {"a": 1, "b": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
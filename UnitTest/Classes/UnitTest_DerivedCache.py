@@ -0,0 +1,163 @@
+import unittest
+import pickle
+import sys
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.bus import Bus
+
+
+class TestDerivedCache(unittest.TestCase):
+    """Unit tests for the DerivedCache class."""
+
+    def setUp(self):
+        """Reset the Bus registry and build a small circuit before each test."""
+        Bus._bus_counter = 0
+        Bus._bus_registry.clear()
+        self.circuit = Circuit("Test Circuit")
+        self.circuit.add_bus("Bus1", 20.0)
+        self.circuit.add_bus("Bus2", 230.0)
+        self.circuit.add_transformer("T1", "Bus1", "Bus2", 0.0, 0.1, tap_ratio=1.05)
+        self.circuit.add_transmission_line("Line1", "Bus1", "Bus2", 0.0, 0.5, 0.0, 0.04)
+        self.circuit.add_generator("Gen1", "Bus1", 1.04, 100.0)
+        self.circuit.add_load("Load1", "Bus2", 50.0, 30.0)
+
+    def _counting(self, name: str, depends_on):
+        """Register a quantity that counts how often it is computed."""
+        calls = []
+
+        def compute(circuit):
+            calls.append(1)
+            return len(calls)
+
+        self.circuit.derived.register(name, compute, depends_on)
+        return calls
+
+    def test_built_in_quantities(self):
+        """Test the values of the built-in derived quantities."""
+        derived = self.circuit.derived
+
+        self.assertEqual(derived.get("bus_order"), {"Bus1": 0, "Bus2": 1})
+        self.assertEqual(derived.get("bus_injections"), {"Bus1": 100 + 0j, "Bus2": -50 - 30j})
+        bus1, bus2, y, y_shunt, ratio = derived.get("branch_admittances")["Line1"]
+        self.assertEqual((bus1, bus2), ("Bus1", "Bus2"))
+        self.assertAlmostEqual(y, -2j)
+        self.assertAlmostEqual(y_shunt, 0.04j)
+        self.assertAlmostEqual(derived.get("branch_admittances")["T1"][4], 1.05)
+
+    def test_computed_once(self):
+        """Test that a quantity is computed lazily and only once."""
+        calls = self._counting("count", ("loads",))
+
+        self.assertFalse(self.circuit.derived.is_cached("count"))
+        self.circuit.derived.get("count")
+        self.circuit.derived.get("count")
+
+        self.assertEqual(len(calls), 1)
+
+    def test_unrelated_update_keeps_value(self):
+        """Test that changing a load keeps quantities that depend only on branches."""
+        admittances = self.circuit.derived.get("branch_admittances")
+        self.circuit.derived.get("bus_injections")
+
+        self.circuit.update("loads", "Load1", mw=60.0)
+
+        self.assertTrue(self.circuit.derived.is_cached("branch_admittances"))
+        self.assertIs(self.circuit.derived.get("branch_admittances"), admittances)
+        self.assertFalse(self.circuit.derived.is_cached("bus_injections"))
+        self.assertEqual(self.circuit.derived.get("bus_injections")["Bus2"], -60 - 30j)
+
+    def test_attribute_dependency(self):
+        """Test that an update only invalidates quantities depending on the updated attribute."""
+        self.circuit.derived.get("bus_injections")
+
+        self.circuit.update("generators", "Gen1", voltage_setpoint=1.02)
+        self.assertTrue(self.circuit.derived.is_cached("bus_injections"))
+
+        self.circuit.update("generators", "Gen1", mw_setpoint=80.0)
+        self.assertFalse(self.circuit.derived.is_cached("bus_injections"))
+
+    def test_add_remove_invalidates(self):
+        """Test that adding or removing equipment invalidates dependent quantities."""
+        self.circuit.derived.get("bus_order")
+        self.circuit.add_bus("Bus3", 230.0)
+        self.assertEqual(self.circuit.derived.get("bus_order")["Bus3"], 2)
+
+        self.circuit.derived.get("branch_admittances")
+        self.circuit.remove("transmission_lines", "Line1")
+        self.assertNotIn("Line1", self.circuit.derived.get("branch_admittances"))
+
+    def test_collection_dependency(self):
+        """Test that a whole-collection dependency is invalidated by any update."""
+        calls = self._counting("count", ("generators",))
+        self.circuit.derived.get("count")
+
+        self.circuit.update("generators", "Gen1", voltage_setpoint=1.02)
+        self.circuit.derived.get("count")
+
+        self.assertEqual(len(calls), 2)
+
+    def test_undo_invalidates(self):
+        """Test that undoing a change invalidates dependent quantities."""
+        self.circuit.update("loads", "Load1", mw=60.0)
+        self.circuit.derived.get("bus_injections")
+
+        self.circuit.undo()
+
+        self.assertEqual(self.circuit.derived.get("bus_injections")["Bus2"], -50 - 30j)
+
+    def test_manual_invalidate(self):
+        """Test that invalidate drops one or all cached quantities."""
+        self.circuit.derived.get("bus_order")
+        self.circuit.derived.get("bus_injections")
+
+        self.circuit.derived.invalidate("bus_order")
+        self.assertFalse(self.circuit.derived.is_cached("bus_order"))
+        self.assertTrue(self.circuit.derived.is_cached("bus_injections"))
+
+        self.circuit.derived.invalidate()
+        self.assertFalse(self.circuit.derived.is_cached("bus_injections"))
+
+    def test_register_invalid(self):
+        """Test that duplicate names and unknown collections raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.circuit.derived.register("bus_order", lambda circuit: None, ("buses",))
+        with self.assertRaises(ValueError):
+            self.circuit.derived.register("switch_count", lambda circuit: None, ("switches",))
+
+    def test_unknown_quantity(self):
+        """Test that getting an unregistered quantity raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.circuit.derived.get("ybus")
+
+    def test_fork_shares_cached_values(self):
+        """Test that a fork reuses cached values and invalidates them independently."""
+        injections = self.circuit.derived.get("bus_injections")
+        scenario = self.circuit.fork()
+
+        self.assertIs(scenario.derived.get("bus_injections"), injections)
+
+        scenario.update("loads", "Load1", mw=70.0)
+        self.assertEqual(scenario.derived.get("bus_injections")["Bus2"], -70 - 30j)
+        self.assertIs(self.circuit.derived.get("bus_injections"), injections)
+
+    def test_pickled_circuit_tracks_changes(self):
+        """Test that an unpickled circuit still invalidates its derived quantities."""
+        restored = pickle.loads(pickle.dumps(self.circuit))
+
+        self.assertFalse(restored.derived.is_cached("bus_order"))
+        restored.derived.get("bus_injections")
+        restored.update("loads", "Load1", mw=10.0)
+        self.assertEqual(restored.derived.get("bus_injections")["Bus2"], -10 - 30j)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import unittest
+import math
+import pickle
+import sys
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.equipmentIndex import EquipmentIndex
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.bus import Bus
+
+
+class TestEquipmentIndex(unittest.TestCase):
+    """Unit tests for the EquipmentIndex and EquipmentIndexes classes."""
+
+    def setUp(self):
+        """Reset the Bus registry and build a small circuit before each test."""
+        Bus._bus_counter = 0
+        Bus._bus_registry.clear()
+        self.circuit = Circuit("Test Circuit")
+        self.circuit.add_bus("Bus1", 20.0)
+        self.circuit.add_bus("Bus2", 230.0)
+        self.circuit.add_bus("Bus3", 230.0)
+        self.circuit.add_bus("Bus4", 115.0)
+        self.circuit.add_transmission_line("Line1", "Bus2", "Bus3", 0.02, 0.25, 0.0, 0.04)
+        self.circuit.add_transmission_line("Line2", "Bus2", "Bus3", 0.05, 0.15, 0.0, 0.02)
+        self.circuit.add_transmission_line("Line3", "Bus3", "Bus4", 0.0, 0.10, 0.0, 0.0)
+        self.circuit.add_load("Load1", "Bus2", 50.0, 30.0)
+        self.circuit.add_load("Load2", "Bus3", 120.0, 40.0)
+        self.circuit.add_load("Load3", "Bus4", 80.0, 10.0)
+
+    def test_operators(self):
+        """Test every query operator on a sorted index."""
+        index = EquipmentIndex(lambda value: value, ("value",))
+        for name, value in [("a", 3), ("b", 1), ("c", 2), ("d", 2)]:
+            index.add(name, value)
+
+        self.assertEqual(index.find("==", 2), ["c", "d"])
+        self.assertEqual(index.find("!=", 2), ["b", "a"])
+        self.assertEqual(index.find("<", 2), ["b"])
+        self.assertEqual(index.find("<=", 2), ["b", "c", "d"])
+        self.assertEqual(index.find(">", 2), ["a"])
+        self.assertEqual(index.find(">=", 2), ["c", "d", "a"])
+
+    def test_none_and_nan_not_indexed(self):
+        """Test that None and nan keys are not indexed and discard ignores them."""
+        index = EquipmentIndex(lambda value: value, ("value",))
+        index.add("a", None)
+        index.add("b", math.nan)
+        index.add("c", 1.0)
+
+        self.assertEqual(len(index), 1)
+        index.discard("a")
+        self.assertEqual(index.find(">=", 0.0), ["c"])
+
+    def test_query_equality(self):
+        """Test finding all buses at a nominal voltage."""
+        self.assertEqual(self.circuit.query("buses", "nominal_kv", "==", 230.0), ["Bus2", "Bus3"])
+        self.assertEqual(self.circuit.query("buses", "nominal_kv", "==", 345.0), [])
+
+    def test_query_range(self):
+        """Test finding loads above a threshold, ordered by the attribute."""
+        self.assertEqual(self.circuit.query("loads", "mw", ">", 60.0), ["Load3", "Load2"])
+
+    def test_query_x_over_r(self):
+        """Test the computed X/R key, with zero resistance as infinite X/R."""
+        self.assertEqual(self.circuit.query("transmission_lines", "x_over_r", "<", 5.0), ["Line2"])
+        self.assertEqual(self.circuit.query("transmission_lines", "x_over_r", ">", 5.0), ["Line1", "Line3"])
+
+    def test_index_follows_add_remove(self):
+        """Test that adding and removing equipment updates a built index."""
+        self.circuit.query("loads", "mw", ">", 0.0)
+
+        self.circuit.add_load("Load4", "Bus1", 200.0, 0.0)
+        self.circuit.remove("loads", "Load2")
+
+        self.assertEqual(self.circuit.query("loads", "mw", ">", 60.0), ["Load3", "Load4"])
+
+    def test_index_follows_update_and_undo(self):
+        """Test that updates and their undo re-index the equipment."""
+        self.circuit.query("transmission_lines", "x_over_r", "<", 5.0)
+
+        self.circuit.update("transmission_lines", "Line1", r=0.1)
+        self.assertEqual(self.circuit.query("transmission_lines", "x_over_r", "<", 5.0), ["Line1", "Line2"])
+
+        self.circuit.undo()
+        self.assertEqual(self.circuit.query("transmission_lines", "x_over_r", "<", 5.0), ["Line2"])
+
+    def test_unrelated_update_keeps_index(self):
+        """Test that an update of another attribute does not re-index the equipment."""
+        self.circuit.query("loads", "mw", ">", 0.0)
+        index = self.circuit.indexes._indexes[("loads", "mw")]
+        entries = list(index._entries)
+
+        self.circuit.update("loads", "Load1", mvar=5.0)
+
+        self.assertEqual(index._entries, entries)
+
+    def test_register_computed_key(self):
+        """Test querying a registered computed key."""
+        self.circuit.indexes.register("loads", "power_factor",
+                                      lambda load: load.mw / math.hypot(load.mw, load.mvar), ("mw", "mvar"))
+
+        self.assertEqual(self.circuit.query("loads", "power_factor", "<", 0.9), ["Load1"])
+        with self.assertRaises(ValueError):
+            self.circuit.indexes.register("loads", "power_factor", lambda load: 0.0, ("mw",))
+
+    def test_query_invalid(self):
+        """Test that unknown collections, attributes and operators raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.circuit.query("switches", "state", "==", 1)
+        with self.assertRaises(ValueError):
+            self.circuit.query("loads", "rating", ">", 1.0)
+        with self.assertRaises(ValueError):
+            self.circuit.query("loads", "mw", "~", 1.0)
+
+    def test_query_empty_collection(self):
+        """Test that a query on an empty collection does not keep an index for an unchecked attribute."""
+        self.assertEqual(self.circuit.query("generators", "mw_setpiont", ">", 0), [])
+
+        self.circuit.add_generator("Gen1", "Bus1", 1.0, 100.0)
+
+        with self.assertRaises(ValueError):
+            self.circuit.query("generators", "mw_setpiont", ">", 0)
+        self.assertEqual(self.circuit.query("generators", "mw_setpoint", ">", 0), ["Gen1"])
+
+    def test_fork_has_own_indexes(self):
+        """Test that a fork's indexes follow the fork and not its parent."""
+        self.circuit.query("loads", "mw", ">", 0.0)
+        scenario = self.circuit.fork()
+
+        scenario.update("loads", "Load1", mw=500.0)
+
+        self.assertEqual(scenario.query("loads", "mw", ">", 100.0), ["Load2", "Load1"])
+        self.assertEqual(self.circuit.query("loads", "mw", ">", 100.0), ["Load2"])
+
+    def test_pickled_circuit_indexes(self):
+        """Test that an unpickled circuit rebuilds and maintains its indexes."""
+        self.circuit.query("loads", "mw", ">", 0.0)
+        restored = pickle.loads(pickle.dumps(self.circuit))
+
+        restored.update("loads", "Load3", mw=10.0)
+
+        self.assertEqual(restored.query("loads", "mw", "<", 60.0), ["Load3", "Load1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
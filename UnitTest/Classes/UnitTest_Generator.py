@@ -137,6 +137,86 @@ class TestGenerator(unittest.TestCase):
         self.assertEqual(gen1.mw_setpoint, 150.0)
         self.assertEqual(gen1.voltage_setpoint, 1.02)
 
+    def test_generator_default_mvar_limits(self):
+        """Test that reactive power is unlimited by default."""
+        gen1 = Generator("G1", "Bus 1", 1.04, 100.0)
+
+        self.assertEqual(gen1.mvar_min, float("-inf"))
+        self.assertEqual(gen1.mvar_max, float("inf"))
+        self.assertEqual(gen1.enforce_mvar_limits(1e6), (1e6, False))
+
+    def test_generator_mvar_limits(self):
+        """Test that reactive power limits are stored and shown in repr."""
+        gen1 = Generator("G1", "Bus 1", 1.04, 100.0, mvar_min=-40.0, mvar_max=60.0)
+
+        self.assertEqual(gen1.mvar_min, -40.0)
+        self.assertEqual(gen1.mvar_max, 60.0)
+        self.assertIn("-40.0", repr(gen1))
+        self.assertIn("60.0", repr(gen1))
+
+    def test_generator_inverted_mvar_limits(self):
+        """Test that mvar_min greater than mvar_max raises ValueError."""
+        with self.assertRaises(ValueError) as context:
+            Generator("G1", "Bus 1", 1.04, 100.0, mvar_min=50.0, mvar_max=10.0)
+
+        self.assertIn("G1", str(context.exception))
+
+    def test_enforce_mvar_limits(self):
+        """Test that reactive power outside the limits is clamped and flagged."""
+        gen1 = Generator("G1", "Bus 1", 1.04, 100.0, mvar_min=-40.0, mvar_max=60.0)
+
+        self.assertEqual(gen1.enforce_mvar_limits(30.0), (30.0, False))
+        self.assertEqual(gen1.enforce_mvar_limits(60.0), (60.0, False))
+        self.assertEqual(gen1.enforce_mvar_limits(75.0), (60.0, True))
+        self.assertEqual(gen1.enforce_mvar_limits(-50.0), (-40.0, True))
+
+    def test_generator_subtransient_reactance(self):
+        """Test that the fault source reactance is optional and stored when given."""
+        gen1 = Generator("G1", "Bus 1", 1.04, 100.0)
+        gen2 = Generator("G2", "Bus 2", 1.02, 150.0, x_subtransient=0.15)
+
+        self.assertIsNone(gen1.x_subtransient)
+        self.assertEqual(gen2.x_subtransient, 0.15)
+
+    def test_generator_default_cost_and_mw_limits(self):
+        """Test that generators are free and unlimited in MW by default."""
+        gen1 = Generator("G1", "Bus 1", 1.04, 100.0)
+
+        self.assertEqual(gen1.mw_min, float("-inf"))
+        self.assertEqual(gen1.mw_max, float("inf"))
+        self.assertEqual(gen1.cost(100.0), 0.0)
+        self.assertEqual(gen1.marginal_cost(100.0), 0.0)
+
+    def test_generator_cost_curve(self):
+        """Test evaluating a quadratic cost curve and its derivative."""
+        gen1 = Generator("G1", "Bus 1", 1.04, 200.0, mw_min=50.0, mw_max=400.0,
+                         cost_coefficients=(100.0, 20.0, 0.01))
+
+        self.assertEqual(gen1.mw_min, 50.0)
+        self.assertEqual(gen1.mw_max, 400.0)
+        self.assertAlmostEqual(gen1.cost(200.0), 4500.0)
+        self.assertAlmostEqual(gen1.marginal_cost(200.0), 24.0)
+
+    def test_generator_linear_cost_curve(self):
+        """Test that a cost curve can have any number of coefficients."""
+        gen1 = Generator("G1", "Bus 1", 1.04, 100.0, cost_coefficients=[0.0, 15.0])
+
+        self.assertEqual(gen1.cost_coefficients, (0.0, 15.0))
+        self.assertEqual(gen1.cost(10.0), 150.0)
+        self.assertEqual(gen1.marginal_cost(10.0), 15.0)
+
+    def test_generator_invalid_cost_and_mw_limits(self):
+        """Test that inverted MW limits or an empty cost curve raise ValueError."""
+        with self.assertRaises(ValueError):
+            Generator("G1", "Bus 1", 1.04, 100.0, mw_min=200.0, mw_max=100.0)
+        with self.assertRaises(ValueError):
+            Generator("G1", "Bus 1", 1.04, 100.0, cost_coefficients=())
+
+    def test_generator_invalid_subtransient_reactance(self):
+        """Test that a non-positive subtransient reactance raises ValueError."""
+        with self.assertRaises(ValueError):
+            Generator("G1", "Bus 1", 1.04, 100.0, x_subtransient=0.0)
+
 
 class TestGeneratorWithBus(unittest.TestCase):
     """Integration tests for Generator class with Bus class."""
@@ -0,0 +1,69 @@
+import unittest
+import sys
+import tempfile
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.importBenchmark import ImportBenchmark
+
+
+class TestImportBenchmark(unittest.TestCase):
+    """Unit tests for the ImportBenchmark class. Wall times are not checked here."""
+
+    def _budget(self):
+        """Build a budget of 1 ms for Src and 10 ms for Circuit."""
+        return {"tolerance": 0.5, "import_ms": {"Src": 1.0, "Circuit": 10.0}}
+
+    def test_check_within_budget(self):
+        """Test that times within the tolerance pass."""
+        violations = ImportBenchmark().check({"Src": 1.4, "Circuit": 14.0}, self._budget())
+
+        self.assertEqual(violations, [])
+
+    def test_check_over_budget(self):
+        """Test that a time beyond the tolerance is reported."""
+        violations = ImportBenchmark().check({"Src": 1.0, "Circuit": 16.0}, self._budget())
+
+        self.assertEqual(len(violations), 1)
+        self.assertIn("Circuit", violations[0])
+
+    def test_save_and_load_budget(self):
+        """Test that a saved budget is read back with rounded values."""
+        with tempfile.TemporaryDirectory() as directory:
+            benchmark = ImportBenchmark(Path(directory) / "budget.json")
+            benchmark.save_budget({"Src": 1.04, "Circuit": 15.26}, tolerance=0.25)
+
+            budget = benchmark.load_budget()
+
+        self.assertEqual(budget, {"tolerance": 0.25, "import_ms": {"Src": 1.0, "Circuit": 15.3}})
+
+    def test_run(self):
+        """Test that a run reports a time for each import, Circuit including Src."""
+        result = ImportBenchmark().run(1)
+
+        self.assertEqual(set(result), {"Src", "Circuit"})
+        self.assertGreater(result["Src"], 0.0)
+        self.assertGreaterEqual(result["Circuit"], result["Src"])
+
+    def test_run_invalid(self):
+        """Test that fewer than one run raises ValueError."""
+        with self.assertRaises(ValueError):
+            ImportBenchmark().run(0)
+
+    def test_stored_budget_format(self):
+        """Test that the stored budget has a tolerance and a time for each measured import."""
+        budget = ImportBenchmark().load_budget()
+
+        self.assertGreater(budget["tolerance"], 0)
+        self.assertEqual(set(budget["import_ms"]), set(ImportBenchmark.IMPORTS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+import unittest
+import sys
+import asyncio
+import threading
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.jobServer import JobServer
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.bus import Bus
+
+
+def total_load(circuit, requests):
+    """Stand-in solve: scale the total circuit load by each request's factor."""
+    base = sum(load.mw for load in circuit.loads.values())
+    return [base * factor for factor in requests]
+
+
+class TestJobServer(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the JobServer class."""
+
+    def setUp(self):
+        """Reset the Bus registry and build a small circuit before each test."""
+        Bus._bus_counter = 0
+        Bus._bus_registry.clear()
+        self.circuit = Circuit("Test Circuit")
+        self.circuit.add_load("Load1", "Bus2", 50.0, 25.0)
+        self.circuit.add_load("Load2", "Bus3", 25.0, 10.0)
+
+    async def test_submit_returns_result(self):
+        """Test that a single request is solved against the resident circuit."""
+        async with JobServer(total_load) as server:
+            server.load_circuit(self.circuit)
+            result = await server.submit("Test Circuit", 2.0)
+
+        self.assertEqual(result, 150.0)
+
+    async def test_concurrent_requests_are_batched(self):
+        """Test that concurrent requests against one circuit are coalesced into one batch."""
+        batch_sizes = []
+
+        def recording_solve(circuit, requests):
+            batch_sizes.append(len(requests))
+            return total_load(circuit, requests)
+
+        async with JobServer(recording_solve, batch_window=0.01) as server:
+            server.load_circuit(self.circuit)
+            results = await asyncio.gather(*(server.submit("Test Circuit", f) for f in (1.0, 2.0, 3.0)))
+            metrics = server.get_metrics()
+
+        self.assertEqual(results, [75.0, 150.0, 225.0])
+        self.assertEqual(batch_sizes, [3])
+        self.assertEqual(metrics["batches"], 1)
+        self.assertEqual(metrics["completed"], 3)
+        self.assertEqual(metrics["mean_batch_size"], 3.0)
+
+    async def test_max_batch_size(self):
+        """Test that batches never exceed max_batch_size."""
+        batch_sizes = []
+
+        def recording_solve(circuit, requests):
+            batch_sizes.append(len(requests))
+            return total_load(circuit, requests)
+
+        async with JobServer(recording_solve, max_batch_size=2) as server:
+            server.load_circuit(self.circuit)
+            await asyncio.gather(*(server.submit("Test Circuit", 1.0) for _ in range(5)))
+
+        self.assertEqual(batch_sizes, [2, 2, 1])
+
+    async def test_solve_runs_off_event_loop_thread(self):
+        """Test that the solve function runs in the worker pool, not the event loop thread."""
+        solve_threads = []
+
+        def recording_solve(circuit, requests):
+            solve_threads.append(threading.get_ident())
+            return total_load(circuit, requests)
+
+        async with JobServer(recording_solve) as server:
+            server.load_circuit(self.circuit)
+            await server.submit("Test Circuit", 1.0)
+
+        self.assertNotEqual(solve_threads[0], threading.get_ident())
+
+    async def test_failed_batch_sets_exception(self):
+        """Test that a failing solve raises in every request of the batch and is counted."""
+        def failing_solve(circuit, requests):
+            raise ArithmeticError("diverged")
+
+        async with JobServer(failing_solve) as server:
+            server.load_circuit(self.circuit)
+            with self.assertRaises(ArithmeticError):
+                await server.submit("Test Circuit", 1.0)
+            metrics = server.get_metrics()
+
+        self.assertEqual(metrics["failed"], 1)
+        self.assertEqual(metrics["completed"], 0)
+
+    async def test_wrong_result_count(self):
+        """Test that a solve returning the wrong number of results raises ValueError."""
+        async with JobServer(lambda circuit, requests: []) as server:
+            server.load_circuit(self.circuit)
+            with self.assertRaises(ValueError):
+                await server.submit("Test Circuit", 1.0)
+
+    async def test_unknown_circuit(self):
+        """Test that submitting against a circuit that is not loaded raises ValueError."""
+        async with JobServer(total_load) as server:
+            with self.assertRaises(ValueError) as context:
+                await server.submit("Missing", 1.0)
+
+        self.assertIn("Missing", str(context.exception))
+
+    async def test_submit_before_start(self):
+        """Test that submitting to a server that is not running raises RuntimeError."""
+        server = JobServer(total_load)
+        server.load_circuit(self.circuit)
+
+        with self.assertRaises(RuntimeError):
+            await server.submit("Test Circuit", 1.0)
+
+    def test_duplicate_circuit(self):
+        """Test that loading two circuits with the same name raises ValueError."""
+        server = JobServer(total_load)
+        server.load_circuit(self.circuit)
+
+        with self.assertRaises(ValueError) as context:
+            server.load_circuit(Circuit("Test Circuit"))
+
+        self.assertIn("already loaded", str(context.exception))
+
+    def test_unload_circuit(self):
+        """Test that an unloaded circuit is no longer resident."""
+        server = JobServer(total_load)
+        server.load_circuit(self.circuit)
+        server.unload_circuit("Test Circuit")
+
+        self.assertNotIn("Test Circuit", server.circuits)
+
+    async def test_solve_holds_read_lock(self):
+        """Test that the solve function runs with the circuit's read lock held."""
+        held = []
+
+        def checking_solve(circuit, requests):
+            held.append(threading.get_ident() in circuit.lock._read_depths)
+            return total_load(circuit, requests)
+
+        async with JobServer(checking_solve) as server:
+            server.load_circuit(self.circuit)
+            await server.submit("Test Circuit", 1.0)
+
+        self.assertEqual(held, [True])
+
+    async def test_solve_can_fork(self):
+        """Test that a solve can fork the resident circuit for a what-if scenario."""
+        def what_if(circuit, requests):
+            results = []
+            for factor in requests:
+                scenario = circuit.fork()
+                scenario.update("loads", "Load1", mw=50.0 * factor)
+                results.append(sum(load.mw for load in scenario.loads.values()))
+            return results
+
+        async with JobServer(what_if) as server:
+            server.load_circuit(self.circuit)
+            result = await server.submit("Test Circuit", 2.0)
+
+        self.assertEqual(result, 125.0)
+        self.assertEqual(self.circuit.loads["Load1"].mw, 50.0)
+
+    def test_process_pool_rejected(self):
+        """Test that an executor other than a thread pool raises ValueError."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=1)
+        try:
+            with self.assertRaises(ValueError):
+                JobServer(total_load, executor=executor)
+        finally:
+            executor.shutdown()
+
+    def test_invalid_batch_size(self):
+        """Test that a max_batch_size below one raises ValueError."""
+        with self.assertRaises(ValueError):
+            JobServer(total_load, max_batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+import unittest
+import pickle
+import sys
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.journal import Journal, JournalEntry
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.bus import Bus
+
+
+class TestJournal(unittest.TestCase):
+    """Unit tests for the Journal class and the journaled Circuit mutations."""
+
+    def setUp(self):
+        """Reset the Bus registry and build a small circuit before each test."""
+        Bus._bus_counter = 0
+        Bus._bus_registry.clear()
+        self.circuit = Circuit("Test Circuit")
+        self.circuit.add_bus("Bus1", 230.0)
+        self.circuit.add_bus("Bus2", 230.0)
+        self.circuit.add_load("Load1", "Bus2", 50.0, 25.0)
+
+    def test_record(self):
+        """Test that record appends an entry and makes it undoable."""
+        journal = Journal()
+
+        entry = journal.record("update", "loads", "Load1", {"mw": 1.0}, {"mw": 2.0})
+
+        self.assertEqual(entry, JournalEntry("update", "loads", "Load1", {"mw": 1.0}, {"mw": 2.0}))
+        self.assertEqual(len(journal), 1)
+        self.assertTrue(journal.can_undo())
+        self.assertFalse(journal.can_redo())
+
+    def test_record_unknown_action(self):
+        """Test that an unknown action raises ValueError."""
+        with self.assertRaises(ValueError):
+            Journal().record("rename", "loads", "Load1", None, None)
+
+    def test_circuit_mutations_recorded(self):
+        """Test that adding equipment is recorded in the circuit journal."""
+        actions = [(entry.action, entry.collection, entry.name) for entry in self.circuit.journal.entries]
+
+        self.assertEqual(actions, [("add", "buses", "Bus1"), ("add", "buses", "Bus2"),
+                                   ("add", "loads", "Load1")])
+        self.assertIs(self.circuit.journal.entries[-1].after, self.circuit.loads["Load1"])
+
+    def test_observer_notified(self):
+        """Test that subscribed observers receive every new entry until unsubscribed."""
+        received = []
+        self.circuit.journal.subscribe(received.append)
+
+        self.circuit.update("loads", "Load1", mw=60.0)
+        self.circuit.remove("loads", "Load1")
+        self.circuit.journal.unsubscribe(received.append)
+        self.circuit.add_bus("Bus3", 230.0)
+
+        self.assertEqual([entry.action for entry in received], ["update", "remove"])
+        self.assertEqual(received[0].before, {"mw": 50.0})
+        self.assertEqual(received[0].after, {"mw": 60.0})
+
+    def test_undo_redo_update(self):
+        """Test that an update is undone and redone."""
+        self.circuit.update("loads", "Load1", mw=60.0)
+
+        self.circuit.undo()
+        self.assertEqual(self.circuit.loads["Load1"].mw, 50.0)
+        self.circuit.redo()
+        self.assertEqual(self.circuit.loads["Load1"].mw, 60.0)
+
+    def test_undo_redo_add_remove(self):
+        """Test that adding and removing equipment are undone and redone."""
+        load = self.circuit.loads["Load1"]
+        self.circuit.remove("loads", "Load1")
+
+        self.circuit.undo()
+        self.assertIs(self.circuit.loads["Load1"], load)
+
+        self.circuit.undo()
+        self.assertNotIn("Load1", self.circuit.loads)
+
+        self.circuit.redo()
+        self.circuit.redo()
+        self.assertNotIn("Load1", self.circuit.loads)
+
+    def test_undo_appends_inverse(self):
+        """Test that undo records the inverse mutation instead of rewriting history."""
+        self.circuit.update("loads", "Load1", mw=60.0)
+        count = len(self.circuit.journal)
+
+        self.circuit.undo()
+
+        self.assertEqual(len(self.circuit.journal), count + 1)
+        self.assertEqual(self.circuit.journal.entries[-1].after, {"mw": 50.0})
+
+    def test_nothing_to_undo_or_redo(self):
+        """Test that undo or redo without history raises ValueError."""
+        circuit = Circuit("Empty")
+
+        with self.assertRaises(ValueError):
+            circuit.undo()
+        with self.assertRaises(ValueError):
+            circuit.redo()
+
+    def test_new_mutation_clears_redo(self):
+        """Test that a new mutation after undo discards the redo history."""
+        self.circuit.update("loads", "Load1", mw=60.0)
+        self.circuit.undo()
+
+        self.circuit.update("loads", "Load1", mvar=10.0)
+
+        self.assertFalse(self.circuit.journal.can_redo())
+
+    def test_patch_single_undo_step(self):
+        """Test that applying a patch is undone in one step."""
+        target = self.circuit.fork()
+        target.update("loads", "Load1", mw=70.0)
+        target.remove("buses", "Bus1")
+        target.add_bus("Bus3", 115.0)
+        diff = self.circuit.diff(target)
+
+        self.circuit.apply_patch(diff)
+        self.assertTrue(self.circuit.diff(target).is_empty())
+
+        self.circuit.undo()
+        self.assertEqual(self.circuit.loads["Load1"].mw, 50.0)
+        self.assertIn("Bus1", self.circuit.buses)
+        self.assertNotIn("Bus3", self.circuit.buses)
+
+    def test_transaction_groups_mutations(self):
+        """Test that mutations inside a transaction are undone together."""
+        with self.circuit.journal.transaction():
+            self.circuit.update("loads", "Load1", mw=60.0)
+            self.circuit.add_bus("Bus3", 115.0)
+
+        self.circuit.undo()
+
+        self.assertEqual(self.circuit.loads["Load1"].mw, 50.0)
+        self.assertNotIn("Bus3", self.circuit.buses)
+        self.assertIn("Bus2", self.circuit.buses)
+
+    def test_undo_steps_in_order(self):
+        """Test that single mutations and transactions around undo and redo are undone one step at a time."""
+        self.circuit.update("loads", "Load1", mw=60.0)
+        with self.circuit.journal.transaction():
+            self.circuit.update("loads", "Load1", mw=70.0)
+            self.circuit.update("loads", "Load1", mvar=30.0)
+        self.circuit.update("loads", "Load1", mw=80.0)
+        self.circuit.update("loads", "Load1", mw=90.0)
+        self.circuit.undo()
+        self.circuit.redo()
+        self.circuit.undo()
+        self.circuit.update("loads", "Load1", mvar=35.0)
+
+        load = self.circuit.loads["Load1"]
+        steps = []
+        while self.circuit.journal.can_undo():
+            self.circuit.undo()
+            steps.append((load.mw, load.mvar))
+
+        # The last three steps remove Load1, Bus2 and Bus1 again
+        self.assertEqual(steps, [(80.0, 30.0), (70.0, 30.0), (60.0, 25.0), (50.0, 25.0)] + [(50.0, 25.0)] * 3)
+        self.assertNotIn("Load1", self.circuit.loads)
+        self.assertFalse(self.circuit.journal.can_undo())
+
+    def test_fork_has_own_journal(self):
+        """Test that a forked circuit starts with an empty journal of its own."""
+        scenario = self.circuit.fork()
+        scenario.update("loads", "Load1", mw=60.0)
+
+        self.assertEqual(len(scenario.journal), 1)
+        self.assertEqual(len(self.circuit.journal), 3)
+
+    def test_clear(self):
+        """Test that clear drops the history but keeps the observers."""
+        received = []
+        self.circuit.journal.subscribe(received.append)
+
+        self.circuit.journal.clear()
+        self.circuit.add_bus("Bus3", 115.0)
+
+        self.assertEqual(len(self.circuit.journal), 1)
+        self.assertEqual(len(received), 1)
+
+    def test_pickle_drops_observers(self):
+        """Test that observers are not pickled with the journal."""
+        journal = Journal()
+        journal.subscribe(lambda entry: None)
+        journal.record("add", "buses", "Bus1", None, "payload")
+
+        restored = pickle.loads(pickle.dumps(journal))
+
+        self.assertEqual(len(restored), 1)
+        self.assertEqual(restored._observers, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
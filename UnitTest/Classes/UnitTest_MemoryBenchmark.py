@@ -0,0 +1,130 @@
+import unittest
+import sys
+import tempfile
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.memoryBenchmark import (MemoryBenchmark, build_circuit, element_counts,
+                                               MIN_CHECKED_ELEMENTS)
+from Src.Utils.Classes.bus import Bus
+
+
+class TestMemoryBenchmark(unittest.TestCase):
+    """Unit tests for the MemoryBenchmark class."""
+
+    def setUp(self):
+        """Reset the Bus registry before each test."""
+        Bus._bus_counter = 0
+        Bus._bus_registry.clear()
+
+    def _result(self, num_buses: int, bytes_per_element: float, bytes_per_bus: float):
+        """Build a measurement with the same bytes for every element type."""
+        counts = element_counts(num_buses)
+        return {
+            "num_buses": num_buses,
+            "elements": counts,
+            "bytes_per_element": {collection: bytes_per_element for collection in counts},
+            "steady_rss_bytes": bytes_per_bus * num_buses,
+            "peak_rss_bytes": bytes_per_bus * num_buses,
+            "steady_bytes_per_bus": bytes_per_bus,
+            "peak_bytes_per_bus": bytes_per_bus,
+        }
+
+    def _budget(self):
+        """Build a budget of 500 bytes per element and 2000 bytes per bus."""
+        return {
+            "tolerance": 0.25,
+            "bytes_per_element": {collection: 500 for collection in element_counts(10)},
+            "steady_bytes_per_bus": 2000,
+            "peak_bytes_per_bus": 2000,
+        }
+
+    def test_element_counts(self):
+        """Test that equipment counts are proportional to the number of buses."""
+        counts = element_counts(1000)
+
+        self.assertEqual(counts, {"buses": 1000, "transmission_lines": 1500, "transformers": 100,
+                                  "generators": 200, "loads": 600})
+
+    def test_build_circuit(self):
+        """Test that the benchmark circuit is built with the expected equipment."""
+        circuit = build_circuit(100)
+
+        self.assertEqual(len(circuit.buses), 100)
+        self.assertEqual(len(circuit.transmission_lines), 150)
+        self.assertEqual(len(circuit.transformers), 10)
+        self.assertEqual(len(circuit.generators), 20)
+        self.assertEqual(len(circuit.loads), 60)
+        for line in circuit.transmission_lines.values():
+            self.assertIn(line.bus2_name, circuit.buses)
+            self.assertNotEqual(line.bus1_name, line.bus2_name)
+
+    def test_build_circuit_measure_callback(self):
+        """Test that the measure callback is called once per element type in order."""
+        calls = []
+        build_circuit(20, lambda collection, count: calls.append((collection, count)))
+
+        self.assertEqual(calls, [("buses", 20), ("transmission_lines", 30), ("transformers", 2),
+                                 ("generators", 4), ("loads", 12)])
+
+    def test_check_within_budget(self):
+        """Test that a measurement within budget and tolerance has no violations."""
+        result = self._result(10 ** 6, 600, 2400)
+
+        self.assertEqual(MemoryBenchmark().check(result, self._budget()), [])
+
+    def test_check_over_budget(self):
+        """Test that values over budget plus tolerance are reported."""
+        result = self._result(10 ** 6, 700, 2600)
+
+        violations = MemoryBenchmark().check(result, self._budget())
+
+        self.assertEqual(len(violations), 7)
+        self.assertTrue(any("transmission_lines" in message for message in violations))
+        self.assertTrue(any("peak_bytes_per_bus" in message for message in violations))
+
+    def test_check_skips_small_counts(self):
+        """Test that element types with few elements are only covered by the per-bus totals."""
+        result = self._result(MIN_CHECKED_ELEMENTS // 10, 10 ** 6, 100)
+
+        self.assertEqual(MemoryBenchmark().check(result, self._budget()), [])
+
+    def test_save_and_load_budget(self):
+        """Test that a saved budget is read back with rounded values."""
+        with tempfile.TemporaryDirectory() as directory:
+            benchmark = MemoryBenchmark(Path(directory) / "budget.json")
+            benchmark.save_budget(self._result(1000, 512.4, 1999.6), tolerance=0.1)
+
+            budget = benchmark.load_budget()
+
+        self.assertEqual(budget["tolerance"], 0.1)
+        self.assertEqual(budget["bytes_per_element"]["loads"], 512)
+        self.assertEqual(budget["peak_bytes_per_bus"], 2000)
+
+    def test_run_invalid_size(self):
+        """Test that too small a benchmark raises ValueError."""
+        with self.assertRaises(ValueError):
+            MemoryBenchmark().run(5)
+
+    @unittest.skipUnless(MemoryBenchmark.is_supported(), "RSS measurement needs Linux /proc")
+    def test_stored_budget(self):
+        """Test that a 10^4 bus circuit stays within the stored memory budget."""
+        benchmark = MemoryBenchmark()
+
+        result = benchmark.run(10 ** 4)
+
+        self.assertEqual(result["elements"]["buses"], 10 ** 4)
+        self.assertGreater(result["steady_rss_bytes"], 0)
+        self.assertGreaterEqual(result["peak_rss_bytes"], result["steady_rss_bytes"])
+        self.assertEqual(benchmark.check(result), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import subprocess
+import sys
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import Src
+from Src.Utils.Classes.circuit import Circuit
+
+
+def _run_in_fresh_interpreter(code: str):
+    """Run code in a new Python process started in the project root and return its output."""
+    completed = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                               capture_output=True, text=True, check=True)
+    return completed.stdout.strip()
+
+
+class TestPackage(unittest.TestCase):
+    """Unit tests for the top-level Src package API."""
+
+    def test_top_level_exports(self):
+        """Test that the public classes are available from the top-level package."""
+        from Src import Circuit as TopLevelCircuit
+
+        self.assertIs(TopLevelCircuit, Circuit)
+        self.assertIs(Src.Circuit, Circuit)
+        for name in Src.__all__:
+            self.assertTrue(hasattr(Src, name), name)
+
+    def test_dir_lists_exports(self):
+        """Test that dir() lists exports that are not loaded yet."""
+        self.assertIn("ResultSink", dir(Src))
+        self.assertIn("PowerFlowResults", dir(Src))
+
+    def test_unknown_attribute(self):
+        """Test that an unknown attribute raises AttributeError."""
+        with self.assertRaises(AttributeError):
+            Src.Ybus
+
+    def test_import_is_lazy(self):
+        """Test that importing the package loads none of the class modules."""
+        output = _run_in_fresh_interpreter(
+            "import sys, Src; print([m for m in sys.modules if m.startswith('Src.')])")
+
+        self.assertEqual(output, "[]")
+
+    def test_circuit_import_loads_no_study_modules(self):
+        """Test that using Circuit does not load the study and I/O modules."""
+        output = _run_in_fresh_interpreter(
+            "import sys, Src; Src.Circuit; "
+            "print(sorted(m for m in ('asyncio', 'json', 'inspect', 'tracemalloc', "
+            "'Src.Utils.Classes.jobServer', 'Src.Utils.Classes.resultSink') if m in sys.modules))")
+
+        self.assertEqual(output, "[]")
+
+
+if __name__ == '__main__':
+    unittest.main()
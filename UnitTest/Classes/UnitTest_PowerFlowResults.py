@@ -0,0 +1,170 @@
+import unittest
+import sys
+import csv
+import cmath
+import math
+import tempfile
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.powerFlowResults import PowerFlowResults
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.bus import Bus
+
+
+class TestPowerFlowResults(unittest.TestCase):
+    """Unit tests for the PowerFlowResults class."""
+
+    def setUp(self):
+        """Reset the Bus registry and build a small solved case before each test."""
+        Bus._bus_counter = 0
+        Bus._bus_registry.clear()
+        self.circuit = Circuit("Test Circuit")
+        self.circuit.add_bus("Bus1", 20.0)
+        self.circuit.add_bus("Bus2", 230.0)
+        self.circuit.add_bus("Bus3", 230.0)
+        self.circuit.add_transformer("T1", "Bus1", "Bus2", 0.0, 0.10, mva_rating=200.0)
+        self.circuit.add_transmission_line("Line1", "Bus2", "Bus3", 0.02, 0.25, 0.0, 0.04, mva_rating=150.0)
+        self.voltages = {"Bus1": (1.04, 0.0), "Bus2": (1.02, -3.0), "Bus3": (0.99, -6.5)}
+
+    def test_bus_columns(self):
+        """Test that bus voltages are stored as columns in input order."""
+        results = PowerFlowResults(self.circuit, self.voltages)
+
+        columns = results.to_columns("buses")
+        self.assertEqual(columns["name"], ["Bus1", "Bus2", "Bus3"])
+        self.assertEqual(columns["vm_pu"], [1.04, 1.02, 0.99])
+        self.assertEqual(columns["va_deg"], [0.0, -3.0, -6.5])
+
+    def test_line_flows(self):
+        """Test line end flows and losses against a direct pi-model calculation."""
+        results = PowerFlowResults(self.circuit, self.voltages)
+        row = results.get("transmission_lines", "Line1")
+
+        v2 = cmath.rect(1.02, math.radians(-3.0))
+        v3 = cmath.rect(0.99, math.radians(-6.5))
+        i_series = (v2 - v3) / complex(0.02, 0.25)
+        s2 = v2 * (i_series + v2 * 0.02j).conjugate() * 100
+        s3 = v3 * (-i_series + v3 * 0.02j).conjugate() * 100
+        p_loss = abs(i_series) ** 2 * 0.02 * 100
+
+        self.assertAlmostEqual(row["p1_mw"], s2.real)
+        self.assertAlmostEqual(row["q1_mvar"], s2.imag)
+        self.assertAlmostEqual(row["p_loss_mw"], p_loss)
+        self.assertAlmostEqual(row["p_loss_mw"], row["p1_mw"] + row["p2_mw"])
+        self.assertAlmostEqual(row["q2_mvar"], s3.imag)
+        self.assertAlmostEqual(row["loading_pct"], 100 * max(abs(s2), abs(s3)) / 150.0)
+
+    def test_lossless_transformer(self):
+        """Test that a transformer without resistance has no active power loss."""
+        results = PowerFlowResults(self.circuit, self.voltages)
+        row = results.get("transformers", "T1")
+
+        self.assertAlmostEqual(row["p_loss_mw"], 0.0)
+        self.assertGreater(row["q_loss_mvar"], 0.0)
+        self.assertGreater(row["p1_mw"], 0.0)
+
+    def test_phase_shifter_flow(self):
+        """Test that a phase shift drives flow between buses at equal voltage."""
+        circuit = Circuit("Phase Shifter")
+        circuit.add_transformer("PS1", "BusA", "BusB", 0.0, 0.1, phase_shift_deg=5.0)
+        results = PowerFlowResults(circuit, {"BusA": (1.0, 0.0), "BusB": (1.0, 0.0)})
+
+        # The bus1 side leads its internal node by the shift, so P flows from bus2 to bus1
+        row = results.get("transformers", "PS1")
+        self.assertAlmostEqual(row["p1_mw"], -100 * math.sin(math.radians(5.0)) / 0.1)
+        self.assertAlmostEqual(row["p2_mw"], -row["p1_mw"])
+
+    def test_off_nominal_tap_flow(self):
+        """Test that an off-nominal tap matches the ideal transformer plus series impedance."""
+        circuit = Circuit("Tap")
+        circuit.add_transformer("T1", "BusA", "BusB", 0.01, 0.1, tap_ratio=1.05)
+        results = PowerFlowResults(circuit, {"BusA": (1.0, 0.0), "BusB": (0.98, -2.0)})
+
+        v1 = 1.0 + 0j
+        v2 = cmath.rect(0.98, math.radians(-2.0))
+        i = (v1 / 1.05 - v2) / complex(0.01, 0.1)
+        row = results.get("transformers", "T1")
+        self.assertAlmostEqual(row["p1_mw"], (v1 * (i / 1.05).conjugate()).real * 100)
+        self.assertAlmostEqual(row["p2_mw"], (v2 * (-i).conjugate()).real * 100)
+
+    def test_s_base(self):
+        """Test that flows scale with the system base."""
+        results_100 = PowerFlowResults(self.circuit, self.voltages)
+        results_200 = PowerFlowResults(self.circuit, self.voltages, s_base_mva=200.0)
+
+        self.assertAlmostEqual(results_200.get("transmission_lines", "Line1")["p1_mw"],
+                               2 * results_100.get("transmission_lines", "Line1")["p1_mw"])
+
+    def test_unlimited_rating_loading(self):
+        """Test that branches without a rating report zero loading."""
+        circuit = Circuit("Unrated")
+        circuit.add_transmission_line("Line1", "BusA", "BusB", 0.01, 0.1, 0.0, 0.0)
+        results = PowerFlowResults(circuit, {"BusA": (1.0, 0.0), "BusB": (1.0, -5.0)})
+
+        self.assertEqual(results.get("transmission_lines", "Line1")["loading_pct"], 0.0)
+
+    def test_missing_voltage(self):
+        """Test that a branch to a bus without a voltage raises ValueError."""
+        del self.voltages["Bus3"]
+
+        with self.assertRaises(ValueError) as context:
+            PowerFlowResults(self.circuit, self.voltages)
+        self.assertIn("Line1", str(context.exception))
+
+    def test_zero_impedance_branch(self):
+        """Test that a zero-impedance branch raises ValueError."""
+        self.circuit.add_transmission_line("Line2", "Bus1", "Bus3", 0.0, 0.0, 0.0, 0.0)
+
+        with self.assertRaises(ValueError):
+            PowerFlowResults(self.circuit, self.voltages)
+
+    def test_uses_cached_admittances(self):
+        """Test that the branch admittances come from the circuit's derived cache."""
+        admittances = self.circuit.derived.get("branch_admittances")
+        bus1, bus2, y, y_shunt, ratio = admittances["Line1"]
+        admittances["Line1"] = (bus1, bus2, 2 * y, y_shunt, ratio)
+
+        doubled = PowerFlowResults(self.circuit, self.voltages).get("transmission_lines", "Line1")
+        self.circuit.derived.invalidate()
+        results = PowerFlowResults(self.circuit, self.voltages).get("transmission_lines", "Line1")
+
+        self.assertNotAlmostEqual(doubled["p1_mw"], results["p1_mw"])
+
+    def test_get_invalid(self):
+        """Test that unknown tables or elements raise ValueError."""
+        results = PowerFlowResults(self.circuit, self.voltages)
+
+        with self.assertRaises(ValueError):
+            results.get("switches", "S1")
+        with self.assertRaises(ValueError):
+            results.get("transformers", "Line1")
+        with self.assertRaises(ValueError):
+            results.to_columns("switches")
+
+    def test_to_csv(self):
+        """Test that every table is written to its own CSV file."""
+        results = PowerFlowResults(self.circuit, self.voltages)
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = results.to_csv(directory)
+            self.assertEqual([p.name for p in paths],
+                             ["buses.csv", "transmission_lines.csv", "transformers.csv"])
+            with open(paths[1], newline="") as f:
+                rows = list(csv.DictReader(f))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["name"], "Line1")
+        self.assertAlmostEqual(float(rows[0]["p1_mw"]),
+                               results.get("transmission_lines", "Line1")["p1_mw"])
+
+
+if __name__ == '__main__':
+    unittest.main()
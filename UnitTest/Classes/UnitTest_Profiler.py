@@ -0,0 +1,148 @@
+import unittest
+import sys
+import json
+import threading
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.profiler import Profiler, profiled
+from Src.Utils.Classes.circuit import Circuit
+from Src.Utils.Classes.bus import Bus
+
+
+class TestProfiler(unittest.TestCase):
+    """Unit tests for the Profiler class."""
+
+    def setUp(self):
+        """Reset the Bus registry and profiler state before each test."""
+        Bus._bus_counter = 0
+        Bus._bus_registry.clear()
+        Profiler.disable()
+        Profiler.reset()
+
+    def tearDown(self):
+        """Leave the profiler disabled for other tests."""
+        Profiler.disable()
+        Profiler.reset()
+
+    def test_disabled_by_default_records_nothing(self):
+        """Test that nothing is recorded while the profiler is disabled."""
+        circuit = Circuit("Test Circuit")
+        circuit.add_bus("Bus1", 230.0)
+        with Profiler.phase("test.block"):
+            pass
+
+        self.assertFalse(Profiler.is_enabled())
+        self.assertEqual(Profiler.get_stats(), {})
+
+    def test_add_methods_are_instrumented(self):
+        """Test that circuit building records one call per add method call."""
+        Profiler.enable()
+        circuit = Circuit("Test Circuit")
+        circuit.add_bus("Bus1", 230.0)
+        circuit.add_bus("Bus2", 230.0)
+        circuit.add_transmission_line("Line1", "Bus1", "Bus2", 0.02, 0.06, 0.0, 0.04)
+        circuit.add_load("Load1", "Bus2", 50.0, 25.0)
+
+        stats = Profiler.get_stats()
+        self.assertEqual(stats["build.add_bus"]["calls"], 2)
+        self.assertEqual(stats["build.add_transmission_line"]["calls"], 1)
+        self.assertEqual(stats["build.add_load"]["calls"], 1)
+        self.assertNotIn("build.add_generator", stats)
+
+    def test_failed_call_is_still_recorded(self):
+        """Test that a call raising an exception is counted and the exception propagates."""
+        Profiler.enable()
+        circuit = Circuit("Test Circuit")
+        circuit.add_bus("Bus1", 230.0)
+
+        with self.assertRaises(ValueError):
+            circuit.add_bus("Bus1", 115.0)
+
+        self.assertEqual(Profiler.get_stats()["build.add_bus"]["calls"], 2)
+
+    def test_phase_statistics(self):
+        """Test that totals, means and maxima are aggregated per phase."""
+        Profiler.enable()
+        Profiler.record("test.phase", 0.002)
+        Profiler.record("test.phase", 0.004)
+
+        stats = Profiler.get_stats()["test.phase"]
+        self.assertEqual(stats["calls"], 2)
+        self.assertAlmostEqual(stats["total_s"], 0.006)
+        self.assertAlmostEqual(stats["mean_s"], 0.003)
+        self.assertAlmostEqual(stats["max_s"], 0.004)
+
+    def test_memory_tracking(self):
+        """Test that allocated memory is recorded when memory tracking is enabled."""
+        @profiled("test.allocate")
+        def allocate():
+            return [0] * 100000
+
+        Profiler.enable(track_memory=True)
+        kept = allocate()
+
+        self.assertGreater(Profiler.get_stats()["test.allocate"]["allocated_bytes"], 0)
+        self.assertEqual(len(kept), 100000)
+
+    def test_json_export(self):
+        """Test that statistics export as JSON keyed by phase."""
+        Profiler.enable()
+        with Profiler.phase("test.block"):
+            pass
+
+        exported = json.loads(Profiler.to_json())
+        self.assertIn("test.block", exported)
+        self.assertEqual(exported["test.block"]["calls"], 1)
+
+    def test_table_export(self):
+        """Test that the flat table has a header row and one row per phase."""
+        Profiler.enable()
+        Profiler.record("test.slow", 0.5)
+        Profiler.record("test.fast", 0.1)
+
+        lines = Profiler.to_table().splitlines()
+        self.assertIn("phase", lines[0])
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[2].startswith("test.slow"))
+
+    def test_record_from_threads(self):
+        """Test that calls recorded from several threads at once are all counted."""
+        Profiler.enable()
+
+        def record():
+            for _ in range(5000):
+                Profiler.record("test.threads", 0.001)
+
+        # Switch threads often, so unsynchronized updates would be lost
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=record) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(Profiler.get_stats()["test.threads"]["calls"], 20000)
+
+    def test_reset(self):
+        """Test that reset discards collected statistics."""
+        Profiler.enable()
+        Profiler.record("test.phase", 0.001)
+        Profiler.reset()
+
+        self.assertEqual(Profiler.get_stats(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
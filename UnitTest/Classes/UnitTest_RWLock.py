@@ -0,0 +1,121 @@
+import unittest
+import copy
+import pickle
+import sys
+import threading
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.rwLock import RWLock
+
+
+class TestRWLock(unittest.TestCase):
+    """Unit tests for the RWLock class."""
+
+    def test_concurrent_readers(self):
+        """Test that several threads can hold the lock for reading at the same time."""
+        lock = RWLock()
+        barrier = threading.Barrier(3, timeout=5)
+        passed = []
+
+        def reader():
+            with lock.read():
+                barrier.wait()
+                passed.append(True)
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(passed), 3)
+
+    def test_writer_excludes_readers(self):
+        """Test that a reader waits until the writer releases the lock."""
+        lock = RWLock()
+        events = []
+        lock.acquire_write()
+
+        def reader():
+            with lock.read():
+                events.append("read")
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        thread.join(0.1)
+        events.append("write done")
+        lock.release_write()
+        thread.join()
+
+        self.assertEqual(events, ["write done", "read"])
+
+    def test_writer_waits_for_readers(self):
+        """Test that a writer waits until every reader releases the lock."""
+        lock = RWLock()
+        events = []
+        lock.acquire_read()
+
+        def writer():
+            with lock.write():
+                events.append("write")
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        thread.join(0.1)
+        events.append("read done")
+        lock.release_read()
+        thread.join()
+
+        self.assertEqual(events, ["read done", "write"])
+
+    def test_reentrant(self):
+        """Test that a thread can nest read and write locks it already holds."""
+        lock = RWLock()
+
+        with lock.write():
+            with lock.write():
+                with lock.read():
+                    pass
+            self.assertEqual(lock._write_depth, 1)
+        with lock.read():
+            with lock.read():
+                pass
+
+        self.assertIsNone(lock._writer)
+        self.assertEqual(lock._readers, 0)
+        self.assertEqual(lock._read_depths, {})
+
+    def test_upgrade_raises(self):
+        """Test that acquiring the write lock while holding only a read lock raises RuntimeError."""
+        lock = RWLock()
+
+        with lock.read():
+            with self.assertRaises(RuntimeError):
+                lock.acquire_write()
+        with lock.write():
+            pass
+
+    def test_copy_is_unlocked(self):
+        """Test that pickled and copied locks are new, unlocked locks."""
+        lock = RWLock()
+
+        with lock.write():
+            copies = [pickle.loads(pickle.dumps(lock)), copy.copy(lock), copy.deepcopy(lock)]
+
+        for other in copies:
+            self.assertIsNot(other, lock)
+            self.assertIsNone(other._writer)
+            with other.write():
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
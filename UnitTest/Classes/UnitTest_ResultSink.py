@@ -0,0 +1,163 @@
+import unittest
+import sys
+import csv
+import tempfile
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.resultSink import ResultSink, read_columnar
+
+
+class TestResultSink(unittest.TestCase):
+    """Unit tests for the ResultSink class."""
+
+    def setUp(self):
+        """Create a temporary directory and a column schema."""
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self._directory.name)
+        self.columns = {"step": "int", "bus": "str", "vm_pu": "float"}
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._directory.cleanup()
+
+    def _write_steps(self, sink, steps: int):
+        """Write three bus voltages per step."""
+        for step in range(steps):
+            sink.write_columns({
+                "step": [step] * 3,
+                "bus": ["Bus1", "Bus2", "Bus3"],
+                "vm_pu": [1.0, 0.99, 0.98],
+            })
+
+    def test_csv_round_trip(self):
+        """Test that CSV output has a header and every row."""
+        path = self.directory / "out.csv"
+        with ResultSink(path, self.columns, chunk_rows=4) as sink:
+            self._write_steps(sink, 5)
+
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+
+        self.assertEqual(rows[0], ["step", "bus", "vm_pu"])
+        self.assertEqual(len(rows), 16)
+        self.assertEqual(rows[-1], ["4", "Bus3", "0.98"])
+        self.assertEqual(sink.rows_written, 15)
+
+    def test_columnar_round_trip(self):
+        """Test that the columnar format reads back the same values across chunks."""
+        path = self.directory / "out.col"
+        with ResultSink(path, self.columns, file_format="columnar", chunk_rows=4) as sink:
+            self._write_steps(sink, 5)
+            sink.write_row({"step": 5, "bus": "Bus é", "vm_pu": 1.05})
+
+        data = read_columnar(path)
+
+        self.assertEqual(data["step"], [s for s in range(5) for _ in range(3)] + [5])
+        self.assertEqual(data["bus"][-1], "Bus é")
+        self.assertEqual(data["vm_pu"][:3], [1.0, 0.99, 0.98])
+        self.assertEqual(len(data["vm_pu"]), 16)
+
+    def test_empty_columnar_file(self):
+        """Test that a sink closed without rows produces a readable empty file."""
+        path = self.directory / "empty.col"
+        ResultSink(path, self.columns, file_format="columnar").close()
+
+        self.assertEqual(read_columnar(path), {"step": [], "bus": [], "vm_pu": []})
+
+    def test_flush_writes_partial_chunk(self):
+        """Test that flush writes buffered rows before the chunk is full."""
+        path = self.directory / "out.csv"
+        with ResultSink(path, self.columns, chunk_rows=100) as sink:
+            self._write_steps(sink, 2)
+            self.assertEqual(sink.rows_written, 0)
+            sink.flush()
+            self.assertEqual(sink.rows_written, 6)
+
+    def test_chunks_bounded_by_chunk_rows(self):
+        """Test that rows are handed to the writer in chunks of at most chunk_rows."""
+        path = self.directory / "out.csv"
+        chunk_sizes = []
+        sink = ResultSink(path, self.columns, chunk_rows=4)
+        write_chunk = sink._write_chunk
+        sink._write_chunk = lambda chunk, rows: (chunk_sizes.append(rows), write_chunk(chunk, rows))
+        self._write_steps(sink, 5)
+        sink.close()
+
+        self.assertEqual(chunk_sizes, [4, 4, 4, 3])
+
+    def test_writer_error_is_raised(self):
+        """Test that an error in the writer thread is raised to the producer."""
+        path = self.directory / "out.csv"
+        sink = ResultSink(path, self.columns, chunk_rows=1)
+
+        def failing_write(chunk, rows):
+            raise OSError("disk full")
+
+        sink._write_chunk = failing_write
+        sink.write_row({"step": 0, "bus": "Bus1", "vm_pu": 1.0})
+        with self.assertRaises(OSError):
+            sink.close()
+
+    def test_write_after_close(self):
+        """Test that writing to a closed sink raises RuntimeError."""
+        sink = ResultSink(self.directory / "out.csv", self.columns)
+        sink.close()
+
+        with self.assertRaises(RuntimeError):
+            sink.write_row({"step": 0, "bus": "Bus1", "vm_pu": 1.0})
+
+    def test_column_mismatch(self):
+        """Test that missing columns or unequal lengths raise ValueError."""
+        with ResultSink(self.directory / "out.csv", self.columns) as sink:
+            with self.assertRaises(ValueError):
+                sink.write_row({"step": 0, "bus": "Bus1"})
+            with self.assertRaises(ValueError):
+                sink.write_columns({"step": [0, 1], "bus": ["Bus1"], "vm_pu": [1.0]})
+
+    def test_bad_value_appends_nothing(self):
+        """Test that a value of the wrong kind raises TypeError and leaves the columns aligned."""
+        path = self.directory / "out.col"
+        with ResultSink(path, self.columns, file_format="columnar", chunk_rows=4) as sink:
+            self._write_steps(sink, 1)
+            with self.assertRaises(TypeError):
+                sink.write_row({"step": 1, "bus": "Bus1", "vm_pu": "high"})
+            with self.assertRaises(TypeError):
+                sink.write_columns({"step": [1, 2], "bus": ["Bus1", 2], "vm_pu": [1.0, 1.0]})
+            sink.write_row({"step": 2, "bus": "Bus2", "vm_pu": 1.01})
+
+        data = read_columnar(path)
+
+        self.assertEqual(data["step"], [0, 0, 0, 2])
+        self.assertEqual(data["bus"], ["Bus1", "Bus2", "Bus3", "Bus2"])
+        self.assertEqual(data["vm_pu"][-1], 1.01)
+
+    def test_invalid_configuration(self):
+        """Test that invalid formats, column kinds or sizes raise ValueError."""
+        path = self.directory / "out.bin"
+        with self.assertRaises(ValueError):
+            ResultSink(path, self.columns, file_format="parquet")
+        with self.assertRaises(ValueError):
+            ResultSink(path, {"flag": "bool"})
+        with self.assertRaises(ValueError):
+            ResultSink(path, self.columns, chunk_rows=0)
+
+    def test_read_columnar_rejects_other_files(self):
+        """Test that reading a non-columnar file raises ValueError."""
+        path = self.directory / "out.csv"
+        with ResultSink(path, self.columns) as sink:
+            self._write_steps(sink, 1)
+
+        with self.assertRaises(ValueError):
+            read_columnar(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import sys
+import math
+import random
+import statistics
+
+# Add project root to path for imports using centralized paths
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Paths.paths import PROJECT_ROOT
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Src.Utils.Classes.streamingStats import StreamingStats
+
+
+class TestStreamingStats(unittest.TestCase):
+    """Unit tests for the StreamingStats class."""
+
+    def test_empty_stats(self):
+        """Test that statistics of an empty stream are nan."""
+        stats = StreamingStats(thresholds=(1.0,))
+
+        self.assertEqual(stats.count, 0)
+        self.assertTrue(math.isnan(stats.variance))
+        self.assertTrue(math.isnan(stats.quantile(0.5)))
+        self.assertTrue(math.isnan(stats.exceedance_probability(1.0)))
+        self.assertTrue(math.isnan(stats.summary()["mean"]))
+
+    def test_mean_variance_min_max(self):
+        """Test that moments and extremes match the statistics module."""
+        values = [50.0, 52.5, 47.0, 61.0, 39.5, 55.0]
+        stats = StreamingStats()
+        stats.add_many(values)
+
+        self.assertEqual(stats.count, 6)
+        self.assertAlmostEqual(stats.mean, statistics.mean(values))
+        self.assertAlmostEqual(stats.variance, statistics.variance(values))
+        self.assertAlmostEqual(stats.std, statistics.stdev(values))
+        self.assertEqual(stats.min, 39.5)
+        self.assertEqual(stats.max, 61.0)
+
+    def test_quantiles_with_few_values(self):
+        """Test that quantiles of fewer than five values are interpolated exactly."""
+        stats = StreamingStats(quantiles=(0.5,))
+        stats.add_many([3.0, 1.0, 2.0])
+
+        self.assertEqual(stats.quantile(0.5), 2.0)
+
+    def test_quantile_estimates(self):
+        """Test that P-square quantile estimates are close to the true quantiles."""
+        rng = random.Random(1)
+        stats = StreamingStats(quantiles=(0.05, 0.5, 0.95))
+        for _ in range(20000):
+            stats.add(rng.uniform(0.0, 100.0))
+
+        self.assertAlmostEqual(stats.quantile(0.05), 5.0, delta=1.0)
+        self.assertAlmostEqual(stats.quantile(0.5), 50.0, delta=1.0)
+        self.assertAlmostEqual(stats.quantile(0.95), 95.0, delta=1.0)
+
+    def test_quantile_of_sorted_stream(self):
+        """Test that quantile estimates hold for a monotonically increasing stream."""
+        stats = StreamingStats(quantiles=(0.5,))
+        stats.add_many(float(i) for i in range(1001))
+
+        self.assertAlmostEqual(stats.quantile(0.5), 500.0, delta=5.0)
+
+    def test_exceedance_probability(self):
+        """Test that exceedance counts values strictly above the threshold."""
+        stats = StreamingStats(thresholds=(2.0,))
+        stats.add_many([1.0, 2.0, 3.0, 4.0])
+
+        self.assertEqual(stats.exceedance_probability(2.0), 0.5)
+
+    def test_untracked_quantile_or_threshold(self):
+        """Test that asking for statistics not requested up front raises ValueError."""
+        stats = StreamingStats(quantiles=(0.5,), thresholds=(1.0,))
+
+        with self.assertRaises(ValueError):
+            stats.quantile(0.9)
+        with self.assertRaises(ValueError):
+            stats.exceedance_probability(2.0)
+
+    def test_invalid_quantile(self):
+        """Test that quantile probabilities outside (0, 1) raise ValueError."""
+        with self.assertRaises(ValueError):
+            StreamingStats(quantiles=(0.0,))
+        with self.assertRaises(ValueError):
+            StreamingStats(quantiles=(1.5,))
+
+    def test_summary(self):
+        """Test that the summary contains every statistic."""
+        stats = StreamingStats(quantiles=(0.5,), thresholds=(10.0,))
+        stats.add_many([5.0, 15.0])
+
+        summary = stats.summary()
+        self.assertEqual(summary["count"], 2)
+        self.assertEqual(summary["mean"], 10.0)
+        self.assertEqual(summary["quantiles"], {0.5: 10.0})
+        self.assertEqual(summary["exceedance"], {10.0: 0.5})
+
+
+if __name__ == '__main__':
+    unittest.main()
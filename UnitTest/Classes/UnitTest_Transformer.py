@@ -130,6 +130,114 @@ class TestTransformer(unittest.TestCase):
         self.assertEqual(t1.r, 0.02)
         self.assertEqual(t1.x, 0.20)
 
+    def test_transformer_mva_rating(self):
+        """Test that the thermal rating is unlimited by default and stored when given."""
+        t1 = Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10)
+        t2 = Transformer("T2", "Bus 2", "Bus 3", 0.02, 0.15, mva_rating=150.0)
+
+        self.assertEqual(t1.mva_rating, float("inf"))
+        self.assertEqual(t2.mva_rating, 150.0)
+        self.assertIn("150.0", repr(t2))
+
+    def test_transformer_default_tap_and_shift(self):
+        """Test that transformers are nominal-ratio, non-phase-shifting and uncontrolled by default."""
+        t1 = Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10)
+
+        self.assertEqual(t1.tap_ratio, 1.0)
+        self.assertEqual(t1.phase_shift_deg, 0.0)
+        self.assertIsNone(t1.regulated_bus_name)
+        self.assertEqual(t1.propose_tap(0.9, -1.0), 1.0)
+
+    def test_transformer_off_nominal_tap_and_shift(self):
+        """Test that tap ratio and phase shift are stored and shown in repr."""
+        t1 = Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10, tap_ratio=1.025, phase_shift_deg=-30.0)
+
+        self.assertEqual(t1.tap_ratio, 1.025)
+        self.assertEqual(t1.phase_shift_deg, -30.0)
+        self.assertIn("1.025", repr(t1))
+        self.assertIn("-30.0", repr(t1))
+
+    def test_transformer_invalid_tap_ratio(self):
+        """Test that a non-positive tap ratio raises ValueError."""
+        with self.assertRaises(ValueError):
+            Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10, tap_ratio=0.0)
+
+    def test_enable_tap_control(self):
+        """Test that enabling tap control stores the LTC settings."""
+        t1 = Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10)
+        t1.enable_tap_control("Bus 2", 1.02, voltage_deadband=0.005, tap_min=0.95, tap_max=1.05, tap_step=0.01)
+
+        self.assertEqual(t1.regulated_bus_name, "Bus 2")
+        self.assertEqual(t1.voltage_target, 1.02)
+        self.assertEqual(t1.voltage_deadband, 0.005)
+        self.assertEqual((t1.tap_min, t1.tap_max, t1.tap_step), (0.95, 1.05, 0.01))
+
+        t1.disable_tap_control()
+        self.assertIsNone(t1.regulated_bus_name)
+
+    def test_enable_tap_control_invalid(self):
+        """Test that invalid LTC settings raise ValueError."""
+        t1 = Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10)
+
+        with self.assertRaises(ValueError):
+            t1.enable_tap_control("Bus 2", 1.0, tap_min=1.1, tap_max=0.9)
+        with self.assertRaises(ValueError):
+            t1.enable_tap_control("Bus 2", 1.0, tap_step=0.0)
+        with self.assertRaises(ValueError):
+            t1.enable_tap_control("Bus 2", 1.0, voltage_deadband=-0.01)
+
+    def test_validate_tap_control(self):
+        """Test that validate() checks the tap settings only while tap control is enabled."""
+        t1 = Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10)
+        t1.tap_step = 0.0
+        t1.validate()
+
+        t1.enable_tap_control("Bus 2", 1.0)
+        t1.tap_min = 1.2
+        with self.assertRaises(ValueError):
+            t1.validate()
+
+    def test_propose_tap_within_deadband(self):
+        """Test that the tap does not move while the voltage is within the deadband."""
+        t1 = Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10)
+        t1.enable_tap_control("Bus 2", 1.0, voltage_deadband=0.01)
+
+        self.assertEqual(t1.propose_tap(1.008, -1.0), 1.0)
+        self.assertEqual(t1.propose_tap(0.992, -1.0), 1.0)
+
+    def test_propose_tap_sensitivity_step(self):
+        """Test that the sensitivity-based update lands on a whole tap position."""
+        t1 = Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10)
+        t1.enable_tap_control("Bus 2", 1.0, voltage_deadband=0.005, tap_step=0.00625)
+
+        # 0.03 p.u. low with dV/dtap = -1.0 needs the tap lowered by 0.03, i.e. about 5 positions
+        self.assertAlmostEqual(t1.propose_tap(0.97, -1.0), 0.96875)
+        # 0.02 p.u. high with dV/dtap = -0.5 needs the tap raised by 0.04
+        self.assertAlmostEqual(t1.propose_tap(1.02, -0.5), 1.0375)
+
+    def test_propose_tap_limits(self):
+        """Test that the proposed tap is limited to the tap range."""
+        t1 = Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10)
+        t1.enable_tap_control("Bus 2", 1.0, tap_min=0.95, tap_max=1.05)
+
+        self.assertAlmostEqual(t1.propose_tap(0.8, -1.0), 0.95)
+        self.assertAlmostEqual(t1.propose_tap(1.2, -1.0), 1.05)
+
+    def test_propose_tap_zero_sensitivity(self):
+        """Test that a zero sensitivity raises ValueError."""
+        t1 = Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10)
+        t1.enable_tap_control("Bus 2", 1.0)
+
+        with self.assertRaises(ValueError):
+            t1.propose_tap(0.9, 0.0)
+
+    def test_transformer_invalid_mva_rating(self):
+        """Test that a non-positive thermal rating raises ValueError."""
+        with self.assertRaises(ValueError) as context:
+            Transformer("T1", "Bus 1", "Bus 2", 0.01, 0.10, mva_rating=0.0)
+
+        self.assertIn("T1", str(context.exception))
+
 
 class TestTransformerWithBus(unittest.TestCase):
     """Integration tests for Transformer class with Bus class."""
@@ -130,6 +130,22 @@ class TestTransmissionLine(unittest.TestCase):
         self.assertIsInstance(line1.g, float)
         self.assertIsInstance(line1.b, float)
 
+    def test_transmission_line_mva_rating(self):
+        """Test that the thermal rating is unlimited by default and stored when given."""
+        line1 = TransmissionLine("Line 1", "Bus 1", "Bus 2", 0.02, 0.25, 0.0, 0.04)
+        line2 = TransmissionLine("Line 2", "Bus 2", "Bus 3", 0.03, 0.30, 0.0, 0.05, mva_rating=200.0)
+
+        self.assertEqual(line1.mva_rating, float("inf"))
+        self.assertEqual(line2.mva_rating, 200.0)
+        self.assertIn("200.0", repr(line2))
+
+    def test_transmission_line_invalid_mva_rating(self):
+        """Test that a non-positive thermal rating raises ValueError."""
+        with self.assertRaises(ValueError) as context:
+            TransmissionLine("Line 1", "Bus 1", "Bus 2", 0.02, 0.25, 0.0, 0.04, mva_rating=-10.0)
+
+        self.assertIn("Line 1", str(context.exception))
+
 
 class TestTransmissionLineWithBus(unittest.TestCase):
     """Integration tests for TransmissionLine class with Bus class."""